@@ -3,7 +3,6 @@ from __future__ import annotations
 import asyncio
 import logging
 import logging.config
-import re
 import sys
 
 from asyncio import (
@@ -38,7 +37,6 @@ from typing import (
     cast,
     overload,
 )
-from urllib.parse import urlencode, urlunparse
 
 from sanic_routing.exceptions import FinalizationError, NotFound
 from sanic_routing.route import Route
@@ -51,15 +49,22 @@ from sanic.blueprint_group import BlueprintGroup
 from sanic.blueprints import Blueprint
 from sanic.compat import OS_IS_WINDOWS, enable_windows_color_support
 from sanic.config import SANIC_PREFIX, Config
+from sanic.errorpages import ErrorPageCache
 from sanic.exceptions import (
     BadRequest,
+    MethodNotAllowed,
     SanicException,
     ServerError,
     URLBuildError,
 )
-from sanic.handlers import ErrorHandler
+from sanic.exceptions import NotFound as SanicNotFound
+from sanic.handlers import ErrorHandler, StaticCache
+from sanic.headers import HeaderBlock
 from sanic.helpers import Default, _default
 from sanic.http import Stage
+from sanic.http.compression import ResponseCompression
+from sanic.http.http3 import SessionTicketStore
+from sanic.http.tls.tickets import SessionTickets
 from sanic.log import LOGGING_CONFIG_DEFAULTS, error_logger, logger
 from sanic.logging.deprecation import deprecation
 from sanic.logging.setup import setup_logging
@@ -81,8 +86,11 @@ from sanic.models.handler_types import ListenerType, MiddlewareType
 from sanic.models.handler_types import Sanic as SanicVar
 from sanic.request import Request
 from sanic.response import BaseHTTPResponse, HTTPResponse, ResponseStream
-from sanic.router import Router
-from sanic.server.websockets.impl import ConnectionClosed
+from sanic.router import Router, URLBuilder
+from sanic.server.websockets.impl import (
+    ConnectionClosed,
+    WebsocketImplProtocol,
+)
 from sanic.signals import Event, Signal, SignalRouter
 from sanic.touchup import TouchUp, TouchUpMeta
 from sanic.types.shared_ctx import SharedContext
@@ -198,12 +206,15 @@ class Sanic(
         "_test_manager",
         "blueprints",
         "certloader_class",
+        "compression",
         "config",
         "configure_logging",
         "ctx",
         "error_handler",
+        "error_pages",
         "inspector_class",
         "go_fast",
+        "header_block",
         "listeners",
         "multiplexer",
         "named_request_middleware",
@@ -213,10 +224,14 @@ class Sanic(
         "request_middleware",
         "response_middleware",
         "router",
+        "session_tickets",
         "shared_ctx",
         "signal_router",
         "sock",
+        "static_cache",
         "strict_slashes",
+        "ticket_store",
+        "websocket_connections",
         "websocket_enabled",
         "websocket_tasks",
     )
@@ -365,9 +380,12 @@ class Sanic(
         self.certloader_class: type[CertLoader] = (
             certloader_class or CertLoader
         )
+        self.compression: ResponseCompression | None = None
+        self.header_block = HeaderBlock({})
         self.configure_logging: bool = configure_logging
         self.ctx: ctx_type = cast(ctx_type, ctx or SimpleNamespace())
         self.error_handler: ErrorHandler = error_handler or ErrorHandler()
+        self.error_pages: ErrorPageCache | None = None
         self.inspector_class: type[Inspector] = inspector_class or Inspector
         self.listeners: dict[str, list[ListenerType[Any]]] = defaultdict(list)
         self.named_request_middleware: dict[str, deque[Middleware]] = {}
@@ -377,10 +395,14 @@ class Sanic(
         self.request_middleware: deque[Middleware] = deque()
         self.response_middleware: deque[Middleware] = deque()
         self.router: Router = router or Router()
+        self.session_tickets: SessionTickets | None = None
         self.shared_ctx: SharedContext = SharedContext()
         self.signal_router: SignalRouter = signal_router or SignalRouter()
         self.sock: socket | None = None
+        self.static_cache: StaticCache | None = None
         self.strict_slashes: bool = strict_slashes
+        self.ticket_store: SessionTicketStore | None = None
+        self.websocket_connections: set[WebsocketImplProtocol] = set()
         self.websocket_enabled: bool = False
         self.websocket_tasks: set[Future[Any]] = set()
 
@@ -1009,125 +1031,11 @@ class Sanic(
                 f"Endpoint with name `{view_name}` was not found"
             )
 
-        uri = route.path
-
-        if getattr(route.extra, "static", None):
-            filename = kwargs.pop("filename", "")
-            # it's static folder
-            if "__file_uri__" in uri:
-                folder_ = uri.split("<__file_uri__:", 1)[0]
-                if folder_.endswith("/"):
-                    folder_ = folder_[:-1]
-
-                if filename.startswith("/"):
-                    filename = filename[1:]
-
-                kwargs["__file_uri__"] = filename
-
-        if (
-            uri != "/"
-            and uri.endswith("/")
-            and not route.strict
-            and not route.raw_path[:-1]
-        ):
-            uri = uri[:-1]
-
-        if not uri.startswith("/"):
-            uri = f"/{uri}"
-
-        out = uri
-
-        # _method is only a placeholder now, don't know how to support it
-        kwargs.pop("_method", None)
-        anchor = kwargs.pop("_anchor", "")
-        # _external need SERVER_NAME in config or pass _server arg
-        host = kwargs.pop("_host", None)
-        external = kwargs.pop("_external", False) or bool(host)
-        scheme = kwargs.pop("_scheme", "")
-        if route.extra.hosts and external:
-            if not host and len(route.extra.hosts) > 1:
-                raise ValueError(
-                    f"Host is ambiguous: {', '.join(route.extra.hosts)}"
-                )
-            elif host and host not in route.extra.hosts:
-                raise ValueError(
-                    f"Requested host ({host}) is not available for this "
-                    f"route: {route.extra.hosts}"
-                )
-            elif not host:
-                host = list(route.extra.hosts)[0]
-
-        if scheme and not external:
-            raise ValueError("When specifying _scheme, _external must be True")
-
-        netloc = kwargs.pop("_server", None)
-        if netloc is None and external:
-            netloc = host or self.config.get("SERVER_NAME", "")
-
-        if external:
-            if not scheme:
-                if ":" in netloc[:8]:
-                    scheme = netloc[:8].split(":", 1)[0]
-                else:
-                    scheme = "http"
-                # Replace http/https with ws/wss for WebSocket handlers
-                if route.extra.websocket:
-                    scheme = scheme.replace("http", "ws")
-
-            if "://" in netloc[:8]:
-                netloc = netloc.split("://", 1)[-1]
-
-        # find all the parameters we will need to build in the URL
-        # matched_params = re.findall(self.router.parameter_pattern, uri)
-        route.finalize()
-        for param_info in route.params.values():
-            # name, _type, pattern = self.router.parse_parameter_string(match)
-            # we only want to match against each individual parameter
-
-            try:
-                supplied_param = str(kwargs.pop(param_info.name))
-            except KeyError:
-                raise URLBuildError(
-                    f"Required parameter `{param_info.name}` was not "
-                    "passed to url_for"
-                )
-
-            # determine if the parameter supplied by the caller
-            # passes the test in the URL
-            if param_info.pattern:
-                pattern = (
-                    param_info.pattern[1]
-                    if isinstance(param_info.pattern, tuple)
-                    else param_info.pattern
-                )
-                passes_pattern = pattern.match(supplied_param)
-                if not passes_pattern:
-                    if param_info.cast is not str:
-                        msg = (
-                            f'Value "{supplied_param}" '
-                            f"for parameter `{param_info.name}` does "
-                            "not match pattern for type "
-                            f"`{param_info.cast.__name__}`: "
-                            f"{pattern.pattern}"
-                        )
-                    else:
-                        msg = (
-                            f'Value "{supplied_param}" for parameter '
-                            f"`{param_info.name}` does not satisfy "
-                            f"pattern {pattern.pattern}"
-                        )
-                    raise URLBuildError(msg)
-
-            # replace the parameter in the URL with the supplied value
-            replacement_regex = f"(<{param_info.name}.*?>)"
-            out = re.sub(replacement_regex, supplied_param, out)
-
-        # parse the remainder of the keyword arguments into a querystring
-        query_string = urlencode(kwargs, doseq=True) if kwargs else ""
-        # scheme://netloc/path;parameters?query#fragment
-        out = urlunparse((scheme, netloc, out, "", query_string, anchor))
-
-        return out
+        builder = getattr(route.extra, "url_builder", None)
+        if builder is None:
+            route.finalize()
+            builder = route.extra.url_builder = URLBuilder(route)
+        return builder.build(kwargs, self.config.get("SERVER_NAME", ""))
 
     # -------------------------------------------------------------------- #
     # Request Handling
@@ -1311,14 +1219,24 @@ class Sanic(
                 context={"request": request},
             )
             # Fetch handler from router
-            route, handler, kwargs = self.router.get(
-                request.path,
-                request.method,
-                request.headers.getone("host", None),
-            )
+            host = request.headers.getone("host", None)
+            if self.error_pages is None:
+                route, handler, kwargs = self.router.get(
+                    request.path, request.method, host
+                )
+            else:
+                result = self.router.find(request.path, request.method, host)
+                if isinstance(result, SanicException):
+                    # Respond to routing errors without raising them
+                    response = self.error_pages.response(request, result)
+                    response = await request.respond(response)
+                    await response.send(end_stream=True)
+                    return
+                route, handler, kwargs = result
 
             request._match_info = {**kwargs}
             request.route = route
+            extra = route.extra
 
             await self.dispatch(
                 "http.routing.after",
@@ -1334,9 +1252,9 @@ class Sanic(
             if (
                 request.stream
                 and request.stream.request_body
-                and not route.extra.ignore_body
+                and not extra.ignore_body
             ):
-                if hasattr(handler, "is_stream"):
+                if extra.is_stream:
                     # Streaming handler: lift the size limit
                     request.stream.request_max_size = float("inf")
                 else:
@@ -1347,9 +1265,9 @@ class Sanic(
             # Request Middleware
             # -------------------------------------------- #
             run_middleware = False
-            if request.route.extra.request_middleware:
+            if extra.request_middleware:
                 response = await self._run_request_middleware(
-                    request, request.route.extra.request_middleware
+                    request, extra.request_middleware
                 )
 
             # No middleware results
@@ -1370,9 +1288,12 @@ class Sanic(
                     inline=True,
                     context={"request": request},
                 )
-                response = handler(request, **request.match_info)
-                if isawaitable(response):
-                    response = await response
+                if extra.is_coroutine:
+                    response = await handler(request, **request.match_info)
+                else:
+                    response = handler(request, **request.match_info)
+                    if isawaitable(response):
+                        response = await response
                 await self.dispatch(
                     "http.handler.after",
                     inline=True,
@@ -1390,7 +1311,7 @@ class Sanic(
                     response = request.stream.response
             elif response is not None:
                 response = await request.respond(response)  # type: ignore
-            elif not hasattr(handler, "is_websocket"):
+            elif not extra.is_websocket:
                 response = request.stream.response  # type: ignore
 
             # Marked for cleanup and DRY with handle_request/handle_exception
@@ -1418,7 +1339,7 @@ class Sanic(
                 )
                 await response.eof()
             else:
-                if not hasattr(handler, "is_websocket"):
+                if not extra.is_websocket:
                     raise ServerError(
                         f"Invalid response type {response!r} "
                         "(need HTTPResponse)"
@@ -1431,6 +1352,9 @@ class Sanic(
             await self.handle_exception(
                 request, e, run_middleware=run_middleware
             )
+        finally:
+            if request._form_streamed:
+                request._close_files()
 
     async def _websocket_handler(
         self, handler, request, *args, subprotocols=None, **kwargs
@@ -1545,9 +1469,12 @@ class Sanic(
                 condition={"attach_to": "request"},
             )
 
-            response = middleware(request)
-            if isawaitable(response):
-                response = await response
+            if getattr(middleware, "is_coroutine", False):
+                response = await middleware.func(request)
+            else:
+                response = middleware(request)
+                if isawaitable(response):
+                    response = await response
 
             await self.dispatch(
                 "http.middleware.after",
@@ -1577,9 +1504,12 @@ class Sanic(
                 condition={"attach_to": "response"},
             )
 
-            _response = middleware(request, response)
-            if isawaitable(_response):
-                _response = await _response
+            if getattr(middleware, "is_coroutine", False):
+                _response = await middleware.func(request, response)
+            else:
+                _response = middleware(request, response)
+                if isawaitable(_response):
+                    _response = await _response
 
             await self.dispatch(
                 "http.middleware.after",
@@ -2294,11 +2224,11 @@ class Sanic(
         added to the application. If the application is not in test mode,
         any finalization errors will be raised.
 
-        Finalization consists of identifying defined routes and optimizing
-        Sanic's performance to meet the application's specific needs. If
-        you are manually adding routes, after Sanic has started, you will
-        typically want to use the  `amend` context manager rather than
-        calling this method directly.
+        Finalization consists of identifying defined routes, encoding the
+        headers of `RESPONSE_HEADERS`, and optimizing Sanic's performance to
+        meet the application's specific needs. If you are manually adding
+        routes, after Sanic has started, you will typically want to use the
+        `amend` context manager rather than calling this method directly.
 
         .. note::
             This method is usually called internally during the server setup
@@ -2307,6 +2237,7 @@ class Sanic(
         Raises:
             FinalizationError: If there is an error during the finalization
                 process, and the application is not in test mode.
+            SanicException: If `RESPONSE_HEADERS` has an invalid header.
 
         Example:
             ```python
@@ -2319,6 +2250,7 @@ class Sanic(
             if not Sanic.test_mode:
                 raise e
         self.finalize_middleware()
+        self.header_block = HeaderBlock(self.config.RESPONSE_HEADERS)
 
     def signalize(self, allow_fail_builtin: bool = True) -> None:
         """Finalize the signal handling configuration for the Sanic application.
@@ -2366,14 +2298,33 @@ class Sanic(
         if hasattr(self, "_ext"):
             self.ext._display()
 
-        if self.state.is_debug and self.config.TOUCHUP is not True:
-            self.config.TOUCHUP = False
-        elif isinstance(self.config.TOUCHUP, Default):
-            self.config.TOUCHUP = True
+        self._resolve_touchup()
 
-        # Setup routers
+        # Setup routers. Signals are bound to the loop of the worker, but the
+        # HTTP router is already finalized if the app was preloaded.
         self.signalize(self.config.TOUCHUP)
-        self.finalize()
+        if not self.state.preloaded:
+            self.finalize()
+
+        self.static_cache = (
+            StaticCache(
+                self.config.STATIC_CACHE_SIZE,
+                self.config.STATIC_CACHE_MAX_FILE,
+                self.config.STATIC_CACHE_TTL,
+            )
+            if self.config.STATIC_CACHE_SIZE > 0
+            else None
+        )
+        self.compression = (
+            ResponseCompression(
+                self.config.COMPRESSION_CODINGS,
+                self.config.COMPRESSION_MIN_SIZE,
+                self.config.COMPRESSION_TYPES,
+            )
+            if self.config.COMPRESSION
+            else None
+        )
+        self.error_pages = self._make_error_pages()
 
         route_names = [route.extra.ident for route in self.router.routes]
         duplicates = {
@@ -2393,7 +2344,7 @@ class Sanic(
         Sanic._check_uvloop_conflict()
 
         # Startup time optimizations
-        if self.state.primary:
+        if self.state.primary and not self.state.preloaded:
             # TODO:
             # - Raise warning if secondary apps have error handler config
             if self.config.TOUCHUP:
@@ -2401,6 +2352,53 @@ class Sanic(
 
         self.state.is_started = True
 
+    def _make_error_pages(self) -> ErrorPageCache | None:
+        """Create the cache of routing error pages, if it can be used.
+
+        The cached pages skip `handle_exception`, so they are only used if
+        it would not do anything else than render the default error page.
+        """
+        handler = self.error_handler
+        if (
+            not self.config.FAST_ROUTING_ERRORS
+            or self.debug
+            or self.config.NOISY_EXCEPTIONS
+            or self.request_middleware
+            or self.response_middleware
+            or type(handler).response is not ErrorHandler.response
+            or type(handler).default is not ErrorHandler.default
+            or handler.lookup(SanicNotFound())
+            or handler.lookup(MethodNotAllowed())
+        ):
+            return None
+        events = {signal.name for signal in self.signal_router.routes}
+        if events & {
+            Event.HTTP_LIFECYCLE_EXCEPTION.value,
+            Event.HTTP_LIFECYCLE_RESPONSE.value,
+            Event.SERVER_EXCEPTION_REPORT.value,
+        }:
+            return None
+        return ErrorPageCache(handler.base, self.config.FALLBACK_ERROR_FORMAT)
+
+    def _resolve_touchup(self) -> None:
+        if self.state.is_debug and self.config.TOUCHUP is not True:
+            self.config.TOUCHUP = False
+        elif isinstance(self.config.TOUCHUP, Default):
+            self.config.TOUCHUP = True
+
+    def _preload(self) -> None:
+        """Finalize the application in the main process before forking.
+
+        The router, middleware and TouchUp are built once, and inherited by
+        every worker that is forked afterwards, instead of being built again
+        in each of them.
+        """
+        self._resolve_touchup()
+        self.finalize()
+        if self.state.primary and self.config.TOUCHUP:
+            TouchUp.run(self)
+        self.state.preloaded = True
+
     def ack(self) -> None:
         """Shorthand to send an ack message to the Server Manager.
 
@@ -53,6 +53,7 @@ class ApplicationState:
     verbosity: int = field(default=0)
     workers: int = field(default=0)
     primary: bool = field(default=True)
+    preloaded: bool = field(default=False)
     server_info: list[ApplicationServerInfo] = field(default_factory=list)
 
     # This property relates to the ApplicationState instance and should
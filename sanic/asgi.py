@@ -228,11 +228,13 @@ class ASGIApp:
                 )
             return
         if self.response and self.stage is Stage.HANDLER:
+            processed = self.response.processed_headers
+            block = self.sanic_app.header_block.exclude(self.response.headers)
             await self.transport.send(
                 {
                     "type": "http.response.start",
                     "status": self.response.status,
-                    "headers": self.response.processed_headers,
+                    "headers": [*block.items, *processed],
                 }
             )
             response_body = getattr(self.response, "body", None)
@@ -33,8 +33,17 @@ DEFAULT_CONFIG = {
     "ACCESS_LOG": False,
     "AUTO_EXTEND": True,
     "AUTO_RELOAD": False,
+    "AUTO_RELOAD_WATCHER": "auto",
+    "COMPRESSION": False,
+    "COMPRESSION_CODINGS": "br, zstd, gzip",
+    "COMPRESSION_MIN_SIZE": 1024,
+    "COMPRESSION_TYPES": (
+        "text/, application/json, application/javascript, application/xml, "
+        "image/svg+xml, +json, +xml"
+    ),
     "EVENT_AUTOREGISTER": False,
     "DEPRECATION_FILTER": "once",
+    "FAST_ROUTING_ERRORS": False,
     "FORWARDED_FOR_HEADER": "X-Forwarded-For",
     "FORWARDED_SECRET": None,
     "GRACEFUL_SHUTDOWN_TIMEOUT": 15.0,
@@ -45,6 +54,7 @@ DEFAULT_CONFIG = {
     "INSPECTOR_TLS_KEY": _default,
     "INSPECTOR_TLS_CERT": _default,
     "INSPECTOR_API_KEY": "",
+    "INSPECTOR_METRICS_INTERVAL": 5.0,
     "KEEP_ALIVE_TIMEOUT": 120,
     "KEEP_ALIVE": True,
     "LOCAL_CERT_CREATOR": LocalCertCreator.AUTO,
@@ -54,19 +64,38 @@ DEFAULT_CONFIG = {
     "LOG_EXTRA": _default,
     "MOTD": True,
     "MOTD_DISPLAY": {},
+    "MULTIPART_SPOOL_SIZE": None,
     "NO_COLOR": False,
     "NOISY_EXCEPTIONS": False,
+    "PRELOAD_APP": False,
+    "PROTOCOL_TRACE_SAMPLE": 0,
     "PROXIES_COUNT": None,
     "REAL_IP_HEADER": None,
     "REQUEST_BUFFER_SIZE": 65536,
+    "REQUEST_HEAD_PARSER": "python",
     "REQUEST_MAX_HEADER_SIZE": 8192,  # Cannot exceed 16384
     "REQUEST_ID_HEADER": "X-Request-ID",
     "REQUEST_MAX_SIZE": 100_000_000,
     "REQUEST_TIMEOUT": 60,
+    "RESPONSE_HEADERS": {},
     "RESPONSE_TIMEOUT": 60,
+    "ROUTER_CACHE_SIZE": 1024,
+    "STATIC_CACHE_MAX_FILE": 1_048_576,
+    "STATIC_CACHE_SIZE": 0,
+    "STATIC_CACHE_TTL": 1.0,
     "TLS_CERT_PASSWORD": "",
+    "TLS_SESSION_TICKET_DIRECTORY": None,
+    "TLS_SESSION_TICKET_LIFETIME": 3600,
+    "TLS_SESSION_TICKET_STORE_SIZE": 10_000,
+    "TLS_SESSION_TICKETS_SHARED": False,
     "TOUCHUP": _default,
     "USE_UVLOOP": _default,
+    "WEBSOCKET_DEFLATE": False,
+    "WEBSOCKET_DEFLATE_MEMORY_LEVEL": 5,
+    "WEBSOCKET_DEFLATE_NO_CONTEXT_TAKEOVER": False,
+    "WEBSOCKET_DEFLATE_THRESHOLD": 128,
+    "WEBSOCKET_DEFLATE_WINDOW_BITS": 12,
+    "WEBSOCKET_MAX_QUEUE": 16,
     "WEBSOCKET_MAX_SIZE": 2**20,  # 1 MiB
     "WEBSOCKET_PING_INTERVAL": 20,
     "WEBSOCKET_PING_TIMEOUT": 20,
@@ -138,8 +167,14 @@ class Config(dict, metaclass=DescriptorMeta):
     ACCESS_LOG: bool
     AUTO_EXTEND: bool
     AUTO_RELOAD: bool
+    AUTO_RELOAD_WATCHER: str
+    COMPRESSION: bool
+    COMPRESSION_CODINGS: str | Sequence[str]
+    COMPRESSION_MIN_SIZE: int
+    COMPRESSION_TYPES: str | Sequence[str]
     EVENT_AUTOREGISTER: bool
     DEPRECATION_FILTER: FilterWarningType
+    FAST_ROUTING_ERRORS: bool
     FORWARDED_FOR_HEADER: str
     FORWARDED_SECRET: str | None
     GRACEFUL_SHUTDOWN_TIMEOUT: float
@@ -150,6 +185,7 @@ class Config(dict, metaclass=DescriptorMeta):
     INSPECTOR_TLS_KEY: Path | str | Default
     INSPECTOR_TLS_CERT: Path | str | Default
     INSPECTOR_API_KEY: str
+    INSPECTOR_METRICS_INTERVAL: float
     KEEP_ALIVE_TIMEOUT: int
     KEEP_ALIVE: bool
     LOCAL_CERT_CREATOR: str | LocalCertCreator
@@ -159,20 +195,39 @@ class Config(dict, metaclass=DescriptorMeta):
     LOG_EXTRA: Default | bool
     MOTD: bool
     MOTD_DISPLAY: dict[str, str]
+    MULTIPART_SPOOL_SIZE: int | None
     NO_COLOR: bool
     NOISY_EXCEPTIONS: bool
+    PRELOAD_APP: bool
+    PROTOCOL_TRACE_SAMPLE: int
     PROXIES_COUNT: int | None
     REAL_IP_HEADER: str | None
     REQUEST_BUFFER_SIZE: int
+    REQUEST_HEAD_PARSER: str
     REQUEST_MAX_HEADER_SIZE: int
     REQUEST_ID_HEADER: str
     REQUEST_MAX_SIZE: int
     REQUEST_TIMEOUT: int
+    RESPONSE_HEADERS: dict[str, Any]
     RESPONSE_TIMEOUT: int
+    ROUTER_CACHE_SIZE: int
+    STATIC_CACHE_MAX_FILE: int
+    STATIC_CACHE_SIZE: int
+    STATIC_CACHE_TTL: float
     SERVER_NAME: str
     TLS_CERT_PASSWORD: str
+    TLS_SESSION_TICKET_DIRECTORY: str | None
+    TLS_SESSION_TICKET_LIFETIME: int
+    TLS_SESSION_TICKET_STORE_SIZE: int
+    TLS_SESSION_TICKETS_SHARED: bool
     TOUCHUP: Default | bool
     USE_UVLOOP: Default | bool
+    WEBSOCKET_DEFLATE: bool
+    WEBSOCKET_DEFLATE_MEMORY_LEVEL: int
+    WEBSOCKET_DEFLATE_NO_CONTEXT_TAKEOVER: bool
+    WEBSOCKET_DEFLATE_THRESHOLD: int
+    WEBSOCKET_DEFLATE_WINDOW_BITS: int
+    WEBSOCKET_MAX_QUEUE: int
     WEBSOCKET_MAX_SIZE: int
     WEBSOCKET_PING_INTERVAL: int
     WEBSOCKET_PING_TIMEOUT: int
@@ -206,6 +261,7 @@ class Config(dict, metaclass=DescriptorMeta):
             self.load_environment_vars(SANIC_PREFIX)
 
         self._configure_header_size()
+        self._configure_head_parser()
         self._check_error_format()
         self._init = True
 
@@ -276,6 +332,8 @@ class Config(dict, metaclass=DescriptorMeta):
                 "REQUEST_MAX_SIZE",
             ):
                 self._configure_header_size()
+            elif attr == "REQUEST_HEAD_PARSER":
+                self._configure_head_parser()
 
         if attr == "LOCAL_CERT_CREATOR" and not isinstance(
             self.LOCAL_CERT_CREATOR, LocalCertCreator
@@ -312,6 +370,9 @@ class Config(dict, metaclass=DescriptorMeta):
             self.REQUEST_MAX_SIZE,
         )
 
+    def _configure_head_parser(self):
+        Http.set_head_parser(self.REQUEST_HEAD_PARSER)
+
     def _configure_warnings(self):
         filterwarnings(
             self.DEPRECATION_FILTER,
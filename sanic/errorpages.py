@@ -25,7 +25,7 @@ from sanic.exceptions import BadRequest, SanicException
 from sanic.helpers import STATUS_CODES
 from sanic.log import deprecation, logger
 from sanic.pages.error import ErrorPage
-from sanic.response import html, json, text
+from sanic.response import HTTPResponse, html, json, text
 
 
 dumps: t.Callable[..., str]
@@ -37,7 +37,7 @@ except ImportError:  # noqa
     from json import dumps
 
 if t.TYPE_CHECKING:
-    from sanic import HTTPResponse, Request
+    from sanic import Request
 
 DEFAULT_FORMAT = "auto"
 FALLBACK_TEXT = """\
@@ -403,3 +403,71 @@ def guess_mime(req: Request, fallback: str) -> str:
             repr(req.accept),
         )
     return m.mime
+
+
+class ErrorPageCache:
+    """Pre-rendered error pages of the requests that match no route.
+
+    The page of a `NotFound` or a `MethodNotAllowed` raised by the router
+    only depends on its status, its headers and the format that the
+    client accepts, so it is rendered once for each of them. The message
+    is the reason phrase of the status, not the one of the exception, so
+    that the page does not depend on the path.
+
+    Args:
+        base (Type[BaseRenderer]): The renderer used if no format matches.
+        fallback (str): The `FALLBACK_ERROR_FORMAT`.
+    """
+
+    __slots__ = ("base", "fallback", "hits", "pages")
+
+    def __init__(self, base: t.Type[BaseRenderer], fallback: str) -> None:
+        self.base = base
+        self.fallback = fallback
+        self.hits = 0
+        self.pages: t.Dict[
+            t.Tuple[t.Type[SanicException], str, t.Tuple[t.Any, ...]],
+            t.Tuple[bytes, int, t.Dict[str, t.Any], str],
+        ] = {}
+
+    def response(
+        self, request: Request, exception: SanicException
+    ) -> HTTPResponse:
+        """Create the response to a routing error.
+
+        Args:
+            request (Request): The request that matched no route.
+            exception (SanicException): The error of the router.
+
+        Returns:
+            HTTPResponse: A new response with the cached page.
+        """
+        mime = guess_mime(request, self.fallback)
+        cls = type(exception)
+        key = (cls, mime, tuple(exception.headers.items()))
+        page = self.pages.get(key)
+        if page is None:
+            renderer = RENDERERS_BY_CONTENT_TYPE.get(mime, self.base)
+            rendered = renderer(
+                request, cls(headers=exception.headers), False
+            ).render()
+            page = self.pages[key] = (
+                rendered.body or b"",
+                rendered.status,
+                dict(rendered.headers),
+                rendered.content_type or "",
+            )
+        else:
+            self.hits += 1
+        body, status, headers, content_type = page
+        return HTTPResponse(
+            body, status=status, headers=headers, content_type=content_type
+        )
+
+    def info(self) -> t.Dict[str, int]:
+        """Return the number of cached pages and of responses served from them.
+
+        Returns:
+            Dict[str, int]: The cache statistics.
+        """
+        return {"size": len(self.pages), "hits": self.hits}
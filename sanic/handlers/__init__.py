@@ -1,10 +1,12 @@
 from .content_range import ContentRangeHandler
 from .directory import DirectoryHandler
 from .error import ErrorHandler
+from .static_cache import StaticCache
 
 
 __all__ = (
     "ContentRangeHandler",
     "DirectoryHandler",
     "ErrorHandler",
+    "StaticCache",
 )
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from email.utils import formatdate
+from hashlib import blake2b
+from pathlib import Path
+from stat import S_ISREG
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from sanic.compat import open_async, stat_async
+from sanic.headers import parse_accept_encoding
+from sanic.response import HTTPResponse, validate_file
+
+
+if TYPE_CHECKING:
+    from sanic import Request
+
+
+StaticCacheKey = tuple[str, str, str | None]
+
+# Precompressed siblings, in order of preference
+PRECOMPRESSED = (("br", ".br"), ("gzip", ".gz"))
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
+class StaticAsset:
+    """A static file held in memory by `StaticCache`.
+
+    Holds the file, any precompressed ``.br``/``.gz`` siblings that were
+    found next to it, and a strong ETag for each of them.
+
+    Args:
+        path (Path): The file that is served.
+        mtime (float): The modification time of the file when it was read.
+        size (int): The size of the file when it was read.
+        content_type (str): The Content-Type header value.
+        variants (Dict[str, bytes]): The file contents by content coding,
+            with ``""`` for the file itself.
+    """
+
+    __slots__ = (
+        "path",
+        "mtime",
+        "size",
+        "content_type",
+        "last_modified",
+        "variants",
+        "nbytes",
+        "checked",
+    )
+
+    def __init__(
+        self,
+        path: Path,
+        mtime: float,
+        size: int,
+        content_type: str,
+        variants: dict[str, bytes],
+    ) -> None:
+        self.path = path
+        self.mtime = mtime
+        self.size = size
+        self.content_type = content_type
+        self.last_modified = formatdate(mtime, usegmt=True)
+        self.variants = {
+            encoding: (body, f'"{blake2b(body, digest_size=16).hexdigest()}"')
+            for encoding, body in variants.items()
+        }
+        self.nbytes = sum(len(body) for body in variants.values())
+        self.checked = monotonic()
+
+    def select(self, accept_encoding: str) -> str:
+        """Choose the content coding to send for an Accept-Encoding header."""
+        if len(self.variants) > 1:
+            accepted = parse_accept_encoding(accept_encoding)
+            for encoding, _ in PRECOMPRESSED:
+                if encoding in self.variants and accepted.get(encoding, 0):
+                    return encoding
+        return ""
+
+    async def respond(
+        self,
+        request: Request,
+        use_modified_since: bool,
+        use_content_range: bool,
+    ) -> HTTPResponse:
+        """Create the response for a request, without touching the disk.
+
+        Args:
+            request (Request): The request for the file.
+            use_modified_since (bool): Whether to send Last-Modified and
+                honor If-Modified-Since.
+            use_content_range (bool): Whether to advertise range requests.
+
+        Returns:
+            HTTPResponse: The response, which is a ``304`` if the client
+                already has the file.
+        """
+        encoding = self.select(request.headers.getone("accept-encoding", ""))
+        body, etag = self.variants[encoding]
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        if len(self.variants) > 1:
+            headers["Vary"] = "Accept-Encoding"
+        if use_modified_since:
+            headers["Last-Modified"] = self.last_modified
+
+        if_none_match = request.headers.getone("if-none-match", None)
+        if if_none_match is not None:
+            if etag_matches(if_none_match, etag):
+                return HTTPResponse(status=304, headers=headers)
+        elif use_modified_since:
+            response = await validate_file(request.headers, self.mtime)
+            if response:
+                response.headers.update(headers)
+                return response
+
+        headers["Content-Type"] = self.content_type
+        if use_content_range:
+            headers["Accept-Ranges"] = "bytes"
+        if request.method == "HEAD":
+            headers["Content-Length"] = str(len(body))
+            return HTTPResponse(headers=headers)
+        return HTTPResponse(body, headers=headers)
+
+
+class StaticCache:
+    """In-memory cache of small, frequently requested static files.
+
+    Files are kept under a total memory budget, with the least recently
+    used ones evicted first. A cached file is checked against its
+    modification time and size at most once every ``ttl`` seconds, so most
+    requests, including conditional ones, are answered without touching the
+    filesystem.
+
+    Args:
+        maxsize (int): The memory budget in bytes.
+        max_file_size (int): Files larger than this are not cached.
+        ttl (float): Seconds between checks that a cached file is unchanged.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "max_file_size",
+        "ttl",
+        "assets",
+        "currsize",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, maxsize: int, max_file_size: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.max_file_size = max_file_size
+        self.ttl = ttl
+        self.assets: OrderedDict[StaticCacheKey, StaticAsset] = OrderedDict()
+        self.currsize = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def get(self, key: StaticCacheKey) -> StaticAsset | None:
+        """Get a cached file, if it is cached and unchanged.
+
+        Args:
+            key (StaticCacheKey): The served directory, the requested path
+                and the configured content type.
+
+        Returns:
+            Optional[StaticAsset]: The cached file.
+        """
+        asset = self.assets.get(key)
+        if asset is not None and monotonic() - asset.checked >= self.ttl:
+            try:
+                stats = await stat_async(asset.path)
+            except OSError:
+                stats = None
+            if stats is None or (stats.st_mtime, stats.st_size) != (
+                asset.mtime,
+                asset.size,
+            ):
+                self.discard(key)
+                asset = None
+            else:
+                asset.checked = monotonic()
+        if asset is None:
+            self.misses += 1
+            return None
+        self.assets.move_to_end(key)
+        self.hits += 1
+        return asset
+
+    async def load(
+        self, key: StaticCacheKey, path: Path, content_type: str
+    ) -> StaticAsset | None:
+        """Read a file and its precompressed siblings into the cache.
+
+        Args:
+            key (StaticCacheKey): The key to cache the file under.
+            path (Path): The file to read.
+            content_type (str): The Content-Type header value.
+
+        Returns:
+            Optional[StaticAsset]: The file, or `None` if it is not a regular
+                file or is too large to be cached.
+        """
+        stats = await stat_async(path)
+        if not S_ISREG(stats.st_mode) or stats.st_size > self.max_file_size:
+            return None
+        variants = {"": await self._read(path)}
+        for encoding, suffix in PRECOMPRESSED:
+            try:
+                variants[encoding] = await self._read(
+                    path.with_name(path.name + suffix)
+                )
+            except OSError:
+                pass
+        asset = StaticAsset(
+            path, stats.st_mtime, stats.st_size, content_type, variants
+        )
+        self.add(key, asset)
+        return asset
+
+    def add(self, key: StaticCacheKey, asset: StaticAsset) -> None:
+        self.discard(key)
+        if asset.nbytes > self.maxsize:
+            return
+        while self.currsize + asset.nbytes > self.maxsize:
+            _, evicted = self.assets.popitem(last=False)
+            self.currsize -= evicted.nbytes
+            self.evictions += 1
+        self.assets[key] = asset
+        self.currsize += asset.nbytes
+
+    def discard(self, key: StaticCacheKey) -> None:
+        asset = self.assets.pop(key, None)
+        if asset is not None:
+            self.currsize -= asset.nbytes
+
+    def clear(self) -> None:
+        """Remove all cached files, but keep the counters."""
+        self.assets.clear()
+        self.currsize = 0
+
+    def info(self) -> dict[str, int]:
+        """Return the size of the cache and its hit/miss counters.
+
+        Returns:
+            Dict[str, int]: The cache statistics.
+        """
+        return {
+            "maxsize": self.maxsize,
+            "currsize": self.currsize,
+            "files": len(self.assets),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    async def _read(self, path: Path) -> bytes:
+        async with await open_async(path, mode="rb") as f:
+            return await f.read(self.max_file_size + 1)
@@ -2,11 +2,11 @@ from __future__ import annotations
 
 import re
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from typing import Any
 from urllib.parse import unquote
 
-from sanic.exceptions import InvalidHeader
+from sanic.exceptions import InvalidHeader, SanicException
 from sanic.helpers import STATUS_CODES
 
 
@@ -20,6 +20,7 @@ OptionsIterable = Iterable[tuple[str, str]]  # May contain duplicate keys
 
 _token, _quoted = r"([\w!#$%&'*+\-.^_`|~]+)", r'"([^"]*)"'
 _param = re.compile(rf";\s*{_token}=(?:{_token}|{_quoted})", re.ASCII)
+_token_re = re.compile(_token, re.ASCII)
 _ipv6 = "(?:[0-9A-Fa-f]{0,4}:){2,7}[0-9A-Fa-f]{0,4}"
 _ipv6_re = re.compile(_ipv6)
 _host_re = re.compile(
@@ -326,6 +327,42 @@ def parse_accept(accept: str | None) -> AcceptList:
         raise InvalidHeader(f"Invalid header value in Accept: {accept}")
 
 
+def parse_accept_encoding(accept_encoding: str | None) -> dict[str, float]:
+    """Parse an Accept-Encoding header into content codings and q-values
+
+    https://datatracker.ietf.org/doc/html/rfc9110#section-12.5.3
+
+    Codings are returned in the order of preference of the client. Codings
+    explicitly refused with ``q=0`` are kept, so that they are not matched
+    by a ``*`` wildcard.
+
+    Args:
+        accept_encoding (str): The Accept-Encoding header value to parse.
+
+    Returns:
+        Dict[str, float]: The content codings, in lower case, and their
+            q-values.
+    """
+    if not accept_encoding:
+        return {}
+    codings = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    q = 0.0
+        codings[coding] = q
+    return dict(sorted(codings.items(), key=lambda x: -x[1]))
+
+
 def parse_content_header(value: str) -> tuple[str, Options]:
     """Parse content-type and content-disposition header values.
 
@@ -509,25 +546,88 @@ _HTTP1_STATUSLINES = [
 ]
 
 
-def format_http1_response(status: int, headers: HeaderBytesIterable) -> bytes:
+def format_http1_response(
+    status: int, headers: HeaderBytesIterable, block: bytes = b""
+) -> bytes:
     """Format a HTTP/1.1 response header.
 
     Args:
         status (int): The HTTP status code.
         headers (HeaderBytesIterable): An iterable of header tuples.
+        block (bytes): Headers that are already formatted, placed right
+            after the status line. See `HeaderBlock`.
 
     Returns:
         bytes: The formatted response header.
     """
     # Note: benchmarks show that here bytes concat is faster than bytearray,
     # b"".join() or %-formatting. %timeit any changes you make.
-    ret = _HTTP1_STATUSLINES[status]
+    ret = _HTTP1_STATUSLINES[status] + block
     for h in headers:
         ret += b"%b: %b\r\n" % h
     ret += b"\r\n"
     return ret
 
 
+class HeaderBlock:
+    """Response headers that are the same on every response, encoded once.
+
+    The headers are validated and encoded to bytes when the block is
+    created, so that responses only need to encode their own headers. A
+    header that a response sets itself replaces the one of the block.
+
+    Args:
+        headers (Mapping[str, Any]): The header names and values. Values are
+            converted to `str`.
+
+    Raises:
+        SanicException: If a name is not a valid token, or a value contains
+            a line break.
+    """
+
+    __slots__ = ("encoded", "headers", "items", "names")
+
+    def __init__(self, headers: Mapping[str, Any]) -> None:
+        self.headers = {
+            name.lower(): f"{value}" for name, value in headers.items()
+        }
+        for name, value in self.headers.items():
+            if not _token_re.fullmatch(name):
+                raise SanicException(f"Invalid header name: {name!r}")
+            if "\r" in value or "\n" in value or "\0" in value:
+                raise SanicException(f"Invalid value for header {name!r}")
+        self.names = tuple(self.headers)
+        self.items: tuple[tuple[bytes, bytes], ...] = tuple(
+            (name.encode("ascii"), value.encode(errors="surrogateescape"))
+            for name, value in self.headers.items()
+        )
+        self.encoded = b"".join(b"%b: %b\r\n" % item for item in self.items)
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
+
+    def exclude(self, headers: Mapping[str, Any]) -> HeaderBlock:
+        """Get the block without the headers that a response sets itself.
+
+        Args:
+            headers (Mapping[str, Any]): The headers of the response.
+
+        Returns:
+            HeaderBlock: This block if none of its headers are set, or a
+                new block without them.
+        """
+        for name in self.names:
+            if name in headers:
+                return HeaderBlock(
+                    {
+                        name: value
+                        for name, value in self.headers.items()
+                        if name not in headers
+                    }
+                )
+        return self
+
+
 def parse_credentials(
     header: str | None,
     prefixes: list | tuple | set | None = None,
@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import zlib
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from struct import pack
+from typing import TYPE_CHECKING, ClassVar
+
+from sanic.exceptions import SanicException
+from sanic.headers import parse_accept_encoding
+from sanic.helpers import has_message_body
+
+
+try:
+    import brotli  # type: ignore
+
+    BROTLI_AVAILABLE = True
+except ModuleNotFoundError:  # no cov
+    BROTLI_AVAILABLE = False
+
+try:
+    import zstandard  # type: ignore
+
+    ZSTD_AVAILABLE = True
+except ModuleNotFoundError:  # no cov
+    ZSTD_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from sanic.request import Request
+    from sanic.response import BaseHTTPResponse
+
+
+GZIP_HEADER = b"\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff"
+# An empty final block, to end a deflate stream that was fully flushed
+DEFLATE_END = b"\x03\x00"
+
+
+class Compressor(ABC):
+    """Base class for incremental response body compressors.
+
+    A compressor produces one encoded stream per response. Compressors that
+    can be reset after finishing a stream are kept in a pool by
+    `ResponseCompression` and reused for later responses.
+
+    Subclasses are registered by their ``name``, which is the content coding
+    used in the Accept-Encoding and Content-Encoding headers.
+
+    Args:
+        level (Optional[int]): The compression level. Defaults to
+            ``default_level``.
+    """
+
+    name: ClassVar[str]
+    default_level: ClassVar[int]
+    _registry: ClassVar[dict[str, type[Compressor]]] = {}
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        Compressor._registry[cls.name] = cls
+
+    @abstractmethod
+    def __init__(self, level: int | None = None) -> None: ...
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        """Compress a part of the body, possibly holding some of it back."""
+
+    @abstractmethod
+    def flush(self) -> bytes:
+        """Return all pending output, so that the client can decode it."""
+
+    @abstractmethod
+    def finish(self) -> bytes:
+        """Return all pending output and end the stream."""
+
+    def reset(self) -> bool:
+        """Prepare for a new stream after `finish`.
+
+        Returns:
+            bool: Whether the compressor can be reused.
+        """
+        return False
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    @staticmethod
+    def get(name: str) -> type[Compressor] | None:
+        """Get an installed compressor class by content coding.
+
+        Args:
+            name (str): The content coding.
+
+        Raises:
+            SanicException: If there is no compressor for the coding.
+
+        Returns:
+            Optional[Type[Compressor]]: The compressor class, or `None` if its
+                dependency is not installed.
+        """
+        compressor_class = Compressor._registry.get(name)
+        if compressor_class is None:
+            raise SanicException(
+                f"Unknown content coding: {name}. Choose from: "
+                f"{', '.join(Compressor._registry)}"
+            )
+        return compressor_class if compressor_class.available() else None
+
+
+class GzipCompressor(Compressor):
+    """Compressor for the ``gzip`` coding, using `zlib`.
+
+    The gzip header and trailer are written here, around a raw deflate
+    stream. Each stream is ended with a full flush and an empty final block
+    instead of ``Z_FINISH``, which leaves the deflate state reusable. A full
+    flush also resets the history, so a stream never refers to data of the
+    one before it.
+    """
+
+    name = "gzip"
+    default_level = 6
+
+    __slots__ = ("_deflate", "_crc", "_size", "_header")
+
+    def __init__(self, level: int | None = None) -> None:
+        self._deflate = zlib.compressobj(
+            self.default_level if level is None else level,
+            zlib.DEFLATED,
+            -zlib.MAX_WBITS,
+        )
+        self.reset()
+
+    def compress(self, data: bytes) -> bytes:
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        return self._start() + self._deflate.compress(data)
+
+    def flush(self) -> bytes:
+        return self._start() + self._deflate.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return (
+            self._start()
+            + self._deflate.flush(zlib.Z_FULL_FLUSH)
+            + DEFLATE_END
+            + pack("<II", self._crc, self._size & 0xFFFFFFFF)
+        )
+
+    def reset(self) -> bool:
+        self._crc = 0
+        self._size = 0
+        self._header = GZIP_HEADER
+        return True
+
+    def _start(self) -> bytes:
+        header, self._header = self._header, b""
+        return header
+
+
+class BrotliCompressor(Compressor):
+    """Compressor for the ``br`` coding, using the ``brotli`` package.
+
+    Brotli encoders cannot be reset, so they are not reused.
+    """
+
+    name = "br"
+    default_level = 4
+
+    __slots__ = ("_brotli",)
+
+    def __init__(self, level: int | None = None) -> None:
+        self._brotli = brotli.Compressor(
+            quality=self.default_level if level is None else level
+        )
+
+    def compress(self, data: bytes) -> bytes:
+        return self._brotli.process(data)
+
+    def flush(self) -> bytes:
+        return self._brotli.flush()
+
+    def finish(self) -> bytes:
+        return self._brotli.finish()
+
+    @classmethod
+    def available(cls) -> bool:
+        return BROTLI_AVAILABLE
+
+
+class ZstdCompressor(Compressor):
+    """Compressor for the ``zstd`` coding, using the ``zstandard`` package.
+
+    The compression context is kept, and a new frame is started on it for
+    every stream.
+    """
+
+    name = "zstd"
+    default_level = 3
+
+    __slots__ = ("_context", "_stream")
+
+    def __init__(self, level: int | None = None) -> None:
+        self._context = zstandard.ZstdCompressor(
+            level=self.default_level if level is None else level
+        )
+        self.reset()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._stream.compress(data)
+
+    def flush(self) -> bytes:
+        return self._stream.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._stream.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+    def reset(self) -> bool:
+        self._stream = self._context.compressobj()
+        return True
+
+    @classmethod
+    def available(cls) -> bool:
+        return ZSTD_AVAILABLE
+
+
+def _tokens(value: str | Iterable[str]) -> list[str]:
+    if isinstance(value, str):
+        value = value.split(",")
+    return [token.strip().lower() for token in value if token.strip()]
+
+
+class ResponseCompression:
+    """Negotiates and applies a content coding to response bodies.
+
+    A response is compressed when its status allows a body, it has no
+    Content-Encoding yet, its media type is in the allowlist, it is not
+    smaller than ``min_size`` and the client accepts one of the codings.
+    Streaming responses are compressed incrementally, and everything that
+    was sent so far is flushed after every chunk.
+
+    There is one instance per worker. Reusable compressors are pooled so
+    that their buffers are not allocated again for every response.
+
+    Args:
+        codings (Union[str, Iterable[str]]): The content codings to offer,
+            in order of preference, either as an iterable or comma separated.
+            Codings whose dependency is not installed are left out.
+        min_size (int): Bodies smaller than this are not compressed. For
+            streaming responses, this only applies if the Content-Length is
+            known in advance.
+        content_types (Union[str, Iterable[str]]): The media types to
+            compress, either as an iterable or comma separated. Entries
+            ending in ``/`` match all subtypes, and entries starting with
+            ``+`` match structured syntax suffixes, like ``+json``.
+        pool_size (int): The number of idle compressors kept per coding.
+    """
+
+    __slots__ = (
+        "codings",
+        "min_size",
+        "content_types",
+        "pool_size",
+        "_classes",
+        "_pools",
+        "created",
+        "reused",
+        "responses",
+    )
+
+    def __init__(
+        self,
+        codings: str | Iterable[str],
+        min_size: int,
+        content_types: str | Iterable[str],
+        pool_size: int = 16,
+    ) -> None:
+        self._classes: dict[str, type[Compressor]] = {}
+        for coding in _tokens(codings):
+            compressor_class = Compressor.get(coding)
+            if compressor_class is not None:
+                self._classes[coding] = compressor_class
+        self.codings = tuple(self._classes)
+        self.min_size = min_size
+        self.content_types = tuple(_tokens(content_types))
+        self.pool_size = pool_size
+        self._pools: dict[str, list[Compressor]] = {
+            coding: [] for coding in self.codings
+        }
+        self.created = 0
+        self.reused = 0
+        self.responses = dict.fromkeys(self.codings, 0)
+
+    def negotiate(self, accept_encoding: str | None) -> str | None:
+        """Choose a content coding for an Accept-Encoding header.
+
+        The coding with the highest q-value wins, with ties broken by the
+        server's order of preference.
+
+        Args:
+            accept_encoding (Optional[str]): The Accept-Encoding header value.
+
+        Returns:
+            Optional[str]: The content coding, or `None` to send the body
+                as is.
+        """
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        coding, best = None, 0.0
+        for name in self.codings:
+            q = accepted.get(name, wildcard)
+            if q > best:
+                coding, best = name, q
+        if accepted.get("identity", 0.0) > best:
+            return None
+        return coding
+
+    def compressible(self, content_type: str) -> bool:
+        """Check a Content-Type against the media type allowlist."""
+        mime = content_type.partition(";")[0].strip().lower()
+        for allowed in self.content_types:
+            if allowed.endswith("/"):
+                if mime.startswith(allowed):
+                    return True
+            elif allowed.startswith("+"):
+                if mime.endswith(allowed):
+                    return True
+            elif mime == allowed:
+                return True
+        return False
+
+    def start(
+        self,
+        request: Request,
+        response: BaseHTTPResponse,
+        data: bytes,
+        end_stream: bool,
+    ) -> Compressor | None:
+        """Decide whether to compress a response, and prepare its headers.
+
+        Must be called before the response headers are sent. When a
+        compressor is returned, Content-Encoding is set, Content-Length is
+        removed and a strong ETag is made weak.
+
+        Args:
+            request (Request): The request being responded to.
+            response (BaseHTTPResponse): The response.
+            data (bytes): The first part of the body.
+            end_stream (bool): Whether ``data`` is the whole body.
+
+        Returns:
+            Optional[Compressor]: The compressor for the body, if it is to be
+                compressed.
+        """
+        headers = response.headers
+        if (
+            not has_message_body(response.status)
+            or response.status == 206
+            or "content-encoding" in headers
+            or "no-transform" in headers.get("cache-control", "")
+            or not self.compressible(
+                headers.get("content-type") or response.content_type or ""
+            )
+        ):
+            return None
+
+        vary = headers.get("vary")
+        if not vary:
+            headers["vary"] = "Accept-Encoding"
+        elif vary != "*" and "accept-encoding" not in vary.lower():
+            headers["vary"] = f"{vary}, Accept-Encoding"
+
+        length = len(data) if end_stream else headers.get("content-length")
+        if length is not None and int(length) < self.min_size:
+            return None
+        coding = self.negotiate(request.headers.get("accept-encoding"))
+        if coding is None:
+            return None
+
+        headers["content-encoding"] = coding
+        headers.pop("content-length", None)
+        etag = headers.get("etag")
+        if etag and etag.startswith('"'):
+            headers["etag"] = f"W/{etag}"
+        self.responses[coding] += 1
+        return self.acquire(coding)
+
+    def compress(
+        self, compressor: Compressor, data: bytes, end_stream: bool
+    ) -> bytes:
+        """Compress a part of the body, and flush it.
+
+        The compressor is released when the stream ends.
+        """
+        if end_stream:
+            data = compressor.compress(data) + compressor.finish()
+            self.release(compressor)
+            return data
+        return compressor.compress(data) + compressor.flush()
+
+    def acquire(self, coding: str) -> Compressor:
+        pool = self._pools[coding]
+        if pool:
+            self.reused += 1
+            return pool.pop()
+        self.created += 1
+        return self._classes[coding]()
+
+    def release(self, compressor: Compressor) -> None:
+        pool = self._pools[compressor.name]
+        if len(pool) < self.pool_size and compressor.reset():
+            pool.append(compressor)
+
+    def info(self) -> dict[str, int | dict[str, int]]:
+        """Return the number of compressed responses and pool statistics.
+
+        Returns:
+            Dict[str, Union[int, Dict[str, int]]]: The statistics.
+        """
+        return {
+            "responses": dict(self.responses),
+            "created": self.created,
+            "reused": self.reused,
+            "pooled": sum(len(pool) for pool in self._pools.values()),
+        }
@@ -22,6 +22,7 @@ from sanic.exceptions import (
 from sanic.headers import format_http1_response
 from sanic.helpers import has_message_body
 from sanic.http.constants import Stage
+from sanic.http.parser import HeadParser, PythonHeadParser
 from sanic.http.stream import Stream
 from sanic.log import access_logger, error_logger, logger
 from sanic.touchup import TouchUpMeta
@@ -45,6 +46,8 @@ class Http(Stream, metaclass=TouchUpMeta):
 
     HEADER_CEILING = 16_384
     HEADER_MAX_SIZE = 0
+    VECTORED_WRITE_SIZE = 16_384
+    HEAD_PARSER: HeadParser = PythonHeadParser()
     __touchup__ = (
         "http1_request_header",
         "http1_response_header",
@@ -53,6 +56,7 @@ class Http(Stream, metaclass=TouchUpMeta):
     __slots__ = [
         "_send",
         "_receive_more",
+        "compression",
         "dispatch",
         "recv_buffer",
         "protocol",
@@ -67,11 +71,13 @@ class Http(Stream, metaclass=TouchUpMeta):
         "request_bytes",
         "request_bytes_left",
         "response",
+        "response_compressor",
         "response_func",
         "response_size",
         "response_bytes_left",
         "upgrade_websocket",
         "perft0",
+        "trace",
     ]
 
     def __init__(self, protocol):
@@ -82,6 +88,8 @@ class Http(Stream, metaclass=TouchUpMeta):
         self.keep_alive = True
         self.stage: Stage = Stage.IDLE
         self.dispatch = self.protocol.app.dispatch
+        self.compression = self.protocol.app.compression
+        self.trace = protocol.trace
 
     def init_for_request(self):
         """Init/reset all per-request variables."""
@@ -94,6 +102,7 @@ class Http(Stream, metaclass=TouchUpMeta):
         self.request_max_size = self.protocol.request_max_size
         self.request: Request = None
         self.response: BaseHTTPResponse = None
+        self.response_compressor = None
         self.upgrade_websocket = False
         self.url = None
         self.perft0 = None
@@ -116,6 +125,10 @@ class Http(Stream, metaclass=TouchUpMeta):
                 self.response_func = self.http1_response_header
 
                 await self.http1_request_header()
+                if self.trace:
+                    self.trace(
+                        "[request]: %s %s", self.request.method, self.url
+                    )
 
                 self.stage = Stage.HANDLER
                 self.perft0 = perf_counter()
@@ -193,43 +206,30 @@ class Http(Stream, metaclass=TouchUpMeta):
         if pos >= self.HEADER_MAX_SIZE:
             raise PayloadTooLarge("Request header exceeds the size limit")
 
+        # Copy the head out of the receive buffer exactly once. The same
+        # bytes are parsed, handed to signals and kept on the Request, so
+        # nothing refers to recv_buffer after it is compacted below.
+        with memoryview(buf) as view:
+            head = bytes(view[:pos])
+
         # Parse header content
         try:
-            head = buf[:pos]
-            raw_headers = head.decode(errors="surrogateescape")
-            reqline, *split_headers = raw_headers.split("\r\n")
-            method, self.url, protocol = reqline.split(" ")
+            (
+                method,
+                self.url,
+                protocol,
+                headers,
+                request_body,
+                self.keep_alive,
+            ) = self.HEAD_PARSER.parse(head)
 
             await self.dispatch(
                 "http.lifecycle.read_head",
                 inline=True,
-                context={"head": bytes(head)},
+                context={"head": head},
             )
 
-            if protocol == "HTTP/1.1":
-                self.keep_alive = True
-            elif protocol == "HTTP/1.0":
-                self.keep_alive = False
-            else:
-                raise Exception  # Raise a Bad Request on try-except
-
             self.head_only = method.upper() == "HEAD"
-            request_body = False
-            headers = []
-
-            for name, value in (h.split(":", 1) for h in split_headers):
-                name, value = h = name.lower(), value.lstrip()
-
-                if name in ("content-length", "transfer-encoding"):
-                    if request_body:
-                        raise ValueError(
-                            "Duplicate Content-Length or Transfer-Encoding"
-                        )
-                    request_body = True
-                elif name == "connection":
-                    self.keep_alive = value.lower() == "keep-alive"
-
-                headers.append(h)
         except Exception:
             raise BadRequest("Bad Request")
 
@@ -250,7 +250,7 @@ class Http(Stream, metaclass=TouchUpMeta):
         request = self.protocol.request_class(
             url_bytes=url_bytes,
             headers=headers_instance,
-            head=bytes(head),
+            head=head,
             version=protocol[5:],
             method=method,
             transport=self.protocol.transport,
@@ -302,14 +302,24 @@ class Http(Stream, metaclass=TouchUpMeta):
         if not data and getattr(res, "body", None):
             data, end_stream = res.body, True  # type: ignore
 
-        size = len(data)
         headers = res.headers
         status = res.status
-        self.response_size = size
 
         if not isinstance(status, int) or status < 200:
             raise RuntimeError(f"Invalid response status {status!r}")
 
+        compressor = None
+        if self.compression and not self.head_only:
+            compressor = self.compression.start(
+                self.request, res, data, end_stream
+            )
+            if compressor is not None:
+                data = self.compression.compress(compressor, data, end_stream)
+
+        size = len(data)
+        self.response_size = size
+        body = [data] if size else []
+
         if not has_message_body(status):
             # Header-only response status
             self.response_func = None
@@ -319,7 +329,7 @@ class Http(Stream, metaclass=TouchUpMeta):
                 or "content-length" in headers
                 or "transfer-encoding" in headers
             ):
-                data, size, end_stream = b"", 0, True
+                body, end_stream = [], True
                 headers.pop("content-length", None)
                 headers.pop("transfer-encoding", None)
                 logger.warning(
@@ -339,12 +349,15 @@ class Http(Stream, metaclass=TouchUpMeta):
         else:
             # Length not known, use chunked encoding
             headers["transfer-encoding"] = "chunked"
-            data = b"%x\r\n%b\r\n" % (size, data) if size else b""
+            body = self._chunk(data, False)
             self.response_func = self.http1_response_chunked
+            if compressor is not None:
+                self.response_compressor = compressor
+                self.response_func = self.http1_response_compressed
 
         if self.head_only:
             # Head request: don't send body
-            data = b""
+            body = []
             self.response_func = self.head_response_ignored
 
         headers["connection"] = "keep-alive" if self.keep_alive else "close"
@@ -354,21 +367,28 @@ class Http(Stream, metaclass=TouchUpMeta):
         # being assigned, or we change the value as required.
         headers["alt-svc"] = ""
 
-        ret = format_http1_response(status, res.processed_headers)
-        if data:
-            ret += data
+        processed = res.processed_headers
+        block = self.protocol.app.header_block.exclude(headers)
+        ret = [format_http1_response(status, processed, block.encoded), *body]
 
         # Send a 100-continue if expected and not Expectation Failed
         if self.expecting_continue:
             self.expecting_continue = False
             if status != 417:
-                ret = HTTP_CONTINUE + ret
+                ret.insert(0, HTTP_CONTINUE)
 
         # Send response
         if self.protocol.access_log:
             self.log_response()
 
-        await self._send(ret)
+        if self.trace:
+            self.trace(
+                "[send]: HEADERS status=%d %d bytes end_stream=%s",
+                status,
+                sum(map(len, ret)),
+                end_stream,
+            )
+        await self._send(self._gather(ret))
         self.stage = Stage.IDLE if end_stream else Stage.RESPONSE
 
     def head_response_ignored(self, data: bytes, end_stream: bool) -> None:
@@ -383,21 +403,58 @@ class Http(Stream, metaclass=TouchUpMeta):
         """Format a part of response body in chunked encoding."""
         # Chunked encoding
         size = len(data)
+        if self.trace:
+            self.trace("[send]: %d bytes end_stream=%s", size, end_stream)
         if end_stream:
-            await self._send(
-                b"%x\r\n%b\r\n0\r\n\r\n" % (size, data)
-                if size
-                else b"0\r\n\r\n"
-            )
+            await self._send(self._gather(self._chunk(data, True)))
             self.response_func = None
             self.stage = Stage.IDLE
         elif size:
-            await self._send(b"%x\r\n%b\r\n" % (size, data))
+            await self._send(self._gather(self._chunk(data, False)))
+
+    @staticmethod
+    def _chunk(data: bytes, end_stream: bool) -> list[bytes]:
+        """Frame a part of the body in chunked encoding, without copying it.
+
+        The body is returned between its chunk size line and the chunk
+        terminator, followed by the last chunk if ``end_stream`` is set.
+        """
+        if not data:
+            return [b"0\r\n\r\n"] if end_stream else []
+        return [
+            b"%x\r\n" % len(data),
+            data,
+            b"\r\n0\r\n\r\n" if end_stream else b"\r\n",
+        ]
+
+    def _gather(self, parts: list[bytes]) -> bytes | list[bytes]:
+        """Prepare buffers to be sent with one write.
+
+        Small writes are joined into one bytes object. Bigger ones are
+        returned as a list for the transport to write as they are, with
+        ``writelines``, so that a large body is not copied only to put the
+        headers or the chunk framing in front of it.
+        """
+        if sum(map(len, parts)) < self.VECTORED_WRITE_SIZE:
+            return b"".join(parts)
+        return parts
+
+    async def http1_response_compressed(
+        self, data: bytes, end_stream: bool
+    ) -> None:
+        """Compress a part of response body and send it chunked."""
+        if data or end_stream:
+            data = self.compression.compress(
+                self.response_compressor, data, end_stream
+            )
+            await self.http1_response_chunked(data, end_stream)
 
     async def http1_response_normal(
         self, data: bytes, end_stream: bool
     ) -> None:
         """Format / keep track of non-chunked response."""
+        if self.trace:
+            self.trace("[send]: %d bytes end_stream=%s", len(data), end_stream)
         bytes_left = self.response_bytes_left - len(data)
         if bytes_left <= 0:
             if bytes_left < 0:
@@ -413,6 +470,28 @@ class Http(Stream, metaclass=TouchUpMeta):
             await self._send(data)
         self.response_bytes_left = bytes_left
 
+    async def send_file(self, location, offset: int, size: int) -> bool:
+        """Send a part of a file as the response body with sendfile.
+
+        Must follow a response header with a Content-Length of ``size``.
+        Returns ``False`` without sending anything if sendfile cannot be used
+        on this connection, so that the caller can send the file by itself.
+        """
+        if self.response_func == self.head_response_ignored:
+            self.head_response_ignored(b"", True)
+            return True
+        if (
+            self.response_func != self.http1_response_normal
+            or self.response_bytes_left != size
+            or not self.protocol.sendfile_available
+            or not await self.protocol.sendfile(location, offset, size)
+        ):
+            return False
+        self.response_bytes_left = 0
+        self.response_func = None
+        self.stage = Stage.IDLE
+        return True
+
     async def error_response(self, exception: Exception) -> None:
         """Handle response when exception encountered"""
         # Disconnect after an error if in any other state than handler
@@ -612,6 +691,10 @@ class Http(Stream, metaclass=TouchUpMeta):
             cls.HEADER_CEILING,
         )
 
+    @classmethod
+    def set_head_parser(cls, name: str):
+        cls.HEAD_PARSER = HeadParser.get(name)
+
     @staticmethod
     def _safe_int(value: str, base: int = 10) -> int:
         if "-" in value or "+" in value or "_" in value:
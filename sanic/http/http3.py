@@ -1,8 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
+import time
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
 from ssl import SSLContext
 from typing import TYPE_CHECKING, Any, Callable, cast
 
@@ -19,6 +26,7 @@ from sanic.http.constants import Stage
 from sanic.http.stream import Stream
 from sanic.http.tls.context import CertSelector, SanicSSLContext
 from sanic.log import Colors, logger
+from sanic.logging.trace import ProtocolTracer
 from sanic.models.protocol_types import TransportProtocol
 from sanic.models.server_types import ConnInfo
 
@@ -34,7 +42,7 @@ try:
         WebTransportStreamDataReceived,
     )
     from aioquic.quic.configuration import QuicConfiguration
-    from aioquic.tls import SessionTicket
+    from aioquic.tls import CipherSuite, SessionTicket
 
     HTTP3_AVAILABLE = True
 except ModuleNotFoundError:  # no cov
@@ -42,6 +50,8 @@ except ModuleNotFoundError:  # no cov
 
 if TYPE_CHECKING:
     from sanic import Sanic
+    from sanic.config import Config
+    from sanic.http.compression import Compressor
     from sanic.request import Request
     from sanic.response import BaseHTTPResponse
     from sanic.server.protocols.http_protocol import Http3Protocol
@@ -89,19 +99,37 @@ class Receiver(ABC):
 
 
 class HTTPReceiver(Receiver, Stream):
-    """HTTP/3 receiver implementation."""
+    """HTTP/3 receiver implementation.
+
+    The request body is queued in chunks as it arrives, and read by the
+    handler with `read` or by iterating the receiver, like with `Http`.
+
+    Sending waits while more than ``WRITE_HIGH_WATER`` bytes of the response
+    are queued in the QUIC stream but not sent yet, because of flow control
+    or congestion. It resumes when ``WRITE_LOW_WATER`` or less are left.
+    """
+
+    WRITE_HIGH_WATER = 65536
+    WRITE_LOW_WATER = 16384
 
     stage: Stage
     request: Request
 
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self.request_body = None
+        self.request_body: bool | None = None
+        self.body_chunks: deque[bytes] = deque()
+        self._body_waiter: asyncio.Future | None = None
+        self._can_write = asyncio.Event()
+        self._can_write.set()
         self.stage = Stage.IDLE
         self.headers_sent = False
         self.response: BaseHTTPResponse | None = None
         self.request_max_size = self.protocol.request_max_size
         self.request_bytes = 0
+        self.compression = self.protocol.app.compression
+        self.response_compressor: Compressor | None = None
+        self.trace: ProtocolTracer | None = self.protocol.trace
 
     async def run(self, exception: Exception | None = None):
         """Handle the request and response cycle."""
@@ -110,8 +138,11 @@ class HTTPReceiver(Receiver, Stream):
 
         if exception:
             logger.info(  # no cov
-                f"{Colors.BLUE}[exception]: "
-                f"{Colors.RED}{exception}{Colors.END}",
+                "%s[exception]: %s%s%s",
+                Colors.BLUE,
+                Colors.RED,
+                exception,
+                Colors.END,
                 exc_info=True,
                 extra={"verbosity": 1},
             )
@@ -119,7 +150,10 @@ class HTTPReceiver(Receiver, Stream):
         else:
             try:
                 logger.info(  # no cov
-                    f"{Colors.BLUE}[request]:{Colors.END} {self.request}",
+                    "%s[request]:%s %s",
+                    Colors.BLUE,
+                    Colors.END,
+                    self.request,
                     extra={"verbosity": 1},
                 )
                 await self.protocol.request_handler(self.request)
@@ -154,28 +188,40 @@ class HTTPReceiver(Receiver, Stream):
                 f"Message body set in response on {self.request.path}. "
                 f"A {status} response may only have headers, no body."
             )
-        elif "content-length" not in headers:
-            if size:
+        else:
+            # HTTP/3 frames the body itself, so streaming responses are sent
+            # without a Content-Length, and never chunked
+            headers.pop("transfer-encoding", None)
+            if (
+                size
+                and "content-length" not in headers
+                and not self.response_compressor
+            ):
                 headers["content-length"] = size
-            else:
-                headers["transfer-encoding"] = "chunked"
 
-        headers = [
+        processed = response.processed_headers
+        block = self.protocol.app.header_block.exclude(headers)
+        return [
             (b":status", str(response.status).encode()),
-            *response.processed_headers,
+            *block.items,
+            *processed,
         ]
-        return headers
 
     def send_headers(self) -> None:
         """Send response headers to client"""
-        logger.debug(  # no cov
-            f"{Colors.BLUE}[send]: {Colors.GREEN}HEADERS{Colors.END}",
-            extra={"verbosity": 2},
-        )
+        if self.trace:
+            self.trace(
+                f"{Colors.BLUE}[send]: {Colors.GREEN}HEADERS{Colors.END}"
+            )
         if not self.response:
             raise RuntimeError("no response")
 
         response = self.response
+        if self.compression and not self.head_only:
+            body = response.body or b""
+            self.response_compressor = self.compression.start(
+                self.request, response, body, bool(body)
+            )
         headers = self._prepare_headers(response)
 
         self.protocol.connection.send_headers(
@@ -192,10 +238,8 @@ class HTTPReceiver(Receiver, Stream):
 
     def respond(self, response: BaseHTTPResponse) -> BaseHTTPResponse:
         """Prepare response to client"""
-        logger.debug(  # no cov
-            f"{Colors.BLUE}[respond]:{Colors.END} {response}",
-            extra={"verbosity": 2},
-        )
+        if self.trace:
+            self.trace(f"{Colors.BLUE}[respond]:{Colors.END} %s", response)
 
         if self.stage is not Stage.HANDLER:
             self.stage = Stage.FAILED
@@ -209,22 +253,89 @@ class HTTPReceiver(Receiver, Stream):
 
         return response
 
-    def receive_body(self, data: bytes) -> None:
+    def receive_body(self, data: bytes, end_stream: bool = False) -> None:
         """Receive request body from client"""
         self.request_bytes += len(data)
         if self.request_bytes > self.request_max_size:
             raise PayloadTooLarge("Request body exceeds the size limit")
 
-        self.request.body += data
+        if data:
+            self.body_chunks.append(data)
+        if end_stream:
+            self.request_body = False
+        waiter, self._body_waiter = self._body_waiter, None
+        if waiter and not waiter.done():
+            waiter.set_result(None)
+
+    async def __aiter__(self):
+        """Async iterate over request body."""
+        while self.request_body or self.body_chunks:
+            data = await self.read()
+
+            if data:
+                yield data
+
+    async def read(self) -> bytes | None:
+        """Read the request body received so far.
+
+        Waits for more of the body if none is queued.
+
+        Returns:
+            Optional[bytes]: The queued body chunks, or `None` at the end of
+                the body.
+        """
+        while not self.body_chunks:
+            if not self.request_body:
+                return None
+            self._body_waiter = asyncio.get_running_loop().create_future()
+            await self._body_waiter
+
+        chunks = self.body_chunks
+        if len(chunks) == 1:
+            return chunks.popleft()
+        data = b"".join(chunks)
+        chunks.clear()
+        return data
 
     async def send(self, data: bytes, end_stream: bool) -> None:
         """Send data to client"""
-        logger.debug(  # no cov
-            f"{Colors.BLUE}[send]: {Colors.GREEN}data={data.decode()} "
-            f"end_stream={end_stream}{Colors.END}",
-            extra={"verbosity": 2},
-        )
+        if self.trace:
+            self.trace(
+                f"{Colors.BLUE}[send]: {Colors.GREEN}%d bytes "
+                f"end_stream=%s{Colors.END}",
+                len(data),
+                end_stream,
+            )
+        if self.headers_sent and self.stage is Stage.IDLE:
+            if end_stream and not data:
+                return  # Ending a response that already ended, like Http
+        await self._can_write.wait()
         self._send(data, end_stream)
+        if not end_stream and self.send_buffered() > self.WRITE_HIGH_WATER:
+            self._can_write.clear()
+            paused = self.protocol.http.paused
+            paused.add(self)
+            try:
+                await self._can_write.wait()
+            finally:
+                paused.discard(self)
+
+    def send_buffered(self) -> int:
+        """Return the number of response bytes not sent to the client yet.
+
+        aioquic has no public API for it, so this reads the send buffer of
+        its stream. When the stream is gone, or aioquic does not have the
+        attributes, it returns 0, which means no backpressure."""
+        try:
+            stream = self.protocol._quic._streams[self.request.stream_id]
+            return stream.sender._buffer_stop - stream.sender.next_offset
+        except (AttributeError, KeyError):
+            return 0
+
+    def resume_writing(self, force: bool = False) -> None:
+        """Let `send` continue if enough of the queued data was sent."""
+        if force or self.send_buffered() <= self.WRITE_LOW_WATER:
+            self._can_write.set()
 
     def _send(self, data: bytes, end_stream: bool) -> None:
         if not self.headers_sent:
@@ -232,25 +343,13 @@ class HTTPReceiver(Receiver, Stream):
         if self.stage is not Stage.RESPONSE:
             raise ServerError(f"not ready to send: {self.stage}")
 
-        # Chunked
-        if (
-            self.response
-            and self.response.headers.get("transfer-encoding") == "chunked"
-        ):
-            size = len(data)
-            if end_stream:
-                data = (
-                    b"%x\r\n%b\r\n0\r\n\r\n" % (size, data)
-                    if size
-                    else b"0\r\n\r\n"
-                )
-            elif size:
-                data = b"%x\r\n%b\r\n" % (size, data)
+        if self.response_compressor and (data or end_stream):
+            data = self.compression.compress(
+                self.response_compressor, data, end_stream
+            )
 
-        logger.debug(  # no cov
-            f"{Colors.BLUE}[transmitting]{Colors.END}",
-            extra={"verbosity": 2},
-        )
+        if self.trace:
+            self.trace(f"{Colors.BLUE}[transmitting]{Colors.END}")
         self.protocol.connection.send_data(
             stream_id=self.request.stream_id,
             data=data,
@@ -293,30 +392,45 @@ class Http3:
         self.protocol = protocol
         self.transmit = transmit
         self.receivers: dict[int, Receiver] = {}
+        self.paused: set[HTTPReceiver] = set()
+        self.trace: ProtocolTracer | None = protocol.trace
+
+    def resume_writing(self, force: bool = False) -> None:
+        """Wake up receivers that wait for stream credit.
+
+        Called after packets were sent or received, since acknowledgements
+        and MAX_STREAM_DATA frames are not reported as events.
+
+        Args:
+            force (bool): Wake up all of them, e.g. when the connection was
+                closed.
+        """
+        for receiver in tuple(self.paused):
+            receiver.resume_writing(force)
 
     def http_event_received(self, event: H3Event) -> None:
-        logger.debug(  # no cov
-            f"{Colors.BLUE}[http_event_received]: "
-            f"{Colors.YELLOW}{event}{Colors.END}",
-            extra={"verbosity": 2},
-        )
+        if self.trace:
+            self.trace(
+                f"{Colors.BLUE}[http_event_received]: "
+                f"{Colors.YELLOW}%s{Colors.END}",
+                ProtocolTracer.describe(event),
+            )
         receiver, created_new = self.get_or_make_receiver(event)
         receiver = cast(HTTPReceiver, receiver)
 
         if isinstance(event, HeadersReceived) and created_new:
+            receiver.request_body = not event.stream_ended
             receiver.future = asyncio.ensure_future(receiver.run())
         elif isinstance(event, DataReceived):
             try:
-                receiver.receive_body(event.data)
+                receiver.receive_body(event.data, event.stream_ended)
             except Exception as e:
                 receiver.future.cancel()
                 receiver.future = asyncio.ensure_future(receiver.run(e))
         else:
             ...  # Intentionally here to help out Touchup
-            logger.debug(  # no cov
-                f"{Colors.RED}DOING NOTHING{Colors.END}",
-                extra={"verbosity": 2},
-            )
+            if self.trace:
+                self.trace(f"{Colors.RED}DOING NOTHING{Colors.END}")
 
     def get_or_make_receiver(self, event: H3Event) -> tuple[Receiver, bool]:
         if (
@@ -380,17 +494,203 @@ class Http3:
 
 class SessionTicketStore:
     """
-    Simple in-memory store for session tickets.
+    Store for the session tickets of HTTP/3 connections.
+
+    Tickets are kept for at most ``lifetime`` seconds, and only the
+    ``max_size`` most recent ones are kept. A ticket can only be used once.
+
+    With a ``directory``, tickets are also written to it, so that a session
+    can be resumed by any worker that uses the same directory. They hold
+    the secrets of the sessions, so it must only be readable by the user
+    that runs the server.
+
+    The directory is written to, and pruned, by a thread, so that the loop
+    does not wait for the file system. A ticket is claimed by renaming its
+    file, so that only one worker can use it. The tickets of this worker
+    are kept in memory too, and are not read back from their file once it
+    is claimed. aioquic asks for a ticket during a handshake and waits for
+    the answer, so the claim, and the read of a ticket that another worker
+    issued, block the loop.
+
+    Args:
+        max_size (int): The most tickets to keep in memory.
+        lifetime (float): The seconds that a ticket is kept.
+        directory (Optional[Union[str, Path]]): A directory for sharing
+            tickets between workers.
     """
 
-    def __init__(self) -> None:
-        self.tickets: dict[bytes, SessionTicket] = {}
+    PRUNE_INTERVAL = 60.0
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        lifetime: float = 3600,
+        directory: str | Path | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.lifetime = lifetime
+        self.directory = Path(directory) if directory else None
+        self.tickets: OrderedDict[bytes, tuple[float, SessionTicket]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self._pruned = time.monotonic()
+        self._executor: ThreadPoolExecutor | None = None
+        if self.directory:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # One thread, so that a ticket is written before it is removed
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="sanic-tickets"
+            )
+
+    @classmethod
+    def from_config(cls, config: Config) -> SessionTicketStore:
+        """Create the store for the ``TLS_SESSION_TICKET_*`` config."""
+        return cls(
+            config.TLS_SESSION_TICKET_STORE_SIZE,
+            config.TLS_SESSION_TICKET_LIFETIME,
+            config.TLS_SESSION_TICKET_DIRECTORY,
+        )
 
     def add(self, ticket: SessionTicket) -> None:
-        self.tickets[ticket.ticket] = ticket
+        now = time.monotonic()
+        tickets = self.tickets
+        tickets[ticket.ticket] = (now + self.lifetime, ticket)
+        while tickets and (
+            len(tickets) > self.max_size
+            or next(iter(tickets.values()))[0] < now
+        ):
+            tickets.popitem(last=False)
+        if self.directory:
+            self._submit(self._write, ticket)
+            if now - self._pruned > self.PRUNE_INTERVAL:
+                self._pruned = now
+                self._submit(self.prune)
 
     def pop(self, label: bytes) -> SessionTicket | None:
-        return self.tickets.pop(label, None)
+        expires, ticket = self.tickets.pop(label, (0.0, None))
+        if ticket is not None and expires < time.monotonic():
+            ticket = None
+        if self.directory:
+            # The shared copy decides, even if this worker has the ticket,
+            # so that it is only used once in all workers
+            ticket = self._read(label, ticket)
+        if ticket is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return ticket
+
+    def prune(self) -> None:
+        """Remove the expired tickets from the directory, and the oldest
+        ones if there are more than ``max_size``."""
+        self._pruned = time.monotonic()
+        if not self.directory:
+            return
+        expired = time.time() - self.lifetime
+        entries = []
+        for entry in os.scandir(self.directory):
+            try:
+                mtime = entry.stat().st_mtime
+            except FileNotFoundError:
+                continue
+            if mtime < expired:
+                self._unlink(entry.path)
+            else:
+                entries.append((mtime, entry.path))
+        if len(entries) > self.max_size:
+            entries.sort()
+            for _, path in entries[: len(entries) - self.max_size]:
+                self._unlink(path)
+
+    def close(self) -> None:
+        """Wait for the directory to be written. Any later writes are made
+        without a thread."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def info(self) -> dict[str, int]:
+        return {
+            "size": len(self.tickets),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def _submit(self, fn: Callable[..., None], *args: Any) -> None:
+        if self._executor is None:
+            fn(*args)
+        else:
+            self._executor.submit(fn, *args)
+
+    def _write(self, ticket: SessionTicket) -> None:
+        data = json.dumps(
+            {
+                "age_add": ticket.age_add,
+                "cipher_suite": int(ticket.cipher_suite),
+                "not_valid_after": ticket.not_valid_after.timestamp(),
+                "not_valid_before": ticket.not_valid_before.timestamp(),
+                "resumption_secret": ticket.resumption_secret.hex(),
+                "server_name": ticket.server_name,
+                "ticket": ticket.ticket.hex(),
+                "max_early_data_size": ticket.max_early_data_size,
+                "other_extensions": [
+                    (kind, value.hex())
+                    for kind, value in ticket.other_extensions
+                ],
+            }
+        ).encode()
+        path = self.directory / ticket.ticket.hex()  # type: ignore
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "wb") as f:
+                f.write(data)
+        except OSError as e:
+            logger.warning("Session ticket not shared: %s", e)
+
+    def _read(
+        self, label: bytes, ticket: SessionTicket | None = None
+    ) -> SessionTicket | None:
+        path = self.directory / label.hex()  # type: ignore
+        claimed = path.with_name(f"{path.name}.{os.getpid()}")
+        try:
+            # Only one worker can rename the file
+            os.rename(path, claimed)
+        except OSError:
+            return None
+        try:
+            with open(claimed, "rb") as f:
+                if os.fstat(f.fileno()).st_mtime + self.lifetime < time.time():
+                    return None
+                if ticket is not None:
+                    return ticket
+                data = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        finally:
+            self._unlink(claimed)
+        return SessionTicket(
+            data["age_add"],
+            CipherSuite(data["cipher_suite"]),
+            datetime.fromtimestamp(data["not_valid_after"], timezone.utc),
+            datetime.fromtimestamp(data["not_valid_before"], timezone.utc),
+            bytes.fromhex(data["resumption_secret"]),
+            data["server_name"],
+            bytes.fromhex(data["ticket"]),
+            data["max_early_data_size"],
+            [
+                (kind, bytes.fromhex(value))
+                for kind, value in data["other_extensions"]
+            ],
+        )
+
+    @staticmethod
+    def _unlink(path: str | Path) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
 
 
 def get_config(app: Sanic, ssl: SanicSSLContext | CertSelector | SSLContext):
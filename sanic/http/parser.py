@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import ClassVar, NamedTuple
+
+from sanic.exceptions import SanicException
+
+
+try:
+    from httptools import HttpRequestParser  # type: ignore
+    from httptools.parser.errors import HttpParserUpgrade  # type: ignore
+
+    HTTPTOOLS_INSTALLED = True
+except ImportError:  # no cov
+    HTTPTOOLS_INSTALLED = False
+
+
+class RequestHead(NamedTuple):
+    """Model for a parsed HTTP/1.x request head.
+
+    Args:
+        method (str): The request method, as sent by the client.
+        url (str): The request target, decoded with ``surrogateescape``.
+        protocol (str): The protocol, either ``HTTP/1.1`` or ``HTTP/1.0``.
+        headers (list[tuple[str, str]]): Header names (lower case) and values.
+        has_body (bool): Whether a Content-Length or Transfer-Encoding header
+            was present.
+        keep_alive (bool): Whether the connection may be reused, based upon
+            the protocol version and the Connection header.
+    """
+
+    method: str
+    url: str
+    protocol: str
+    headers: list[tuple[str, str]]
+    has_body: bool
+    keep_alive: bool
+
+
+class HeadParser(ABC):
+    """Base class for HTTP/1.x request head parsers.
+
+    A parser receives the request head *without* the terminating blank line
+    and returns a `RequestHead`. Any exception raised while parsing is turned
+    into a ``400 Bad Request`` by the HTTP protocol handler.
+
+    Subclasses are registered by their ``name`` and can be selected with the
+    ``REQUEST_HEAD_PARSER`` config value.
+    """
+
+    name: ClassVar[str]
+    _registry: ClassVar[dict[str, type[HeadParser]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        HeadParser._registry[cls.name] = cls
+
+    @abstractmethod
+    def parse(self, head: bytes | bytearray) -> RequestHead: ...
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    @staticmethod
+    def get(name: str) -> HeadParser:
+        """Get a parser instance by name.
+
+        Use ``"auto"`` to prefer the C-accelerated parser when installed.
+
+        Args:
+            name (str): The name of the parser.
+
+        Raises:
+            SanicException: If there is no such parser or it is not installed.
+
+        Returns:
+            HeadParser: The parser instance.
+        """
+        if name == "auto":
+            name = "httptools" if HttptoolsHeadParser.available() else "python"
+        parser_class = HeadParser._registry.get(name)
+        if parser_class is None:
+            raise SanicException(
+                f"Unknown request head parser: {name}. Choose one of: "
+                f"auto, {', '.join(HeadParser._registry)}"
+            )
+        if not parser_class.available():
+            raise SanicException(
+                f"Request head parser {name} is not available. "
+                "Is its dependency installed?"
+            )
+        return parser_class()
+
+
+class PythonHeadParser(HeadParser):
+    """Pure Python request head parser."""
+
+    name = "python"
+
+    def parse(self, head: bytes | bytearray) -> RequestHead:
+        raw_headers = head.decode(errors="surrogateescape")
+        reqline, *split_headers = raw_headers.split("\r\n")
+        method, url, protocol = reqline.split(" ")
+
+        if protocol == "HTTP/1.1":
+            keep_alive = True
+        elif protocol == "HTTP/1.0":
+            keep_alive = False
+        else:
+            raise ValueError(f"Unsupported protocol: {protocol}")
+
+        has_body = False
+        headers = []
+
+        for name, value in (h.split(":", 1) for h in split_headers):
+            name, value = h = name.lower(), value.lstrip()
+
+            if name in ("content-length", "transfer-encoding"):
+                if has_body:
+                    raise ValueError(
+                        "Duplicate Content-Length or Transfer-Encoding"
+                    )
+                has_body = True
+            elif name == "connection":
+                keep_alive = value.lower() == "keep-alive"
+
+            headers.append(h)
+
+        return RequestHead(
+            method, url, protocol, headers, has_body, keep_alive
+        )
+
+
+class _HeadCollector:
+    """Callback target for the httptools (llhttp) parser."""
+
+    __slots__ = ("url", "headers", "has_body", "connection")
+
+    def __init__(self) -> None:
+        self.url = b""
+        self.headers: list[tuple[str, str]] = []
+        self.has_body = False
+        self.connection: str | None = None
+
+    def on_url(self, url: bytes) -> None:
+        self.url += url
+
+    def on_header(self, name: bytes, value: bytes) -> None:
+        h = (
+            name.decode(errors="surrogateescape").lower(),
+            value.decode(errors="surrogateescape"),
+        )
+        if h[0] in ("content-length", "transfer-encoding"):
+            if self.has_body:
+                raise ValueError(
+                    "Duplicate Content-Length or Transfer-Encoding"
+                )
+            self.has_body = True
+        elif h[0] == "connection":
+            self.connection = h[1]
+        self.headers.append(h)
+
+
+class HttptoolsHeadParser(HeadParser):
+    """Request head parser backed by the httptools C extension (llhttp).
+
+    The head is fed directly from the receive buffer and header names and
+    values are decoded one at a time, without building an intermediate
+    string for the whole head.
+    """
+
+    name = "httptools"
+
+    @classmethod
+    def available(cls) -> bool:
+        return HTTPTOOLS_INSTALLED
+
+    def parse(self, head: bytes | bytearray) -> RequestHead:
+        collector = _HeadCollector()
+        parser = HttpRequestParser(collector)
+        try:
+            parser.feed_data(head)
+            parser.feed_data(b"\r\n\r\n")
+        except HttpParserUpgrade:
+            pass
+
+        protocol = f"HTTP/{parser.get_http_version()}"
+        if protocol == "HTTP/1.1":
+            keep_alive = True
+        elif protocol == "HTTP/1.0":
+            keep_alive = False
+        else:
+            raise ValueError(f"Unsupported protocol: {protocol}")
+
+        if collector.connection is not None:
+            keep_alive = collector.connection.lower() == "keep-alive"
+
+        return RequestHead(
+            parser.get_method().decode(),
+            collector.url.decode(errors="surrogateescape"),
+            protocol,
+            collector.headers,
+            collector.has_body,
+            keep_alive,
+        )
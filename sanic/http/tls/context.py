@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import ssl
 
+from collections import OrderedDict
 from collections.abc import Iterable
 from typing import Any
 
@@ -85,6 +86,9 @@ def load_cert_dir(p: str) -> ssl.SSLContext:
 def find_cert(self: CertSelector, server_name: str):
     """Find the first certificate that matches the given SNI.
 
+    The names are looked up in the index of the selector, and recent
+    results are kept in a small LRU cache.
+
     :raises ssl.CertificateError: No matching certificate found.
     :return: A matching ssl.SSLContext object if found."""
     if not server_name:
@@ -93,9 +97,17 @@ def find_cert(self: CertSelector, server_name: str):
         raise ValueError(
             "The client provided no SNI to match for certificate."
         )
-    for ctx in self.sanic_select:
-        if match_hostname(ctx, server_name):
-            return ctx
+    recent = self.sanic_recent
+    try:
+        ctx = recent[server_name]
+    except KeyError:
+        ctx = recent[server_name] = self.sanic_lookup(server_name)
+        if len(recent) > self.RECENT_SIZE:
+            recent.popitem(last=False)
+    else:
+        recent.move_to_end(server_name)
+    if ctx:
+        return ctx
     if self.sanic_fallback:
         return self.sanic_fallback
     raise ValueError(f"No certificate found matching hostname {server_name!r}")
@@ -184,8 +196,14 @@ class CertSelector(ssl.SSLContext):
     client is trying to access, via SSL SNI. Paths to certificate folders
     with privkey.pem and fullchain.pem in them should be provided, and
     will be matched in the order given whenever there is a new connection.
+
+    The names of the certificates are indexed once, in a dict of exact
+    names and a dict of wildcard suffixes, so that the time to select a
+    certificate does not grow with the number of certificates.
     """
 
+    RECENT_SIZE = 256
+
     def __new__(cls, ctxs):
         return super().__new__(cls)
 
@@ -194,12 +212,24 @@ class CertSelector(ssl.SSLContext):
         self.sni_callback = selector_sni_callback  # type: ignore
         self.sanic_select = []
         self.sanic_fallback = None
+        # Index of the first context in sanic_select that lists each name
+        self.sanic_names: dict[str, int] = {}
+        self.sanic_wildcards: dict[str, int] = {}
+        self.sanic_recent: OrderedDict[str, ssl.SSLContext | None] = (
+            OrderedDict()
+        )
         all_names = []
         for i, ctx in enumerate(ctxs):
             if not ctx:
                 continue
             names = dict(getattr(ctx, "sanic", {})).get("names", [])
             all_names += names
+            index = len(self.sanic_select)
+            for name in names:
+                if name.startswith("*."):
+                    self.sanic_wildcards.setdefault(name[2:], index)
+                else:
+                    self.sanic_names.setdefault(name, index)
             self.sanic_select.append(ctx)
             if i == 0:
                 self.sanic_fallback = ctx
@@ -208,3 +238,18 @@ class CertSelector(ssl.SSLContext):
                 "No certificates with SubjectAlternativeNames found."
             )
         logger.info(f"Certificate vhosts: {', '.join(all_names)}")
+
+    def sanic_lookup(self, hostname: str) -> ssl.SSLContext | None:
+        """The first context with a name that matches the hostname.
+
+        Like `match_hostname`, but using the index of the names."""
+        hostname = hostname.lower()
+        exact = self.sanic_names.get(hostname)
+        wildcard = self.sanic_wildcards.get(hostname.split(".", 1)[-1])
+        if exact is None:
+            if wildcard is None:
+                return None
+            return self.sanic_select[wildcard]
+        if wildcard is not None and wildcard < exact:
+            return self.sanic_select[wildcard]
+        return self.sanic_select[exact]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import tempfile
+
+from ssl import SSLContext
+from typing import TYPE_CHECKING, Any
+
+
+if TYPE_CHECKING:
+    from sanic.config import Config
+
+
+class SessionTickets:
+    """The resumption of the TLS sessions of a worker.
+
+    OpenSSL encrypts session tickets with a random key of each context, and
+    Python has no API to set that key. A session started over HTTP/1.1 can
+    therefore only be resumed by the worker that it started in. This keeps
+    the contexts of a worker, to report how many sessions were resumed.
+    """
+
+    __slots__ = ("contexts",)
+
+    def __init__(self) -> None:
+        self.contexts: list[SSLContext] = []
+
+    def install(self, ctx: SSLContext) -> None:
+        """Track the sessions of a context."""
+        self.contexts.append(ctx)
+
+    def info(self) -> dict[str, int]:
+        """The resumed sessions (``hits``) and full handshakes (``misses``)
+        of the contexts."""
+        hits = accepted = 0
+        for ctx in self.contexts:
+            stats = ctx.session_stats()
+            hits += stats["hits"]
+            accepted += stats["accept_good"]
+        return {"hits": hits, "misses": accepted - hits}
+
+
+def share_session_tickets(config: Config, http3: bool) -> dict[str, Any]:
+    """The config that the main process provides to its workers, so that
+    they share HTTP/3 session tickets.
+
+    Args:
+        config (Config): The config of the application.
+        http3 (bool): Whether HTTP/3 is served. Its tickets are stored in a
+            directory, which is created if it is not configured.
+
+    Returns:
+        Dict[str, Any]: The config to update the workers with.
+    """
+    if (
+        not config.TLS_SESSION_TICKETS_SHARED
+        or not http3
+        or config.TLS_SESSION_TICKET_DIRECTORY
+    ):
+        return {}
+    return {
+        "TLS_SESSION_TICKET_DIRECTORY": tempfile.mkdtemp(
+            prefix="sanic-tickets-"
+        )
+    }
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+
+from itertools import count
+from typing import Any
+
+from sanic.logging.filter import VerbosityFilter
+from sanic.logging.loggers import logger
+
+
+class ProtocolTracer:
+    """Log the protocol events of one connection.
+
+    A tracer only exists for connections that are traced, so call sites
+    check for it before building a message, and pass the arguments to be
+    formatted lazily by `logging`:
+
+    ```python
+    if self.trace:
+        self.trace("[send]: %d bytes, end_stream=%s", len(data), end_stream)
+    ```
+
+    All connections are traced at DEBUG level when the verbosity is 2 or
+    higher and the ``sanic.root`` logger is enabled for DEBUG. Otherwise, one
+    in every ``sample`` connections is traced at INFO level, so that tracing
+    can stay on in production.
+
+    Args:
+        level (int): The log level of the trace messages.
+        extra (Dict[str, Any]): Extra attributes for the log records.
+    """
+
+    _connections = count()
+    _sampled = count()
+
+    __slots__ = ("level", "extra", "prefix")
+
+    def __init__(self, level: int, extra: dict[str, int]) -> None:
+        self.level = level
+        self.extra = extra
+        self.prefix = f"[conn {next(ProtocolTracer._connections)}] "
+
+    @classmethod
+    def for_connection(cls, sample: int) -> ProtocolTracer | None:
+        """Create a tracer for a new connection, if it is to be traced.
+
+        Args:
+            sample (int): Trace one in this many connections. ``0`` disables
+                sampling.
+
+        Returns:
+            Optional[ProtocolTracer]: The tracer, or `None`.
+        """
+        if VerbosityFilter.verbosity >= 2 and logger.isEnabledFor(
+            logging.DEBUG
+        ):
+            return cls(logging.DEBUG, {"verbosity": 2})
+        if sample > 0 and next(cls._sampled) % sample == 0:
+            return cls(logging.INFO, {})
+        return None
+
+    @staticmethod
+    def describe(event: Any) -> str:
+        """Describe a protocol event without its payload.
+
+        Bytes and header lists are replaced by their length, so that tracing
+        a connection does not dump, or decode, the bodies it transfers.
+        """
+        fields = []
+        for name, value in getattr(event, "__dict__", {}).items():
+            if isinstance(value, (bytes, bytearray, list)):
+                value = f"<{len(value)}>"
+            fields.append(f"{name}={value}")
+        return f"{type(event).__name__}({', '.join(fields)})"
+
+    def __call__(self, msg: str, *args: Any) -> None:
+        logger.log(self.level, self.prefix + msg, *args, extra=self.extra)
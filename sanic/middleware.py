@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections import deque
 from collections.abc import Sequence
 from enum import IntEnum, auto
+from inspect import iscoroutinefunction
 from itertools import count
 
 from sanic.models.handler_types import MiddlewareType
@@ -28,7 +29,7 @@ class Middleware:
     _counter = count()
     count: int
 
-    __slots__ = ("func", "priority", "location", "definition")
+    __slots__ = ("func", "priority", "location", "definition", "is_coroutine")
 
     def __init__(
         self,
@@ -40,6 +41,7 @@ class Middleware:
         self.priority = priority
         self.location = location
         self.definition = next(Middleware._counter)
+        self.is_coroutine = iscoroutinefunction(func)
 
     def __call__(self, *args, **kwargs):
         return self.func(*args, **kwargs)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import gc
 import os
 import platform
 
@@ -12,12 +13,10 @@ from asyncio import (
     get_running_loop,
     new_event_loop,
 )
-from collections.abc import Mapping
 from contextlib import suppress
 from functools import partial
 from importlib import import_module
 from multiprocessing import (
-    Manager,
     Pipe,
     get_context,
     get_start_method,
@@ -25,9 +24,10 @@ from multiprocessing import (
 )
 from multiprocessing.context import BaseContext
 from pathlib import Path
+from shutil import rmtree
 from socket import SHUT_RDWR, socket
 from ssl import SSLContext
-from time import sleep
+from time import perf_counter, sleep
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -43,11 +43,12 @@ from sanic.application.motd import MOTD
 from sanic.application.state import ApplicationServerInfo, Mode, ServerStage
 from sanic.base.meta import SanicMeta
 from sanic.compat import OS_IS_WINDOWS, StartMethod
-from sanic.exceptions import ServerError, ServerKilled
+from sanic.exceptions import ServerKilled
 from sanic.helpers import Default, _default, is_atty
 from sanic.http.constants import HTTP
 from sanic.http.tls import get_ssl_context, process_to_context
 from sanic.http.tls.context import SanicSSLContext
+from sanic.http.tls.tickets import share_session_tickets
 from sanic.log import Colors, deprecation, error_logger, logger
 from sanic.logging.setup import setup_logging
 from sanic.models.handler_types import ListenerType
@@ -66,6 +67,7 @@ from sanic.worker.manager import WorkerManager
 from sanic.worker.multiplexer import WorkerMultiplexer
 from sanic.worker.reloader import Reloader
 from sanic.worker.serve import worker_serve
+from sanic.worker.state import SharedWorkerState
 
 
 if TYPE_CHECKING:
@@ -806,6 +808,8 @@ class StartupMixin(metaclass=SanicMeta):
                     ]
                 )
             display["auto-reload"] = reload_display
+        if self.config.PRELOAD_APP:
+            display["preload"] = "enabled"
 
         packages = []
         for package_name in SANIC_PACKAGES:
@@ -934,6 +938,24 @@ class StartupMixin(metaclass=SanicMeta):
                 raise
         cls.START_METHOD_SET = True
 
+    @classmethod
+    def _should_preload(cls, primary: Sanic) -> bool:
+        if not primary.config.PRELOAD_APP:
+            return False
+        if OS_IS_WINDOWS:
+            error_logger.warning(
+                "PRELOAD_APP requires the fork start method, which is not "
+                "available on Windows. Workers will load the app themselves."
+            )
+            return False
+        if cls.should_auto_reload():
+            error_logger.warning(
+                "PRELOAD_APP is ignored when auto-reload is enabled. Workers "
+                "will load the app themselves."
+            )
+            return False
+        return True
+
     @classmethod
     def _get_context(cls) -> BaseContext:
         method = cls._get_startup_method()
@@ -1023,28 +1045,14 @@ class StartupMixin(metaclass=SanicMeta):
             ) from None
 
         socks = []
-        try:
-            sync_manager = Manager()
-        except EOFError:
-            message = (
-                "Sanic server could not start: worker process failed.\n\n"
-                "This may have happened if you are running Sanic in the "
-                "global scope and not inside of a "
-                '`if __name__ == "__main__"` block.\n\nSee more information: '
-                "https://sanic.dev/en/guide/deployment/manager.html#"
-                "how-sanic-server-starts-processes\n"
-            )
-            if not OS_IS_WINDOWS:
-                message += (
-                    "\nAlternatively, you can set "
-                    '`Sanic.start_method = "fork"` at the start of your '
-                    "application to avoid this issue (Unix only).\n"
-                )
-            raise ServerError(message, quiet=True) from None
-        worker_state: Mapping[str, Any] = {"state": "NONE"}
+        preload = cls._should_preload(primary)
+        context = get_context("fork") if preload else cls._get_context()
+        worker_state = SharedWorkerState(context.Lock())
+        preloaded: list[Sanic] = []
         setup_ext(primary)
         exit_code = 0
         workers_started = False
+        shared_tickets: dict[str, Any] = {}
         try:
             primary_server_info.settings.pop("main_start", None)
             primary_server_info.settings.pop("main_stop", None)
@@ -1066,14 +1074,30 @@ class StartupMixin(metaclass=SanicMeta):
             ]
             primary_server_info.settings["run_multiple"] = True
             monitor_sub, monitor_pub = Pipe(True)
-            worker_state = sync_manager.dict()
             kwargs: dict[str, Any] = {
                 **primary_server_info.settings,
                 "monitor_publisher": monitor_pub,
                 "worker_state": worker_state,
             }
 
-            if not app_loader:
+            preload_time = None
+            if preload:
+                start = perf_counter()
+                preloaded = list(cls._app_registry.values())
+                for a in preloaded:
+                    a._preload()
+                preload_time = perf_counter() - start
+                logger.info(
+                    "Preloaded %s in %.3fs",
+                    ", ".join(a.name for a in preloaded),
+                    preload_time,
+                )
+                # Workers are forked from this process, and use the apps
+                # that were preloaded here instead of loading them again.
+                app_loader = AppLoader(
+                    factory=partial(cls.get_app, app.name)  # type: ignore
+                )
+            elif not app_loader:
                 if factory:
                     app_loader = AppLoader(factory=factory)
                 else:
@@ -1083,6 +1107,14 @@ class StartupMixin(metaclass=SanicMeta):
             kwargs["app_name"] = app.name
             kwargs["app_loader"] = app_loader
             kwargs["server_info"] = {}
+            shared_tickets = share_session_tickets(
+                app.config,
+                any(
+                    info.settings.get("version") is HTTP.VERSION_3
+                    for a in apps
+                    for info in a.state.server_info
+                ),
+            )
             kwargs["passthru"] = {
                 "auto_reload": app.auto_reload,
                 "state": {
@@ -1092,6 +1124,7 @@ class StartupMixin(metaclass=SanicMeta):
                 "config": {
                     "ACCESS_LOG": app.config.ACCESS_LOG,
                     "NOISY_EXCEPTIONS": app.config.NOISY_EXCEPTIONS,
+                    **shared_tickets,
                 },
                 "shared_ctx": app.shared_ctx.__dict__,
             }
@@ -1114,7 +1147,7 @@ class StartupMixin(metaclass=SanicMeta):
                 primary.state.workers,
                 worker_serve,
                 kwargs,
-                cls._get_context(),
+                context,
                 (monitor_pub, monitor_sub),
                 worker_state,
             )
@@ -1122,7 +1155,13 @@ class StartupMixin(metaclass=SanicMeta):
                 reload_dirs: set[Path] = primary.state.reload_dirs.union(
                     *(app.state.reload_dirs for app in apps)
                 )
-                reloader = Reloader(monitor_pub, 0, reload_dirs, app_loader)
+                reloader = Reloader(
+                    monitor_pub,
+                    0,
+                    reload_dirs,
+                    app_loader,
+                    primary.config.AUTO_RELOAD_WATCHER,
+                )
                 manager.manage("Reloader", reloader, {}, transient=False)
 
             inspector = None
@@ -1138,6 +1177,8 @@ class StartupMixin(metaclass=SanicMeta):
                     "packages": [sanic_version, *packages],
                     "extra": extra,
                 }
+                if preload_time is not None:
+                    app_info["preload"] = f"{preload_time:.3f}s"
                 inspector = primary.inspector_class(
                     monitor_pub,
                     app_info,
@@ -1156,6 +1197,13 @@ class StartupMixin(metaclass=SanicMeta):
             ready = primary.listeners["main_process_ready"]
             trigger_events(ready, loop, primary)
 
+            if preload:
+                # Move everything allocated so far out of the reach of the
+                # cyclic GC, so that collections in the workers do not write
+                # to (and un-share) the pages inherited from this process.
+                gc.collect()
+                gc.freeze()
+
             workers_started = True
             manager.run()
         except ServerKilled:
@@ -1166,6 +1214,10 @@ class StartupMixin(metaclass=SanicMeta):
             raise
         finally:
             logger.info("Server Stopped")
+            if preload:
+                gc.unfreeze()
+            for app in preloaded:
+                app.state.preloaded = False
             for app in apps:
                 app.state.server_info.clear()
                 app.router.reset()
@@ -1196,7 +1248,12 @@ class StartupMixin(metaclass=SanicMeta):
                             "Some processes may still be running."
                         )
                         break
-            sync_manager.shutdown()
+            worker_state.close()
+            if "TLS_SESSION_TICKET_DIRECTORY" in shared_tickets:
+                rmtree(
+                    shared_tickets["TLS_SESSION_TICKET_DIRECTORY"],
+                    ignore_errors=True,
+                )
             unix = kwargs.get("unix")
             if unix:
                 remove_unix_socket(unix)
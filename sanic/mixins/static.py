@@ -12,13 +12,13 @@ from sanic_routing.route import Route
 from sanic.base.meta import SanicMeta
 from sanic.compat import clear_function_annotate, stat_async
 from sanic.exceptions import FileNotFound, HeaderNotFound, RangeNotSatisfiable
-from sanic.handlers import ContentRangeHandler
+from sanic.handlers import ContentRangeHandler, StaticCache
 from sanic.handlers.directory import DirectoryHandler
 from sanic.log import error_logger
 from sanic.mixins.base import BaseMixin
 from sanic.models.futures import FutureStatic
 from sanic.request import Request
-from sanic.response import HTTPResponse, file, file_stream, validate_file
+from sanic.response import HTTPResponse, sendfile, validate_file
 from sanic.response.convenience import guess_content_type
 
 
@@ -65,12 +65,10 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
             use_content_range (bool, optional): If true, process header for
                 range requests and sends  the file part that is requested.
                 Defaults to `False`.
-            stream_large_files (Union[bool, int], optional): If `True`, use
-                the `StreamingHTTPResponse.file_stream` handler rather than
-                the `HTTPResponse.file handler` to send the file. If this
-                is an integer, it represents the threshold size to switch
-                to `StreamingHTTPResponse.file_stream`. Defaults to `False`,
-                which means that the response will not be streamed.
+            stream_large_files (Union[bool, int], optional): Kept for
+                compatibility and has no effect. Files are always sent with
+                `sendfile`, which never reads them into memory as a whole.
+                Defaults to `False`.
             name (str, optional): User-defined name used for url_for.
                 Defaults to `"static"`.
             host (Optional[str], optional): Host IP or FQDN for the
@@ -114,11 +112,6 @@ class StaticMixin(BaseMixin, metaclass=SanicMeta):
             ```python
             app.static('/static', 'path/to/static/directory')
             ```
-
-            Serving large files with a specific threshold:
-            ```python
-            app.static('/static', 'path/to/large/files', stream_large_files=1000000)
-            ```
         """  # noqa: E501
 
         name = self.generate_name(name)
@@ -275,6 +268,20 @@ class StaticHandleMixin(metaclass=SanicMeta):
         content_type: str | None = None,
         __file_uri__: str | None = None,
     ):
+        # Small files may be answered from memory, unless a range is wanted
+        cache: StaticCache | None = getattr(self, "static_cache", None)
+        if cache is not None and (
+            use_content_range and "range" in request.headers
+        ):
+            cache = None
+        cache_key = (file_or_directory, __file_uri__ or "", content_type)
+        if cache is not None:
+            asset = await cache.get(cache_key)
+            if asset is not None:
+                return await asset.respond(
+                    request, use_modified_since, use_content_range
+                )
+
         not_found = FileNotFound(
             "File not found",
             path=Path(file_or_directory),
@@ -291,6 +298,17 @@ class StaticHandleMixin(metaclass=SanicMeta):
         )
 
         try:
+            if cache is not None:
+                asset = await cache.load(
+                    cache_key,
+                    file_path,
+                    self._static_content_type(file_path, content_type),
+                )
+                if asset is not None:
+                    return await asset.respond(
+                        request, use_modified_since, use_content_range
+                    )
+
             headers = {}
             # Check if the client has been sent this file before
             # and it has not been modified since
@@ -321,32 +339,16 @@ class StaticHandleMixin(metaclass=SanicMeta):
                         headers.update(_range.headers)
 
             if "content-type" not in headers:
-                content_type = content_type or guess_content_type(file_path)
-
-                if "charset=" not in content_type and (
-                    content_type.startswith("text/")
-                    or content_type == "application/javascript"
-                ):
-                    content_type += "; charset=utf-8"
-
-                headers["Content-Type"] = content_type
+                headers["Content-Type"] = self._static_content_type(
+                    file_path, content_type
+                )
 
             if request.method == "HEAD":
                 return HTTPResponse(headers=headers)
             else:
-                if stream_large_files:
-                    if isinstance(stream_large_files, bool):
-                        threshold = 1024 * 1024
-                    else:
-                        threshold = stream_large_files
-
-                    if not stats:
-                        stats = await stat_async(file_path)
-                    if stats.st_size >= threshold:
-                        return await file_stream(
-                            file_path, headers=headers, _range=_range
-                        )
-                return await file(file_path, headers=headers, _range=_range)
+                return await sendfile(
+                    file_path, headers=headers, _range=_range
+                )
         except (IsADirectoryError, PermissionError):
             return await directory_handler.handle(request, request.path)
         except RangeNotSatisfiable:
@@ -361,6 +363,18 @@ class StaticHandleMixin(metaclass=SanicMeta):
             )
             raise
 
+    @staticmethod
+    def _static_content_type(
+        file_path: PathLike | str, content_type: str | None
+    ) -> str:
+        content_type = content_type or guess_content_type(file_path)
+        if "charset=" not in content_type and (
+            content_type.startswith("text/")
+            or content_type == "application/javascript"
+        ):
+            content_type += "; charset=utf-8"
+        return content_type
+
     async def _get_file_path(
         self,
         file_or_directory,
@@ -1,11 +1,22 @@
-from .form import File, parse_multipart_form
+from .form import (
+    File,
+    MultipartParser,
+    MultipartPart,
+    MultipartReader,
+    parse_multipart_form,
+    parse_multipart_stream,
+)
 from .parameters import RequestParameters
 from .types import Request
 
 
 __all__ = (
     "File",
+    "MultipartParser",
+    "MultipartPart",
+    "MultipartReader",
     "parse_multipart_form",
+    "parse_multipart_stream",
     "Request",
     "RequestParameters",
 )
@@ -3,7 +3,10 @@ from __future__ import annotations
 import email.utils
 import unicodedata
 
-from typing import NamedTuple
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from enum import Enum, auto
+from tempfile import SpooledTemporaryFile
+from typing import IO, Any, NamedTuple
 from urllib.parse import unquote
 
 from sanic.headers import parse_content_header
@@ -20,15 +23,220 @@ class File(NamedTuple):
 
     Args:
         type (str, optional): The mimetype, defaults to "text/plain".
-        body (bytes): Bytes of the file.
+        body (bytes): Bytes of the file. When the form was parsed with a
+            `spool_size`, this is a file object (a `SpooledTemporaryFile`)
+            positioned at the start of the file instead.
         name (str): The filename.
     """
 
     type: str
-    body: bytes
+    body: bytes | IO[bytes]
     name: str
 
 
+class MultipartEvent(Enum):
+    """Events produced by `MultipartParser.next_event`
+
+    | ``HEADERS``  Start of a part, with its raw header block
+    | ``DATA``  A piece of the body of the current part
+    | ``END``  End of the current part, with the last piece of its body
+    | ``CLOSE``  End of the multipart body
+    |
+    """
+
+    HEADERS = auto()
+    DATA = auto()
+    END = auto()
+    CLOSE = auto()
+
+
+class _ParserState(Enum):
+    PREAMBLE = auto()
+    DELIMITER = auto()
+    BODY = auto()
+    DONE = auto()
+
+
+class MultipartParser:
+    """Incremental parser for multipart/form-data bodies.
+
+    It does not perform any I/O. Body bytes are passed in with `feed` as
+    they arrive, and `next_event` returns the next parsed event, or `None`
+    when more data is needed. Part bodies are returned in pieces, so a part
+    never needs to be held in memory as a whole.
+
+    Parts are delimited by the bare boundary, and the four bytes in front of
+    it (normally ``\\r\\n--``) are dropped without being checked. This is
+    as lenient as `parse_multipart_form` has always been with clients that
+    get the dashes wrong.
+
+    Args:
+        boundary (bytes): The multipart boundary, as given in the
+            Content-Type header.
+        max_header_size (int | None): The maximum size of the headers of
+            one part. Defaults to `None`, which means no limit.
+    """
+
+    __slots__ = (
+        "_boundary",
+        "_buffer",
+        "_eof",
+        "_holdback",
+        "_state",
+        "max_header_size",
+    )
+
+    def __init__(self, boundary: bytes, max_header_size: int | None = None):
+        self._boundary = boundary
+        self._buffer = bytearray()
+        self._eof = False
+        # The start of a boundary and the four bytes in front of it
+        self._holdback = len(boundary) + 3
+        self._state = _ParserState.PREAMBLE
+        self.max_header_size = max_header_size
+
+    def feed(self, data: bytes) -> None:
+        """Add received body bytes to the parser."""
+        self._buffer += data
+
+    def feed_eof(self) -> None:
+        """Signal that the whole body has been fed to the parser."""
+        self._eof = True
+
+    def next_event(self) -> tuple[MultipartEvent, Any] | None:
+        """Parse the next event from the data received so far.
+
+        A body that ends in the middle of a part produces ``CLOSE`` without
+        an ``END`` for that part.
+
+        Raises:
+            ValueError: If the headers of a part are too large.
+
+        Returns:
+            tuple[MultipartEvent, Any] | None: The event and its value (the
+                raw header block for ``HEADERS``, bytes for ``DATA``), or
+                `None` if more data is needed.
+        """
+        buf = self._buffer
+        state = self._state
+
+        if state is _ParserState.PREAMBLE:
+            pos = buf.find(self._boundary)
+            if pos == -1:
+                del buf[: max(0, len(buf) - len(self._boundary) + 1)]
+                return self._need_data()
+            del buf[: pos + len(self._boundary)]
+            self._state = state = _ParserState.DELIMITER
+
+        if state is _ParserState.DELIMITER:
+            if buf[:2] == b"--":
+                return self._close()
+            pos = buf.find(b"\r\n\r\n")
+            if pos == -1:
+                if (
+                    self.max_header_size is not None
+                    and len(buf) > self.max_header_size
+                ):
+                    raise ValueError("Multipart part headers too large")
+                return self._need_data()
+            raw_headers = bytes(buf[2:pos])
+            del buf[: pos + 4]
+            self._state = _ParserState.BODY
+            return MultipartEvent.HEADERS, raw_headers
+
+        if state is _ParserState.BODY:
+            pos = buf.find(self._boundary)
+            if pos != -1:
+                data = bytes(buf[: max(0, pos - 4)])
+                del buf[: pos + len(self._boundary)]
+                self._state = _ParserState.DELIMITER
+                return MultipartEvent.END, data
+            pos = len(buf) - self._holdback
+            if pos <= 0:
+                return self._need_data()
+            data = bytes(buf[:pos])
+            del buf[:pos]
+            return MultipartEvent.DATA, data
+
+        return MultipartEvent.CLOSE, None
+
+    def _need_data(self) -> tuple[MultipartEvent, Any] | None:
+        return self._close() if self._eof else None
+
+    def _close(self) -> tuple[MultipartEvent, Any]:
+        self._state = _ParserState.DONE
+        self._buffer.clear()
+        return MultipartEvent.CLOSE, None
+
+
+class PartInfo(NamedTuple):
+    """Details parsed from the headers of a multipart part.
+
+    Args:
+        name (str | None): The form field name.
+        filename (str | None): The filename, if the part is a file.
+        content_type (str): The mimetype, defaults to "text/plain".
+        charset (str): The charset, defaults to "utf-8".
+    """
+
+    name: str | None
+    filename: str | None
+    content_type: str
+    charset: str
+
+
+def parse_part_headers(raw_headers: bytes) -> PartInfo:
+    """Parse the header block of a multipart part.
+
+    Args:
+        raw_headers (bytes): The header lines, separated by CRLF.
+
+    Returns:
+        PartInfo: The details of the part.
+    """
+    file_name = None
+    content_type = "text/plain"
+    content_charset = "utf-8"
+    field_name = None
+
+    for form_line in raw_headers.decode("utf-8").split("\r\n"):
+        if not form_line:
+            continue
+
+        colon_index = form_line.index(":")
+        idx = colon_index + 2
+        form_header_field = form_line[0:colon_index].lower()
+        form_header_value, form_parameters = parse_content_header(
+            form_line[idx:]
+        )
+
+        if form_header_field == "content-disposition":
+            field_name = form_parameters.get("name")
+            file_name = form_parameters.get("filename")
+
+            # non-ASCII filenames in RFC2231, "filename*" format
+            if file_name is None and form_parameters.get("filename*"):
+                encoding, _, value = email.utils.decode_rfc2231(
+                    form_parameters["filename*"]
+                )
+                file_name = unquote(value, encoding=encoding)
+
+            # Normalize to NFC (Apple MacOS/iOS send NFD)
+            # Notes:
+            # - No effect for Windows, Linux or Android clients which
+            #   already send NFC
+            # - Python open() is tricky (creates files in NFC no matter
+            #   which form you use)
+            if file_name is not None:
+                file_name = unicodedata.normalize("NFC", file_name)
+
+        elif form_header_field == "content-type":
+            content_type = form_header_value
+            content_charset = form_parameters.get("charset", "utf-8")
+
+    return PartInfo(field_name, file_name, content_type, content_charset)
+
+
 def parse_multipart_form(body, boundary):
     """Parse a request body and returns fields and files
 
@@ -39,76 +247,224 @@ def parse_multipart_form(body, boundary):
     Returns:
         tuple[RequestParameters, RequestParameters]: A tuple containing fields and files as `RequestParameters`.
     """  # noqa: E501
-    files = {}
-    fields = {}
-
-    form_parts = body.split(boundary)
-    for form_part in form_parts[1:-1]:
-        file_name = None
-        content_type = "text/plain"
-        content_charset = "utf-8"
-        field_name = None
-        line_index = 2
-        line_end_index = 0
-        while not line_end_index == -1:
-            line_end_index = form_part.find(b"\r\n", line_index)
-            form_line = form_part[line_index:line_end_index].decode("utf-8")
-            line_index = line_end_index + 2
-
-            if not form_line:
-                break
-
-            colon_index = form_line.index(":")
-            idx = colon_index + 2
-            form_header_field = form_line[0:colon_index].lower()
-            form_header_value, form_parameters = parse_content_header(
-                form_line[idx:]
-            )
-
-            if form_header_field == "content-disposition":
-                field_name = form_parameters.get("name")
-                file_name = form_parameters.get("filename")
-
-                # non-ASCII filenames in RFC2231, "filename*" format
-                if file_name is None and form_parameters.get("filename*"):
-                    encoding, _, value = email.utils.decode_rfc2231(
-                        form_parameters["filename*"]
-                    )
-                    file_name = unquote(value, encoding=encoding)
-
-                # Normalize to NFC (Apple MacOS/iOS send NFD)
-                # Notes:
-                # - No effect for Windows, Linux or Android clients which
-                #   already send NFC
-                # - Python open() is tricky (creates files in NFC no matter
-                #   which form you use)
-                if file_name is not None:
-                    file_name = unicodedata.normalize("NFC", file_name)
-
-            elif form_header_field == "content-type":
-                content_type = form_header_value
-                content_charset = form_parameters.get("charset", "utf-8")
-
-        if field_name:
-            post_data = form_part[line_index:-4]
-            if file_name is None:
-                value = post_data.decode(content_charset)
-                if field_name in fields:
-                    fields[field_name].append(value)
-                else:
-                    fields[field_name] = [value]
+    fields: dict[str, list[str]] = {}
+    files: dict[str, list[File]] = {}
+
+    parser = MultipartParser(boundary)
+    parser.feed(body)
+    parser.feed_eof()
+
+    info: PartInfo | None = None
+    chunks: list[bytes] = []
+    while True:
+        event, value = parser.next_event()  # type: ignore
+        if event is MultipartEvent.HEADERS:
+            info, chunks = parse_part_headers(value), []
+        elif event is MultipartEvent.DATA:
+            chunks.append(value)
+        elif event is MultipartEvent.END and info is not None:
+            chunks.append(value)
+            _add_part(fields, files, info, b"".join(chunks))
+        elif event is MultipartEvent.CLOSE:
+            break
+
+    return RequestParameters(fields), RequestParameters(files)
+
+
+def _add_part(
+    fields: dict[str, list[str]],
+    files: dict[str, list[File]],
+    info: PartInfo,
+    body: bytes | IO[bytes],
+) -> None:
+    if not info.name:
+        logger.debug(
+            "Form-data field does not have a 'name' parameter "
+            "in the Content-Disposition header"
+        )
+    elif info.filename is None:
+        value = body.decode(info.charset)  # type: ignore
+        fields.setdefault(info.name, []).append(value)
+    else:
+        form_file = File(type=info.content_type, name=info.filename, body=body)
+        files.setdefault(info.name, []).append(form_file)
+
+
+class MultipartPart:
+    """A part of a multipart/form-data body that is being received.
+
+    Iterate over the part to receive its body in pieces as they arrive, or
+    use `read` to receive all of it at once. Parts must be consumed in
+    order; moving on to the next part skips whatever is left of this one.
+    """
+
+    __slots__ = ("info", "_reader", "_done")
+
+    def __init__(self, reader: MultipartReader, info: PartInfo) -> None:
+        self.info = info
+        self._reader = reader
+        self._done = False
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__name__}: name={self.name!r} "
+            f"filename={self.filename!r}>"
+        )
+
+    @property
+    def name(self) -> str | None:
+        """The form field name"""
+        return self.info.name
+
+    @property
+    def filename(self) -> str | None:
+        """The filename, if the part is a file upload"""
+        return self.info.filename
+
+    @property
+    def content_type(self) -> str:
+        """The mimetype of the part"""
+        return self.info.content_type
+
+    @property
+    def charset(self) -> str:
+        """The charset of the part"""
+        return self.info.charset
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
+
+    async def __anext__(self) -> bytes:
+        while not self._done:
+            event, value = await self._reader._next_event()
+            if event is MultipartEvent.CLOSE:
+                raise ValueError("Unexpected end of multipart body")
+            self._done = event is MultipartEvent.END
+            if value:
+                return value
+        raise StopAsyncIteration
+
+    async def read(self) -> bytes:
+        """Receive the rest of the body of the part.
+
+        Returns:
+            bytes: The body of the part.
+        """
+        return b"".join([data async for data in self])
+
+
+class MultipartReader:
+    """Asynchronously iterate over the parts of a multipart/form-data body.
+
+    The body is parsed incrementally as it is received from the stream, so
+    it never needs to be held in memory as a whole.
+
+    Args:
+        stream (AsyncIterable[bytes]): The request body stream, usually
+            `request.stream`.
+        boundary (bytes): The multipart boundary, as given in the
+            Content-Type header.
+        max_header_size (int): The maximum size of the headers of one part.
+            Defaults to 16384 bytes.
+
+    Raises:
+        ValueError: If the body ends in the middle of a part or the headers
+            of a part are too large.
+
+    Examples:
+        ```python
+        @app.post("/upload", stream=True)
+        async def upload(request):
+            async for part in request.multipart():
+                async for chunk in part:
+                    ...
+        ```
+    """
+
+    __slots__ = ("_parser", "_chunks", "_part")
+
+    def __init__(
+        self,
+        stream: AsyncIterable[bytes],
+        boundary: bytes,
+        max_header_size: int = 16_384,
+    ):
+        self._parser = MultipartParser(boundary, max_header_size)
+        self._chunks = stream.__aiter__()
+        self._part: MultipartPart | None = None
+
+    def __aiter__(self) -> AsyncIterator[MultipartPart]:
+        return self
+
+    async def __anext__(self) -> MultipartPart:
+        if self._part is not None:
+            async for _ in self._part:
+                pass
+            self._part = None
+
+        while True:
+            event, value = await self._next_event()
+            if event is MultipartEvent.HEADERS:
+                self._part = MultipartPart(self, parse_part_headers(value))
+                return self._part
+            if event is MultipartEvent.CLOSE:
+                raise StopAsyncIteration
+
+    async def _next_event(self) -> tuple[MultipartEvent, Any]:
+        parser = self._parser
+        while (event := parser.next_event()) is None:
+            try:
+                data = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                parser.feed_eof()
             else:
-                form_file = File(
-                    type=content_type, name=file_name, body=post_data
-                )
-                if field_name in files:
-                    files[field_name].append(form_file)
-                else:
-                    files[field_name] = [form_file]
-        else:
-            logger.debug(
-                "Form-data field does not have a 'name' parameter "
-                "in the Content-Disposition header"
-            )
+                parser.feed(data)
+        return event
+
+
+async def parse_multipart_stream(
+    stream: AsyncIterable[bytes],
+    boundary: bytes,
+    spool_size: int | None = None,
+) -> tuple[RequestParameters, RequestParameters]:
+    """Parse a streamed request body and return fields and files
+
+    Args:
+        stream (AsyncIterable[bytes]): The request body stream.
+        boundary (bytes): Bytes multipart boundary.
+        spool_size (int | None): If set, files are written to a
+            `SpooledTemporaryFile` that moves to disk once it exceeds this
+            many bytes, and `File.body` is that file object. Defaults to
+            `None`, which keeps files in memory as bytes.
+
+    Returns:
+        tuple[RequestParameters, RequestParameters]: A tuple containing fields and files as `RequestParameters`.
+    """  # noqa: E501
+    fields: dict[str, list[str]] = {}
+    files: dict[str, list[File]] = {}
+
+    spooled: list[IO[bytes]] = []
+    try:
+        async for part in MultipartReader(stream, boundary):
+            body: bytes | IO[bytes]
+            if spool_size is None or part.filename is None:
+                body = await part.read()
+            else:
+                body = SpooledTemporaryFile(max_size=spool_size)
+                spooled.append(body)
+                async for data in part:
+                    body.write(data)
+                body.seek(0)
+            _add_part(fields, files, part.info, body)
+    except BaseException:
+        close_files(spooled)
+        raise
 
     return RequestParameters(fields), RequestParameters(files)
+
+
+def close_files(bodies: Iterable[bytes | IO[bytes]]) -> None:
+    """Close the file objects among the bodies of uploaded files."""
+    for body in bodies:
+        if not isinstance(body, bytes):
+            body.close()
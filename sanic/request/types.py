@@ -57,7 +57,12 @@ from sanic.log import error_logger
 from sanic.models.protocol_types import TransportProtocol
 from sanic.response import BaseHTTPResponse, HTTPResponse
 
-from .form import parse_multipart_form
+from .form import (
+    MultipartReader,
+    close_files,
+    parse_multipart_form,
+    parse_multipart_stream,
+)
 from .parameters import RequestParameters
 
 
@@ -104,6 +109,7 @@ class Request(Generic[sanic_type, ctx_type]):
         "__weakref__",
         "_cookies",
         "_ctx",
+        "_form_streamed",
         "_id",
         "_ip",
         "_parsed_url",
@@ -117,6 +123,9 @@ class Request(Generic[sanic_type, ctx_type]):
         "_stream_id",
         "_match_info",
         "_name",
+        "_parsed_args",
+        "_parsed_not_grouped_args",
+        "_path",
         "app",
         "body",
         "conn_info",
@@ -124,14 +133,12 @@ class Request(Generic[sanic_type, ctx_type]):
         "headers",
         "method",
         "parsed_accept",
-        "parsed_args",
         "parsed_cookies",
         "parsed_credentials",
         "parsed_files",
         "parsed_form",
         "parsed_forwarded",
         "parsed_json",
-        "parsed_not_grouped_args",
         "parsed_token",
         "raw_url",
         "responded",
@@ -163,7 +170,10 @@ class Request(Generic[sanic_type, ctx_type]):
         self._stream_id = stream_id
         self.app = app
 
-        self.headers = Header(headers)
+        # A Header built by the protocol is adopted as is, not copied
+        self.headers = (
+            headers if isinstance(headers, Header) else Header(headers)
+        )
         self.version = version
         self.method = method
         self.transport = transport
@@ -174,18 +184,21 @@ class Request(Generic[sanic_type, ctx_type]):
         self.conn_info: ConnInfo | None = None
         self._ctx: ctx_type | None = None
         self.parsed_accept: AcceptList | None = None
-        self.parsed_args: defaultdict[
-            tuple[bool, bool, str, str], RequestParameters
-        ] = defaultdict(RequestParameters)
+        self._parsed_args: (
+            defaultdict[tuple[bool, bool, str, str], RequestParameters] | None
+        ) = None
         self.parsed_cookies: RequestParameters | None = None
         self.parsed_credentials: Credentials | None = None
         self.parsed_files: RequestParameters | None = None
         self.parsed_form: RequestParameters | None = None
+        self._form_streamed = False
         self.parsed_forwarded: Options | None = None
         self.parsed_json = None
-        self.parsed_not_grouped_args: defaultdict[
-            tuple[bool, bool, str, str], list[tuple[str, str]]
-        ] = defaultdict(list)
+        self._parsed_not_grouped_args: (
+            defaultdict[tuple[bool, bool, str, str], list[tuple[str, str]]]
+            | None
+        ) = None
+        self._path: str | None = None
         self.parsed_token: str | None = None
         self._request_middleware_started = False
         self._response_middleware_started = False
@@ -418,7 +431,11 @@ class Request(Generic[sanic_type, ctx_type]):
         streaming and non-streaming routes.
         """
         if not self.body:
-            self.body = b"".join([data async for data in self.stream])
+            spool_size = self.app.config.MULTIPART_SPOOL_SIZE
+            if spool_size is not None and self._multipart_boundary():
+                await self.receive_form(spool_size)
+            else:
+                self.body = b"".join([data async for data in self.stream])
 
     @property
     def name(self) -> str | None:
@@ -639,6 +656,8 @@ class Request(Generic[sanic_type, ctx_type]):
         Returns:
             RequestParameters | None: The parsed form data.
         """  # noqa: E501
+        if self._form_streamed:
+            return self.parsed_form
         self.parsed_form = RequestParameters()
         self.parsed_files = RequestParameters()
         content_type = self.headers.getone(
@@ -654,7 +673,6 @@ class Request(Generic[sanic_type, ctx_type]):
                     )
                 )
             elif content_type == "multipart/form-data":
-                # TODO: Stream this instead of reading to/from memory
                 boundary = parameters["boundary"].encode(  # type: ignore
                     "utf-8"
                 )  # type: ignore
@@ -666,6 +684,89 @@ class Request(Generic[sanic_type, ctx_type]):
 
         return self.parsed_form
 
+    def _multipart_boundary(self) -> bytes | None:
+        content_type, parameters = parse_content_header(
+            self.headers.getone("content-type", DEFAULT_HTTP_CONTENT_TYPE)
+        )
+        if content_type != "multipart/form-data":
+            return None
+        boundary = parameters.get("boundary")
+        return str(boundary).encode("utf-8") if boundary else None
+
+    def multipart(self) -> MultipartReader:
+        """Iterate over the parts of a multipart/form-data body as it arrives.
+
+        This is meant for streaming handlers (``stream=True``), where the
+        body has not been received yet. Each part is itself an async
+        iterator over its body, so large uploads are never held in memory.
+
+        Raises:
+            BadRequest: If the request is not a multipart/form-data request.
+
+        Returns:
+            MultipartReader: An async iterator of `MultipartPart` objects.
+
+        Examples:
+            ```python
+            @app.post("/upload", stream=True)
+            async def upload(request):
+                async for part in request.multipart():
+                    if part.filename:
+                        async with aiofiles.open(part.filename, "wb") as f:
+                            async for chunk in part:
+                                await f.write(chunk)
+            ```
+        """  # noqa: E501
+        boundary = self._multipart_boundary()
+        if not boundary or self.stream is None:
+            raise BadRequest("Expected a multipart/form-data request body")
+        return MultipartReader(self.stream, boundary)
+
+    async def receive_form(
+        self, spool_size: int | None = None
+    ) -> RequestParameters | None:
+        """Receive and parse a multipart/form-data body from the stream.
+
+        Unlike `get_form`, the body is parsed incrementally as it arrives and
+        is never buffered in `request.body`. The results are available from
+        `request.form` and `request.files` afterwards. Other content types
+        are received in full and parsed with `get_form`.
+
+        Args:
+            spool_size (int | None): If set, uploaded files are written to a
+                `SpooledTemporaryFile` that moves to disk once it exceeds
+                this many bytes, and `File.body` is that file object. The
+                files are closed when the request has been handled.
+                Defaults to `None`, which keeps files in memory as bytes.
+
+        Raises:
+            BadRequest: If the multipart body is malformed.
+
+        Returns:
+            RequestParameters | None: The parsed form data.
+        """  # noqa: E501
+        boundary = self._multipart_boundary()
+        if not boundary or self.body or self.stream is None:
+            if self.stream is not None:
+                await self.receive_body()
+            return self.get_form()
+        try:
+            form, files = await parse_multipart_stream(
+                self.stream, boundary, spool_size
+            )
+        except ValueError as e:
+            raise BadRequest("Failed when parsing form") from e
+        self.parsed_form, self.parsed_files = form, files
+        self._form_streamed = True
+        return self.parsed_form
+
+    def _close_files(self) -> None:
+        # Spooled uploads are closed, and removed from disk, once the
+        # request has been handled
+        if self._form_streamed and self.parsed_files:
+            for files in self.parsed_files.values():
+                close_files(file.body for file in files)
+
     @property
     def form(self) -> RequestParameters | None:
         """The request body parsed as form data
@@ -745,6 +846,25 @@ class Request(Generic[sanic_type, ctx_type]):
             (keep_blank_values, strict_parsing, encoding, errors)
         ]
 
+    @property
+    def parsed_args(
+        self,
+    ) -> defaultdict[tuple[bool, bool, str, str], RequestParameters]:
+        """The results of `get_args`, by its arguments.
+
+        Created when it is first used.
+        """
+        if self._parsed_args is None:
+            self._parsed_args = defaultdict(RequestParameters)
+        return self._parsed_args
+
+    @parsed_args.setter
+    def parsed_args(
+        self,
+        value: defaultdict[tuple[bool, bool, str, str], RequestParameters],
+    ) -> None:
+        self._parsed_args = value
+
     args = property(get_args)
     """Convenience property to access `Request.get_args` with default values.
     """
@@ -802,6 +922,25 @@ class Request(Generic[sanic_type, ctx_type]):
             (keep_blank_values, strict_parsing, encoding, errors)
         ]
 
+    @property
+    def parsed_not_grouped_args(
+        self,
+    ) -> defaultdict[tuple[bool, bool, str, str], list[tuple[str, str]]]:
+        """The results of `get_query_args`, by its arguments.
+
+        Created when it is first used.
+        """
+        if self._parsed_not_grouped_args is None:
+            self._parsed_not_grouped_args = defaultdict(list)
+        return self._parsed_not_grouped_args
+
+    @parsed_not_grouped_args.setter
+    def parsed_not_grouped_args(
+        self,
+        value: defaultdict[tuple[bool, bool, str, str], list[tuple[str, str]]],
+    ) -> None:
+        self._parsed_not_grouped_args = value
+
     query_args = property(get_query_args)
     """Convenience property to access `Request.get_query_args` with default values.
     """  # noqa: E501
@@ -885,7 +1024,9 @@ class Request(Generic[sanic_type, ctx_type]):
         Returns:
             str: Path of the local HTTP request
         """
-        return self._parsed_url.path.decode("utf-8")
+        if self._path is None:
+            self._path = self._parsed_url.path.decode("utf-8")
+        return self._path
 
     @property
     def network_paths(self) -> list[Any] | None:
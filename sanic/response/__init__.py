@@ -6,11 +6,13 @@ from .convenience import (
     json,
     raw,
     redirect,
+    sendfile,
     text,
     validate_file,
 )
 from .types import (
     BaseHTTPResponse,
+    FileResponse,
     HTTPResponse,
     JSONResponse,
     ResponseStream,
@@ -20,6 +22,7 @@ from .types import (
 
 __all__ = (
     "BaseHTTPResponse",
+    "FileResponse",
     "HTTPResponse",
     "JSONResponse",
     "ResponseStream",
@@ -32,5 +35,6 @@ __all__ = (
     "file",
     "redirect",
     "file_stream",
+    "sendfile",
     "json_dumps",
 )
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from email.utils import formatdate, parsedate_to_datetime
+from errno import EISDIR
 from mimetypes import guess_type
 from os import path
 from pathlib import PurePath
+from stat import S_ISDIR
 from time import time
 from typing import Any, AnyStr, Callable
 from urllib.parse import quote_plus
@@ -15,7 +17,7 @@ from sanic.helpers import Default, _default
 from sanic.log import logger
 from sanic.models.protocol_types import HTMLProtocol, Range
 
-from .types import HTTPResponse, JSONResponse, ResponseStream
+from .types import FileResponse, HTTPResponse, JSONResponse, ResponseStream
 
 
 def empty(
@@ -203,6 +205,42 @@ async def validate_file(
     return None
 
 
+def _file_headers(
+    headers: dict[str, str] | None,
+    last_modified: float | int | None,
+    filename: str | None,
+    max_age: float | int | None,
+    no_store: bool | None,
+) -> dict[str, str]:
+    headers = headers or {}
+    if last_modified:
+        headers.setdefault(
+            "Last-Modified", formatdate(last_modified, usegmt=True)
+        )
+
+    if filename:
+        headers.setdefault(
+            "Content-Disposition", f'attachment; filename="{filename}"'
+        )
+
+    if no_store:
+        cache_control = "no-store"
+    elif max_age:
+        cache_control = f"public, max-age={max_age}"
+        headers.setdefault(
+            "expires",
+            formatdate(
+                time() + max_age,
+                usegmt=True,
+            ),
+        )
+    else:
+        cache_control = "no-cache"
+
+    headers.setdefault("cache-control", cache_control)
+    return headers
+
+
 async def file(
     location: str | PurePath,
     status: int = 200,
@@ -250,33 +288,9 @@ async def file(
         if response:
             return response
 
-    headers = headers or {}
-    if last_modified:
-        headers.setdefault(
-            "Last-Modified", formatdate(last_modified, usegmt=True)
-        )
-
-    if filename:
-        headers.setdefault(
-            "Content-Disposition", f'attachment; filename="{filename}"'
-        )
-
-    if no_store:
-        cache_control = "no-store"
-    elif max_age:
-        cache_control = f"public, max-age={max_age}"
-        headers.setdefault(
-            "expires",
-            formatdate(
-                time() + max_age,
-                usegmt=True,
-            ),
-        )
-    else:
-        cache_control = "no-cache"
-
-    headers.setdefault("cache-control", cache_control)
-
+    headers = _file_headers(
+        headers, last_modified, filename, max_age, no_store
+    )
     filename = filename or path.split(location)[-1]
 
     async with await open_async(location, mode="rb") as f:
@@ -301,6 +315,88 @@ async def file(
     )
 
 
+async def sendfile(
+    location: str | PurePath,
+    status: int = 200,
+    request_headers: Header | None = None,
+    validate_when_requested: bool = True,
+    mime_type: str | None = None,
+    headers: dict[str, str] | None = None,
+    filename: str | None = None,
+    last_modified: datetime | float | int | Default | None = _default,
+    max_age: float | int | None = None,
+    no_store: bool | None = None,
+    chunk_size: int = 65536,
+    _range: Range | None = None,
+) -> FileResponse | HTTPResponse:
+    """Return a response object that sends the file without reading it into memory.
+
+    Like `file`, but the body is sent from the file when the response is
+    sent, with ``sendfile`` where the connection allows it. Use this for
+    large files.
+
+    Args:
+        location (Union[str, PurePath]): Location of file on system.
+        status (int, optional): HTTP response code. Won't enforce the passed in status if only a part of the content will be sent (206) or file is being validated (304). Defaults to 200.
+        request_headers (Optional[Header], optional): The request headers.
+        validate_when_requested (bool, optional): If `True`, will validate the file when requested. Defaults to True.
+        mime_type (Optional[str], optional): Specific mime_type.
+        headers (Optional[Dict[str, str]], optional): Custom Headers.
+        filename (Optional[str], optional): Override filename.
+        last_modified (Optional[Union[datetime, float, int, Default]], optional): The last modified date and time of the file.
+        max_age (Optional[Union[float, int]], optional): Max age for cache control.
+        no_store (Optional[bool], optional): Any cache should not store this response. Defaults to None.
+        chunk_size (int, optional): The size of each chunk when the file cannot be sent with ``sendfile``. Defaults to `65536`.
+        _range (Optional[Range], optional): The range of bytes to send.
+
+    Returns:
+        Union[FileResponse, HTTPResponse]: The response object, or an empty ``304`` response if the file was not modified.
+    """  # noqa: E501
+    stat = await stat_async(location)
+    if S_ISDIR(stat.st_mode):
+        # Raise now, the file is only opened once the response is sent
+        raise IsADirectoryError(EISDIR, "Is a directory", str(location))
+    if isinstance(last_modified, datetime):
+        last_modified = last_modified.replace(microsecond=0).timestamp()
+    elif isinstance(last_modified, Default):
+        last_modified = stat.st_mtime
+
+    if (
+        validate_when_requested
+        and request_headers is not None
+        and last_modified
+    ):
+        response = await validate_file(request_headers, last_modified)
+        if response:
+            return response
+
+    headers = _file_headers(
+        headers, last_modified, filename, max_age, no_store
+    )
+    filename = filename or path.split(location)[-1]
+
+    offset, size = 0, stat.st_size
+    if _range:
+        offset, size = _range.start, _range.size
+        headers["Content-Range"] = (
+            f"bytes {_range.start}-{_range.end}/{_range.total}"
+        )
+        status = 206
+
+    content_type = mime_type or guess_content_type(
+        filename, fallback="text/plain; charset=utf-8"
+    )
+    return FileResponse(
+        location,
+        size,
+        offset=offset,
+        status=status,
+        headers=headers,
+        content_type=content_type,
+        chunk_size=chunk_size,
+    )
+
+
 def redirect(
     to: str,
     headers: dict[str, str] | None = None,
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from collections.abc import Coroutine, Iterator
 from datetime import datetime
+from pathlib import PurePath
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,7 +11,7 @@ from typing import (
     TypeVar,
 )
 
-from sanic.compat import Header
+from sanic.compat import Header, open_async
 from sanic.cookies import CookieJar
 from sanic.cookies.response import Cookie, SameSite
 from sanic.exceptions import SanicException, ServerError
@@ -475,6 +476,84 @@ class JSONResponse(HTTPResponse):
         return value
 
 
+class FileResponse(BaseHTTPResponse):
+    """HTTP response with a body that is sent straight from a file.
+
+    The file is never read into memory as a whole. Over HTTP/1.1 on a plain
+    TCP connection it is sent with ``sendfile``, if the event loop supports
+    it. Otherwise (TLS, HTTP/3, ASGI, or uvloop) it is read and sent in
+    chunks, with the same backpressure as any other streamed response.
+
+    Args:
+        location (Union[str, PurePath]): Location of file on system.
+        size (int): The number of bytes to send, used as Content-Length.
+        offset (int, optional): Where in the file to start. Defaults to `0`.
+        status (int, optional): HTTP response code. Defaults to `200`.
+        headers (Optional[Union[Header, Dict[str, str]]], optional): Headers to be returned. Defaults to `None`.
+        content_type (Optional[str], optional): Content type to be returned (as a header). Defaults to `None`.
+        chunk_size (int, optional): The size of each chunk when the file cannot be sent with ``sendfile``. Defaults to `65536`.
+    """  # noqa: E501
+
+    __slots__ = ("location", "offset", "size", "chunk_size", "_body_sent")
+
+    def __init__(
+        self,
+        location: str | PurePath,
+        size: int,
+        offset: int = 0,
+        status: int = 200,
+        headers: Header | dict[str, str] | None = None,
+        content_type: str | None = None,
+        chunk_size: int = 65536,
+    ):
+        super().__init__()
+
+        self.location = location
+        self.offset = offset
+        self.size = size
+        self.chunk_size = chunk_size
+        self.content_type = content_type
+        self.status = status
+        self.headers = Header(headers or {})
+        self.headers["content-length"] = str(size)
+        self._body_sent = False
+
+    async def send(
+        self,
+        data: AnyStr | None = None,
+        end_stream: bool | None = None,
+    ) -> None:
+        """Send the response headers and the file, if not already sent.
+
+        Args:
+            data (Optional[AnyStr], optional): str or bytes to be written. Defaults to `None`.
+            end_stream (Optional[bool], optional): whether to close the stream after this block. Defaults to `None`.
+        """  # noqa: E501
+        if data is not None or self._body_sent:
+            return await super().send(data, end_stream)
+        self._body_sent = True
+
+        await super().send(b"", end_stream=False)
+        if self.stream is None or self.stream.send is None:
+            return
+        send_file = getattr(self.stream, "send_file", None)
+        if send_file and await send_file(
+            self.location, self.offset, self.size
+        ):
+            return
+
+        async with await open_async(self.location, mode="rb") as f:
+            await f.seek(self.offset)
+            to_send = self.size
+            while to_send > 0:
+                content = await f.read(min(to_send, self.chunk_size))
+                if not content:
+                    break
+                to_send -= len(content)
+                await super().send(content, end_stream=to_send <= 0)
+        await super().send(end_stream=True)
+
+
 class ResponseStream:
     """A compat layer to bridge the gap after the deprecation of StreamingHTTPResponse.
 
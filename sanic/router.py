@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from collections import OrderedDict
 from collections.abc import Iterable
 from functools import lru_cache
-from inspect import signature
+from inspect import iscoroutinefunction, signature
 from typing import Any
+from urllib.parse import urlencode, urlunparse
 from uuid import UUID
 
 from sanic_routing import BaseRouter
@@ -14,7 +16,12 @@ from sanic_routing.route import Route
 
 from sanic.constants import HTTP_METHODS
 from sanic.errorpages import check_error_format
-from sanic.exceptions import MethodNotAllowed, NotFound, SanicException
+from sanic.exceptions import (
+    MethodNotAllowed,
+    NotFound,
+    SanicException,
+    URLBuildError,
+)
 from sanic.models.handler_types import RouteHandler
 
 
@@ -22,15 +29,289 @@ ROUTER_CACHE_SIZE = 1024
 ALLOWED_LABELS = ("__file_uri__",)
 
 
+RouteResult = tuple[Route, RouteHandler, dict[str, Any]]
+RouteCacheKey = tuple[str, str, str | None]
+
+
+class RouteCache:
+    """Cache of resolved routes used by `Router.get`.
+
+    Results for routes without path parameters are kept in an exact match
+    dictionary that is never evicted, since there is a fixed number of them.
+    Results for dynamic routes are kept in a separate bounded LRU so that
+    many unique paths like `/user/<id>` cannot push out the static routes.
+
+    Args:
+        maxsize (int): The maximum number of dynamic results to keep. Use
+            `0` to disable the cache entirely.
+    """
+
+    __slots__ = (
+        "maxsize",
+        "static",
+        "dynamic",
+        "static_hits",
+        "hits",
+        "misses",
+        "evictions",
+    )
+
+    def __init__(self, maxsize: int = ROUTER_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self.static: dict[RouteCacheKey, RouteResult] = {}
+        self.dynamic: OrderedDict[RouteCacheKey, RouteResult] = OrderedDict()
+        self.static_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: RouteCacheKey) -> RouteResult | None:
+        result = self.static.get(key)
+        if result is not None:
+            self.static_hits += 1
+            return result
+        result = self.dynamic.get(key)
+        if result is None:
+            self.misses += 1
+            return None
+        self.dynamic.move_to_end(key)
+        self.hits += 1
+        return result
+
+    def add(self, key: RouteCacheKey, result: RouteResult, static: bool):
+        if self.maxsize <= 0:
+            return
+        if static:
+            self.static[key] = result
+        else:
+            self.dynamic[key] = result
+            if len(self.dynamic) > self.maxsize:
+                self.dynamic.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Remove all cached results, but keep the counters."""
+        self.static.clear()
+        self.dynamic.clear()
+
+    def info(self) -> dict[str, int]:
+        """Return the size of the cache and its hit/miss counters.
+
+        Returns:
+            Dict[str, int]: The cache statistics.
+        """
+        return {
+            "maxsize": self.maxsize,
+            "static_size": len(self.static),
+            "dynamic_size": len(self.dynamic),
+            "static_hits": self.static_hits,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class URLBuilder:
+    """Build the URLs of a route for `Sanic.url_for`.
+
+    The path of the route is split into its segments once, so that building
+    a URL only validates the values of its parameters and joins the
+    segments. The URLs of routes without parameters, built without query
+    arguments, are memoised, up to `MEMO_SIZE` of them per route.
+
+    Args:
+        route (Route): A finalized route.
+    """
+
+    MEMO_SIZE = 64
+
+    __slots__ = (
+        "file_uri",
+        "hosts",
+        "memo",
+        "params",
+        "path",
+        "prefix",
+        "segments",
+        "static",
+        "websocket",
+    )
+
+    def __init__(self, route: Route) -> None:
+        uri = route.path
+        segments = list(route.parts)
+        if (
+            uri != "/"
+            and uri.endswith("/")
+            and not route.strict
+            and not route.raw_path[:-1]
+        ):
+            uri = uri[:-1]
+            segments.pop()
+        self.prefix = "" if uri.startswith("/") else "/"
+        self.path = f"{self.prefix}{uri}"
+        self.segments = segments
+        self.params = tuple(
+            (
+                index,
+                param,
+                param.pattern[1]
+                if isinstance(param.pattern, tuple)
+                else param.pattern,
+            )
+            for index, param in route.params.items()
+        )
+        self.static = bool(getattr(route.extra, "static", None))
+        self.file_uri = "__file_uri__" in uri
+        self.hosts = getattr(route.extra, "hosts", None)
+        self.websocket = getattr(route.extra, "websocket", False)
+        self.memo: dict[tuple[str, str, str], str] = {}
+
+    def build(self, kwargs: dict[str, Any], server_name: str = "") -> str:
+        """Build a URL, with the arguments of `Sanic.url_for`.
+
+        Args:
+            kwargs (Dict[str, Any]): The values of the parameters, the
+                query arguments and the special arguments. It is emptied.
+            server_name (str): The host of external URLs, if neither
+                `_host` nor `_server` is given.
+
+        Raises:
+            URLBuildError: If a parameter is missing, or its value does
+                not match its pattern.
+            ValueError: If the host or the scheme cannot be used.
+
+        Returns:
+            str: The URL.
+        """
+        if self.static:
+            filename = kwargs.pop("filename", "")
+            if self.file_uri:
+                if filename.startswith("/"):
+                    filename = filename[1:]
+                kwargs["__file_uri__"] = filename
+
+        if not kwargs and not self.params:
+            return self.path
+
+        # _method is only a placeholder now, don't know how to support it
+        kwargs.pop("_method", None)
+        anchor = kwargs.pop("_anchor", "")
+        # _external need SERVER_NAME in config or pass _server arg
+        host = kwargs.pop("_host", None)
+        external = kwargs.pop("_external", False) or bool(host)
+        scheme = kwargs.pop("_scheme", "")
+        if self.hosts and external:
+            if not host and len(self.hosts) > 1:
+                raise ValueError(f"Host is ambiguous: {', '.join(self.hosts)}")
+            elif host and host not in self.hosts:
+                raise ValueError(
+                    f"Requested host ({host}) is not available for this "
+                    f"route: {self.hosts}"
+                )
+            elif not host:
+                host = list(self.hosts)[0]
+
+        if scheme and not external:
+            raise ValueError("When specifying _scheme, _external must be True")
+
+        netloc = kwargs.pop("_server", None)
+        if netloc is None and external:
+            netloc = host or server_name
+
+        if external:
+            if not scheme:
+                if ":" in netloc[:8]:
+                    scheme = netloc[:8].split(":", 1)[0]
+                else:
+                    scheme = "http"
+                # Replace http/https with ws/wss for WebSocket handlers
+                if self.websocket:
+                    scheme = scheme.replace("http", "ws")
+
+            if "://" in netloc[:8]:
+                netloc = netloc.split("://", 1)[-1]
+
+        if self.params:
+            path = self._path(kwargs)
+        elif kwargs:
+            path = self.path
+        else:
+            key = (scheme, netloc or "", anchor)
+            url = self.memo.get(key)
+            if url is None:
+                url = self._unparse(scheme, netloc, self.path, "", anchor)
+                if len(self.memo) >= self.MEMO_SIZE:
+                    del self.memo[next(iter(self.memo))]
+                self.memo[key] = url
+            return url
+
+        # parse the remainder of the keyword arguments into a querystring
+        query_string = urlencode(kwargs, doseq=True) if kwargs else ""
+        return self._unparse(scheme, netloc, path, query_string, anchor)
+
+    def _path(self, kwargs: dict[str, Any]) -> str:
+        segments = self.segments.copy()
+        for index, param, pattern in self.params:
+            try:
+                supplied_param = str(kwargs.pop(param.name))
+            except KeyError:
+                raise URLBuildError(
+                    f"Required parameter `{param.name}` was not "
+                    "passed to url_for"
+                )
+
+            # determine if the parameter supplied by the caller
+            # passes the test in the URL
+            if pattern and not pattern.match(supplied_param):
+                if param.cast is not str:
+                    msg = (
+                        f'Value "{supplied_param}" '
+                        f"for parameter `{param.name}` does "
+                        "not match pattern for type "
+                        f"`{param.cast.__name__}`: "
+                        f"{pattern.pattern}"
+                    )
+                else:
+                    msg = (
+                        f'Value "{supplied_param}" for parameter '
+                        f"`{param.name}` does not satisfy "
+                        f"pattern {pattern.pattern}"
+                    )
+                raise URLBuildError(msg)
+            segments[index] = supplied_param
+        return self.prefix + "/".join(segments)
+
+    @staticmethod
+    def _unparse(
+        scheme: str, netloc: str | None, path: str, query: str, anchor: str
+    ) -> str:
+        if scheme or netloc or path.startswith("//"):
+            # scheme://netloc/path;parameters?query#fragment
+            return urlunparse((scheme, netloc, path, "", query, anchor))
+        if query:
+            path = f"{path}?{query}"
+        if anchor:
+            path = f"{path}#{anchor}"
+        return path
+
+
 class Router(BaseRouter):
     """The router implementation responsible for routing a `Request` object to the appropriate handler."""  # noqa: E501
 
     DEFAULT_METHOD = "GET"
     ALLOWED_METHODS = HTTP_METHODS
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cache = RouteCache()
+        self.not_found = 0
+        self.method_not_allowed = 0
+        self._host_routing = False
+
     def _get(
         self, path: str, method: str, host: str | None
-    ) -> tuple[Route, RouteHandler, dict[str, Any]]:
+    ) -> RouteResult | NotFound | MethodNotAllowed:
         try:
             return self.resolve(
                 path=path,
@@ -38,17 +319,18 @@ class Router(BaseRouter):
                 extra={"host": host} if host else None,
             )
         except RoutingNotFound as e:
-            raise NotFound(f"Requested URL {e.path} not found") from None
+            self.not_found += 1
+            return NotFound(f"Requested URL {e.path} not found")
         except NoMethod as e:
-            raise MethodNotAllowed(
+            self.method_not_allowed += 1
+            return MethodNotAllowed(
                 f"Method {method} not allowed for URL {path}",
                 method=method,
                 allowed_methods=tuple(e.allowed_methods)
                 if e.allowed_methods
                 else None,
-            ) from None
+            )
 
-    @lru_cache(maxsize=ROUTER_CACHE_SIZE)
     def get(  # type: ignore
         self, path: str, method: str, host: str | None
     ) -> tuple[Route, RouteHandler, dict[str, Any]]:
@@ -73,7 +355,47 @@ class Router(BaseRouter):
             Tuple[Route, RouteHandler, Dict[str, Any]]: the route, handler, and match info
         """  # noqa: E501
         __tracebackhide__ = True
-        return self._get(path, method, host)
+        result = self.find(path, method, host)
+        if isinstance(result, SanicException):
+            raise result
+        return result
+
+    def find(
+        self, path: str, method: str, host: str | None
+    ) -> RouteResult | NotFound | MethodNotAllowed:
+        """Like `get`, but return the error of a request that matches no route instead of raising it.
+
+        Args:
+            path (str): the path of the route
+            method (str): the HTTP method of the route
+            host (Optional[str]): the host of the route
+
+        Returns:
+            Union[Tuple[Route, RouteHandler, Dict[str, Any]], NotFound, MethodNotAllowed]: the route, handler, and match info, or the error
+        """  # noqa: E501
+        if not self._host_routing:
+            host = None
+        key = (path, method, host)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._get(path, method, host)
+            if isinstance(result, SanicException):
+                return result
+            self.cache.add(
+                key, result, result[0].static and not self._host_routing
+            )
+        return result
+
+    def error_info(self) -> dict[str, int]:
+        """Return the number of requests that matched no route.
+
+        Returns:
+            Dict[str, int]: The `not_found` and `method_not_allowed` counts.
+        """
+        return {
+            "not_found": self.not_found,
+            "method_not_allowed": self.method_not_allowed,
+        }
 
     def add(  # type: ignore
         self,
@@ -242,6 +564,13 @@ class Router(BaseRouter):
         """  # noqa: E501
         super().finalize(*args, **kwargs)
 
+        for route in self.routes:
+            self._prepare_pipeline(route)
+            route.extra.url_builder = URLBuilder(route)
+
+        self._host_routing = any(route.requirements for route in self.routes)
+        self._prepare_cache()
+
         for route in self.dynamic_routes.values():
             if any(
                 label.startswith("__") and label not in ALLOWED_LABELS
@@ -251,6 +580,44 @@ class Router(BaseRouter):
                     f"Invalid route: {route}. Parameter names cannot use '__'."
                 )
 
+    def reset(self) -> None:
+        super().reset()
+        self.cache.clear()
+
+    def _prepare_cache(self) -> None:
+        app = getattr(self.ctx, "app", None)
+        if app:
+            self.cache.maxsize = app.config.ROUTER_CACHE_SIZE
+        self.cache.clear()
+
+        if self._host_routing or self.cache.maxsize <= 0:
+            return
+
+        # Prime the exact match cache with the canonical path of each route
+        # that has no parameters. Other variants (like a trailing slash)
+        # are added the first time they are resolved.
+        for group in self.static_routes.values():
+            for route in group.routes:
+                path = f"/{route.path}"
+                for method in route.methods:
+                    result = self._get(path, method, None)
+                    if isinstance(result, SanicException):  # no cov
+                        continue
+                    if result[0] is route:
+                        self.cache.add((path, method, None), result, True)
+
+    @staticmethod
+    def _prepare_pipeline(route: Route) -> None:
+        """Precompute per-route details used by `Sanic.handle_request`.
+
+        This allows the request handling hot path to use simple attribute
+        lookups instead of inspecting the handler on every request.
+        """
+        handler = route.handler
+        route.extra.is_coroutine = iscoroutinefunction(handler)
+        route.extra.is_stream = hasattr(handler, "is_stream")
+        route.extra.is_websocket = hasattr(handler, "is_websocket")
+
     def _normalize(self, uri: str, handler: RouteHandler) -> str:
         if "<" not in uri:
             return uri
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from sanic.exceptions import RequestCancelled
+from sanic.signals import Event
 
 
 if TYPE_CHECKING:
@@ -11,13 +12,17 @@ if TYPE_CHECKING:
 import asyncio
 
 from asyncio.transports import Transport
-from time import monotonic as current_time
 
 from sanic.log import error_logger
 from sanic.models.server_types import ConnInfo, Signal
+from sanic.server.timers import TimerWheel
 
 
 class SanicProtocol(asyncio.Protocol):
+    # The most bytes that a single sendfile call sends, so that the time of
+    # the last activity is refreshed while a large file is sent
+    SENDFILE_SLICE_SIZE = 4 * 1024 * 1024
+
     __slots__ = (
         "app",
         # event loop, connection
@@ -28,6 +33,7 @@ class SanicProtocol(asyncio.Protocol):
         "signal",
         "_can_write",
         "_time",
+        "_timer",
         "_task",
         "_unix",
         "_data_received",
@@ -54,6 +60,7 @@ class SanicProtocol(asyncio.Protocol):
         self._can_write.set()
         self._unix = unix
         self._time = 0.0  # type: float
+        self._timer = TimerWheel.for_loop(loop)
         self._task: asyncio.Task | None = None
         self._data_received = asyncio.Event()
 
@@ -66,13 +73,65 @@ class SanicProtocol(asyncio.Protocol):
 
     async def send(self, data):
         """
-        Generic data write implementation with backpressure control.
+        Generic data write implementation with backpressure control. Data
+        may be a list of buffers, written with the transport's writelines.
         """
         await self._can_write.wait()
         if self.transport.is_closing():
             raise RequestCancelled
-        self.transport.write(data)
-        self._time = current_time()
+        if isinstance(data, list):
+            self.transport.writelines(data)
+        else:
+            self.transport.write(data)
+        self._time = self._timer.time()
+
+    @property
+    def sendfile_available(self) -> bool:
+        """
+        Whether files can be sent with sendfile on this connection. It needs
+        an event loop that implements loop.sendfile (uvloop does not) and a
+        transport without TLS. Files are not sent with sendfile while a
+        handler is registered for the http.lifecycle.send signal, so that it
+        receives the body.
+        """
+        return (
+            type(self.loop).sendfile is not asyncio.AbstractEventLoop.sendfile
+            and self.transport is not None
+            and self.transport.get_extra_info("sslcontext") is None
+            and Event.HTTP_LIFECYCLE_SEND.value
+            not in self.app.signal_router.name_index
+        )
+
+    async def sendfile(self, location, offset: int, count: int) -> bool:
+        """
+        Send a part of a file with sendfile and backpressure control. Returns
+        False without sending anything if the transport does not support it.
+
+        The file is sent in slices of ``SENDFILE_SLICE_SIZE`` bytes, and each
+        slice counts as activity, so that a slow download is not cut off by
+        the response timeout.
+        """
+        file = await self.loop.run_in_executor(None, open, location, "rb")
+        try:
+            start, end = offset, offset + count
+            while offset < end:
+                await self._can_write.wait()
+                if self.transport.is_closing():
+                    raise RequestCancelled
+                size = min(end - offset, self.SENDFILE_SLICE_SIZE)
+                try:
+                    await self.loop.sendfile(
+                        self.transport, file, offset, size, fallback=False
+                    )
+                except asyncio.SendfileNotAvailableError:
+                    if offset == start:
+                        return False
+                    raise
+                offset += size
+                self._time = self._timer.time()
+        finally:
+            file.close()
+        return True
 
     async def receive_more(self):
         """
@@ -183,7 +242,7 @@ class SanicProtocol(asyncio.Protocol):
 
     def data_received(self, data: bytes):
         try:
-            self._time = current_time()
+            self._time = self._timer.time()
             if not data:
                 return self.close()
 
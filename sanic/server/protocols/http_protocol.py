@@ -14,7 +14,6 @@ if TYPE_CHECKING:
 
 
 from asyncio import CancelledError
-from time import monotonic as current_time
 
 from sanic.exceptions import (
     RequestCancelled,
@@ -29,6 +28,7 @@ from sanic.log import (
     logger,
     websockets_logger,
 )
+from sanic.logging.trace import ProtocolTracer
 from sanic.models.server_types import ConnInfo
 from sanic.request import Request
 from sanic.server.protocols.base_protocol import SanicProtocol
@@ -39,6 +39,7 @@ try:
     from aioquic.asyncio import QuicConnectionProtocol
     from aioquic.h3.connection import H3_ALPN, H3Connection
     from aioquic.quic.events import (
+        ConnectionTerminated,
         DatagramFrameReceived,
         ProtocolNegotiated,
         QuicEvent,
@@ -55,8 +56,8 @@ class HttpProtocolMixin:
 
     def _setup_connection(self, *args, **kwargs):
         self._http = self.HTTP_CLASS(self, *args, **kwargs)
-        self._time = current_time()
         try:
+            self._time = self._timer.time()
             self.check_timeouts()
         except AttributeError:
             ...
@@ -71,6 +72,9 @@ class HttpProtocolMixin:
         self.keep_alive_timeout = self.app.config.KEEP_ALIVE_TIMEOUT
         self.request_max_size = self.app.config.REQUEST_MAX_SIZE
         self.request_class = self.app.request_class or Request
+        self.trace = ProtocolTracer.for_connection(
+            self.app.config.PROTOCOL_TRACE_SAMPLE
+        )
 
     @property
     def http(self):
@@ -116,7 +120,7 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
         "_http",
         "_exception",
         "recv_buffer",
-        "_callback_check_timeouts",
+        "trace",
     )
 
     def __init__(
@@ -143,7 +147,6 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
         if "requests_count" not in self.state:
             self.state["requests_count"] = 0
         self._exception = None
-        self._callback_check_timeouts = None
 
     async def connection_task(self):  # no cov
         """
@@ -207,12 +210,13 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
 
     def check_timeouts(self):
         """
-        Runs itself periodically to enforce any expired timeouts.
+        Runs itself periodically on the timer wheel of the loop to enforce
+        any expired timeouts.
         """
         try:
             if not self._task:
                 return
-            duration = current_time() - self._time
+            duration = self._timer.elapsed(self._time)
             stage = self._http.stage
             if stage is Stage.IDLE and duration > self.keep_alive_timeout:
                 logger.debug("KeepAlive Timeout. Closing connection.")
@@ -239,9 +243,19 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
                     )
                     / 2
                 )
-                _interval = max(0.1, interval)
-                self._callback_check_timeouts = self.loop.call_later(
-                    _interval, self.check_timeouts
+                if stage is Stage.IDLE:
+                    timeout = self.keep_alive_timeout
+                elif stage is Stage.REQUEST:
+                    timeout = self.request_timeout
+                else:
+                    timeout = self.response_timeout
+                # Check again when the timeout of this stage expires, or
+                # sooner, in case the stage changes
+                self._timer.schedule(
+                    self,
+                    self._timer.time()
+                    + max(0.1, min(interval, timeout - duration)),
+                    self.check_timeouts,
                 )
                 return
             if sys.version_info < (3, 14):
@@ -256,24 +270,31 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
         Requires to prevent checking timeouts for closed connections
         """
 
-        if self._callback_check_timeouts:
-            self._callback_check_timeouts.cancel()
+        self._timer.cancel(self)
         return super().close(timeout=timeout)
 
     async def send(self, data):  # no cov
         """
-        Writes HTTP data with backpressure control.
+        Writes HTTP data with backpressure control. Data may be a list of
+        buffers, which is written with the transport's ``writelines``.
         """
         await self._can_write.wait()
         if self.transport.is_closing():
             raise RequestCancelled
+        # Signal handlers receive bytes. TouchUp removes the dispatch, and
+        # the join, when no handler is registered.
         await self.app.dispatch(
             "http.lifecycle.send",
             inline=True,
-            context={"data": data},
+            context={
+                "data": b"".join(data) if isinstance(data, list) else data
+            },
         )
-        self.transport.write(data)
-        self._time = current_time()
+        if isinstance(data, list):
+            self.transport.writelines(data)
+        else:
+            self.transport.write(data)
+        self._time = self._timer.time()
 
     def close_if_idle(self) -> bool:
         """
@@ -307,7 +328,7 @@ class HttpProtocol(HttpProtocolMixin, SanicProtocol, metaclass=TouchUpMeta):
 
     def data_received(self, data: bytes):
         try:
-            self._time = current_time()
+            self._time = self._timer.time()
             if not data:
                 return self.close()
             self.recv_buffer += data
@@ -335,11 +356,12 @@ class Http3Protocol(HttpProtocolMixin, ConnectionProtocol):  # type: ignore
         self._connection: H3Connection | None = None
 
     def quic_event_received(self, event: QuicEvent) -> None:
-        logger.debug(
-            f"{Colors.BLUE}[quic_event_received]: "
-            f"{Colors.PURPLE}{event}{Colors.END}",
-            extra={"verbosity": 2},
-        )
+        if self.trace:
+            self.trace(
+                f"{Colors.BLUE}[quic_event_received]: "
+                f"{Colors.PURPLE}%s{Colors.END}",
+                ProtocolTracer.describe(event),
+            )
         if isinstance(event, ProtocolNegotiated):
             self._setup_connection(transmit=self.transmit)
             if event.alpn_protocol in H3_ALPN:
@@ -349,12 +371,19 @@ class Http3Protocol(HttpProtocolMixin, ConnectionProtocol):  # type: ignore
         elif isinstance(event, DatagramFrameReceived):
             if event.data == b"quack":
                 self._quic.send_datagram_frame(b"quack-ack")
+        elif isinstance(event, ConnectionTerminated) and self.http:
+            self.http.resume_writing(force=True)
 
         #  pass event to the HTTP layer
         if self._connection is not None:
             for http_event in self._connection.handle_event(event):
                 self._http.http_event_received(http_event)
 
+    def transmit(self) -> None:
+        super().transmit()
+        if self.http is not None:
+            self.http.resume_writing()
+
     @property
     def connection(self) -> H3Connection | None:
         return self._connection
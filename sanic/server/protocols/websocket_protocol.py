@@ -18,6 +18,7 @@ from sanic.log import access_logger, websockets_logger
 from sanic.request import Request
 from sanic.server import HttpProtocol
 
+from ..websockets.deflate import DeflateFactory
 from ..websockets.impl import WebsocketImplProtocol
 
 
@@ -30,6 +31,8 @@ class WebSocketProtocol(HttpProtocol):
     __slots__ = (
         "websocket",
         "websocket_timeout",
+        "websocket_deflate",
+        "websocket_max_queue",
         "websocket_max_size",
         "websocket_ping_interval",
         "websocket_ping_timeout",
@@ -41,6 +44,8 @@ class WebSocketProtocol(HttpProtocol):
         self,
         *args,
         websocket_timeout: float = 10.0,
+        websocket_deflate: DeflateFactory | None = None,
+        websocket_max_queue: int | None = None,
         websocket_max_size: int | None = None,
         websocket_ping_interval: float | None = 20.0,
         websocket_ping_timeout: float | None = 20.0,
@@ -49,6 +54,8 @@ class WebSocketProtocol(HttpProtocol):
         super().__init__(*args, **kwargs)
         self.websocket: WebsocketImplProtocol | None = None
         self.websocket_timeout = websocket_timeout
+        self.websocket_deflate = websocket_deflate
+        self.websocket_max_queue = websocket_max_queue
         self.websocket_max_size = websocket_max_size
         self.websocket_ping_interval = websocket_ping_interval
         self.websocket_ping_timeout = websocket_ping_timeout
@@ -58,6 +65,7 @@ class WebSocketProtocol(HttpProtocol):
     def connection_lost(self, exc):
         if self.websocket is not None:
             self.websocket.connection_lost(exc)
+            self.app.websocket_connections.discard(self.websocket)
         super().connection_lost(exc)
         self.log_websocket("CLOSE")
         self.websocket_url = None
@@ -127,6 +135,11 @@ class WebSocketProtocol(HttpProtocol):
                 )
             ws_proto = ServerProtocol(
                 max_size=self.websocket_max_size,
+                extensions=(
+                    [self.websocket_deflate]
+                    if self.websocket_deflate
+                    else None
+                ),
                 subprotocols=subprotocols,
                 state=OPEN,
                 logger=websockets_logger,
@@ -155,6 +168,7 @@ class WebSocketProtocol(HttpProtocol):
             raise SanicException(resp.body, resp.status_code)
         self.websocket = WebsocketImplProtocol(
             ws_proto,
+            max_queue=self.websocket_max_queue,
             ping_interval=self.websocket_ping_interval,
             ping_timeout=self.websocket_ping_timeout,
             close_timeout=self.websocket_timeout,
@@ -166,6 +180,7 @@ class WebSocketProtocol(HttpProtocol):
             else None
         )
         await self.websocket.connection_made(self, loop=loop)
+        self.app.websocket_connections.add(self.websocket)
         self.websocket_url = self._http.request.url
         self.websocket_peer = f"{id(self):X}"[-5:-1] + "unx"
         if ip := self._http.request.client_ip:
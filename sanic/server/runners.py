@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from ssl import SSLContext
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sanic.config import Config
 from sanic.exceptions import ServerError
@@ -23,12 +23,14 @@ from signal import signal as signal_func
 from sanic.application.ext import setup_ext
 from sanic.compat import OS_IS_WINDOWS, ctrlc_workaround_for_windows
 from sanic.http.http3 import SessionTicketStore, get_config
+from sanic.http.tls.tickets import SessionTickets
 from sanic.log import error_logger, server_logger
 from sanic.logging.setup import setup_logging
 from sanic.models.server_types import Signal
 from sanic.server.async_server import AsyncioServer
 from sanic.server.protocols.http_protocol import Http3Protocol, HttpProtocol
 from sanic.server.socket import bind_unix_socket, remove_unix_socket
+from sanic.server.websockets.deflate import DeflateFactory
 
 
 try:
@@ -270,6 +272,9 @@ def _serve_http_1(
     # UNIX sockets are always bound by us (to preserve semantics between modes)
     elif unix:
         sock = bind_unix_socket(unix, backlog=backlog)
+    if isinstance(ssl, SSLContext):
+        app.session_tickets = SessionTickets()
+        app.session_tickets.install(ssl)
     server_coroutine = loop.create_server(
         server,
         None if sock else host,
@@ -366,7 +371,9 @@ def _serve_http_3(
     pid = os.getpid()
     server_logger.info("Starting worker [%s]", pid)
     protocol = partial(Http3Protocol, app=app)
-    ticket_store = SessionTicketStore()
+    ticket_store = app.ticket_store = SessionTicketStore.from_config(
+        app.config
+    )
     ssl_context = get_ssl_context(app, ssl)
     config = get_config(app, ssl_context)
     coro = quic_serve(
@@ -386,7 +393,7 @@ def _serve_http_3(
     loop.run_until_complete(server.after_start())
 
     # TODO: Create connection cleanup and graceful shutdown
-    cleanup = None
+    cleanup = ticket_store.close
     _run_server_forever(
         loop, server.before_stop, server.after_stop, cleanup, None, pid
     )
@@ -394,9 +401,11 @@ def _serve_http_3(
 
 def _build_protocol_kwargs(
     protocol: type[asyncio.Protocol], config: Config
-) -> dict[str, int | float]:
+) -> dict[str, Any]:
     if hasattr(protocol, "websocket_handshake"):
         return {
+            "websocket_deflate": DeflateFactory.from_config(config),
+            "websocket_max_queue": config.WEBSOCKET_MAX_QUEUE,
             "websocket_max_size": config.WEBSOCKET_MAX_SIZE,
             "websocket_ping_timeout": config.WEBSOCKET_PING_TIMEOUT,
             "websocket_ping_interval": config.WEBSOCKET_PING_INTERVAL,
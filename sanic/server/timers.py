@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, Future, TimerHandle
+from collections.abc import Hashable
+from math import ceil
+from time import monotonic as current_time
+from typing import Callable
+from weakref import WeakKeyDictionary
+
+from sanic.log import error_logger
+
+
+class TimerWheel:
+    """The deadlines of all the connections of an event loop.
+
+    A hashed timer wheel: a ring of slots that is advanced by one slot every
+    ``resolution`` seconds, by a single callback on the loop. Scheduling a
+    key puts it in the slot of its deadline, replacing any deadline it had,
+    and cancelling removes it. Both are O(1), no matter how many keys are
+    scheduled. When the slot of a key comes up, its callback is called.
+    Deadlines that are more than one turn of the wheel away simply stay in
+    their slot until their turn comes.
+
+    The wheel also keeps a cached monotonic time in ``now``, refreshed on
+    every tick. Connections record their last activity with ``time`` instead
+    of reading the clock for every chunk they send or receive, and measure
+    it with ``elapsed``.
+
+    Use ``TimerWheel.for_loop`` to get the wheel of a loop.
+
+    Args:
+        loop (AbstractEventLoop): The event loop to run on.
+        resolution (float): The time between ticks, in seconds.
+        size (int): The number of slots.
+    """
+
+    _wheels: WeakKeyDictionary[AbstractEventLoop, TimerWheel] = (
+        WeakKeyDictionary()
+    )
+
+    __slots__ = (
+        "loop",
+        "resolution",
+        "now",
+        "previous",
+        "_origin",
+        "_tick",
+        "_slots",
+        "_due",
+        "_handle",
+    )
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+        resolution: float = 0.1,
+        size: int = 1024,
+    ) -> None:
+        self.loop = loop
+        self.resolution = resolution
+        self.now = self.previous = self._origin = current_time()
+        self._tick = 0
+        self._slots: list[dict[Hashable, tuple[int, Callable[[], None]]]] = [
+            {} for _ in range(size)
+        ]
+        self._due: dict[Hashable, int] = {}
+        self._handle: TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return len(self._due)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._due
+
+    @classmethod
+    def for_loop(cls, loop: AbstractEventLoop) -> TimerWheel:
+        """Get the timer wheel of an event loop, creating it if needed."""
+        wheel = cls._wheels.get(loop)
+        if wheel is None:
+            wheel = cls._wheels[loop] = cls(loop)
+        return wheel
+
+    def time(self) -> float:
+        """The cached monotonic time.
+
+        No ticks refresh ``now`` while nothing is scheduled, so the clock is
+        read then, and the cache is refreshed with it.
+        """
+        if self._handle is None:
+            self.now = self.previous = current_time()
+        return self.now
+
+    def elapsed(self, since: float) -> float:
+        """The time from ``since`` (a value of ``now``) to the last tick.
+
+        ``now`` may have been read up to one tick after it was refreshed, so
+        a deadline measured with it can expire up to one tick early. A value
+        read since the previous tick counts as no time at all, so that
+        activity while the loop was stalled does not expire anything.
+        """
+        if since >= self.previous:
+            return 0.0
+        return self.now - since
+
+    def schedule(
+        self, key: Hashable, when: float, callback: Callable[[], None]
+    ) -> None:
+        """Call ``callback`` on the first tick at or after ``when``.
+
+        Any time that ``key`` was already scheduled at is replaced.
+
+        Args:
+            key (Hashable): The key, usually the connection itself.
+            when (float): The deadline, as a monotonic time.
+            callback (Callable[[], None]): The function to call.
+        """
+        if self._handle is None:
+            self._start()
+        tick = max(
+            self._tick + 1, ceil((when - self._origin) / self.resolution)
+        )
+        previous = self._due.get(key)
+        if previous is not None:
+            self._slots[previous % len(self._slots)].pop(key, None)
+        self._due[key] = tick
+        self._slots[tick % len(self._slots)][key] = (tick, callback)
+
+    def cancel(self, key: Hashable) -> None:
+        """Remove ``key`` from the wheel, if it is scheduled."""
+        tick = self._due.pop(key, None)
+        if tick is not None:
+            self._slots[tick % len(self._slots)].pop(key, None)
+
+    async def sleep(self, delay: float) -> None:
+        """Sleep for ``delay`` seconds, rounded up to the next tick."""
+        future: Future[None] = self.loop.create_future()
+        self.schedule(
+            future,
+            self.time() + delay,
+            lambda: future.done() or future.set_result(None),
+        )
+        try:
+            await future
+        finally:
+            self.cancel(future)
+
+    def _start(self) -> None:
+        self.previous = self.now
+        self.now = self._origin = current_time()
+        self._tick = 0
+        self._handle = self.loop.call_later(self.resolution, self._run)
+
+    def _run(self) -> None:
+        self.previous = self.now
+        self.now = current_time()
+        target = int((self.now - self._origin) / self.resolution)
+        # After a stall, every slot needs to be visited once at most
+        self._tick = max(self._tick, target - len(self._slots))
+        while self._tick < target:
+            self._tick += 1
+            self._expire(self._slots[self._tick % len(self._slots)])
+        if not self._due:
+            self._handle = None
+            return
+        delay = self._origin + (self._tick + 1) * self.resolution
+        self._handle = self.loop.call_later(
+            max(0.0, delay - current_time()), self._run
+        )
+
+    def _expire(
+        self, slot: dict[Hashable, tuple[int, Callable[[], None]]]
+    ) -> None:
+        expired = [
+            (key, callback)
+            for key, (tick, callback) in slot.items()
+            if tick <= self._tick
+        ]
+        for key, callback in expired:
+            del slot[key]
+            del self._due[key]
+            try:
+                callback()
+            except Exception:
+                error_logger.exception("TimerWheel callback failed")
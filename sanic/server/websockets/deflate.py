@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from websockets import frames
+from websockets.extensions.permessage_deflate import (
+    PerMessageDeflate,
+    ServerPerMessageDeflateFactory,
+)
+
+
+if TYPE_CHECKING:
+    from sanic.config import Config
+    from sanic.server.websockets.impl import WebsocketImplProtocol
+
+
+# Fixed overhead of zlib streams, on top of their window and hash tables
+DEFLATE_OVERHEAD = 6 * 1024
+INFLATE_OVERHEAD = 7 * 1024
+
+
+class ThresholdPerMessageDeflate(PerMessageDeflate):
+    """The permessage-deflate extension of one connection.
+
+    Messages smaller than ``threshold`` bytes are sent uncompressed, as
+    RFC 7692 allows, since compressing them costs more than it saves.
+    """
+
+    def __init__(self, *args: Any, threshold: int = 0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+        self.skip_cont_data = False
+
+    def encode(self, frame: frames.Frame) -> frames.Frame:
+        if frame.opcode in frames.CTRL_OPCODES:
+            return frame
+        if frame.opcode is not frames.OP_CONT:
+            self.skip_cont_data = len(frame.data) < self.threshold
+        if self.skip_cont_data:
+            return frame
+        return super().encode(frame)
+
+    @property
+    def memory(self) -> int:
+        """The estimated memory held by the zlib streams, in bytes.
+
+        Streams without context takeover only exist while a message is
+        being encoded or decoded, so they are not counted.
+        """
+        size = 0
+        if not self.local_no_context_takeover:
+            size += DEFLATE_OVERHEAD + (1 << (self.local_max_window_bits + 2))
+            size += 1 << (self.compress_settings.get("memLevel", 8) + 9)
+        if not self.remote_no_context_takeover:
+            size += INFLATE_OVERHEAD + (1 << self.remote_max_window_bits)
+        return size
+
+
+class DeflateFactory(ServerPerMessageDeflateFactory):
+    """Negotiate permessage-deflate with a compression threshold."""
+
+    def __init__(self, *args: Any, threshold: int = 0, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+
+    def process_request_params(self, params, accepted_extensions):
+        response, extension = super().process_request_params(
+            params, accepted_extensions
+        )
+        return response, ThresholdPerMessageDeflate(
+            extension.remote_no_context_takeover,
+            extension.local_no_context_takeover,
+            extension.remote_max_window_bits,
+            extension.local_max_window_bits,
+            extension.compress_settings,
+            threshold=self.threshold,
+        )
+
+    @classmethod
+    def from_config(cls, config: Config) -> DeflateFactory | None:
+        """Create the factory for the ``WEBSOCKET_DEFLATE`` config.
+
+        Returns:
+            Optional[DeflateFactory]: The factory, or `None` if
+                permessage-deflate is disabled.
+        """
+        if not config.WEBSOCKET_DEFLATE:
+            return None
+        bits = config.WEBSOCKET_DEFLATE_WINDOW_BITS
+        no_context_takeover = config.WEBSOCKET_DEFLATE_NO_CONTEXT_TAKEOVER
+        return cls(
+            server_no_context_takeover=no_context_takeover,
+            client_no_context_takeover=no_context_takeover,
+            server_max_window_bits=bits,
+            client_max_window_bits=bits,
+            compress_settings={
+                "memLevel": config.WEBSOCKET_DEFLATE_MEMORY_LEVEL
+            },
+            threshold=config.WEBSOCKET_DEFLATE_THRESHOLD,
+        )
+
+
+def websocket_info(
+    connections: Iterable[WebsocketImplProtocol],
+) -> dict[str, int]:
+    """Count open websockets, and the memory used to compress them."""
+    count = deflate = memory = 0
+    for ws in connections:
+        count += 1
+        for extension in ws.ws_proto.extensions:
+            if isinstance(extension, ThresholdPerMessageDeflate):
+                deflate += 1
+                memory += extension.memory
+    return {"connections": count, "deflate": deflate, "deflate_memory": memory}
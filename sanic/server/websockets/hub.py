@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+import struct
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Literal
+
+from websockets.frames import Frame, Opcode
+from websockets.typing import Data
+
+from sanic.log import websockets_logger
+from sanic.server.websockets.impl import WebsocketImplProtocol
+
+
+SlowConsumerPolicy = Literal["drop", "close"]
+
+
+class WebsocketHub:
+    """Publish messages to the websockets that subscribed to a channel.
+
+    A message is serialized into a frame once, and the same bytes are
+    written to the transport of every subscriber, without awaiting each of
+    them. Connections that negotiated an extension cannot share frames, so
+    messages are sent to them with `send`, in a task.
+
+    A subscriber with more than ``max_backlog`` bytes waiting to be written
+    is a slow consumer. With the ``"drop"`` policy, the messages are
+    dropped for it until it catches up. With the ``"close"`` policy, it is
+    disconnected with the close code 1008. Subscribers are removed when
+    their connection is closed.
+
+    ```python
+    hub = WebsocketHub()
+
+    @app.websocket("/feed")
+    async def feed(request, ws):
+        with hub.subscription(ws, "news"):
+            async for message in ws:
+                hub.publish("news", message)
+    ```
+
+    Each worker has its own subscribers. With ``relay``, the messages are
+    also published to the hubs of the other workers on the same machine
+    that use the same directory. See `HubRelay`.
+
+    Args:
+        max_backlog (int): The bytes that may wait to be written to a
+            subscriber before it is a slow consumer.
+        policy (SlowConsumerPolicy): What to do with slow consumers,
+            ``"drop"`` or ``"close"``.
+        relay (Optional[Union[str, Path]]): A directory for relaying
+            messages between workers.
+
+    Raises:
+        ValueError: If the policy is unknown.
+    """
+
+    __slots__ = (
+        "channels",
+        "closed",
+        "dropped",
+        "max_backlog",
+        "policy",
+        "relay",
+        "sent",
+        "_tasks",
+    )
+
+    def __init__(
+        self,
+        max_backlog: int = 1 << 20,
+        policy: SlowConsumerPolicy = "drop",
+        relay: str | Path | None = None,
+    ) -> None:
+        if policy not in ("drop", "close"):
+            raise ValueError(f"Unknown slow consumer policy: {policy}")
+        self.max_backlog = max_backlog
+        self.policy = policy
+        self.channels: dict[str, set[WebsocketImplProtocol]] = {}
+        self.relay = HubRelay(relay, self._deliver) if relay else None
+        self.sent = 0
+        self.dropped = 0
+        self.closed = 0
+        self._tasks: set[asyncio.Task] = set()
+
+    def subscribe(self, ws: WebsocketImplProtocol, *channels: str) -> None:
+        """Subscribe a websocket to channels."""
+        if self.relay:
+            self.relay.start()
+        for channel in channels:
+            self.channels.setdefault(channel, set()).add(ws)
+
+    def unsubscribe(self, ws: WebsocketImplProtocol, *channels: str) -> None:
+        """Unsubscribe a websocket from channels, or from all of them."""
+        for channel in channels or tuple(self.channels):
+            subscribers = self.channels.get(channel)
+            if subscribers is not None:
+                subscribers.discard(ws)
+                if not subscribers:
+                    del self.channels[channel]
+
+    @contextmanager
+    def subscription(
+        self, ws: WebsocketImplProtocol, *channels: str
+    ) -> Iterator[None]:
+        """Subscribe a websocket to channels for the duration of a block."""
+        self.subscribe(ws, *channels)
+        try:
+            yield
+        finally:
+            self.unsubscribe(ws, *channels)
+
+    def subscribers(self, channel: str) -> int:
+        """The number of subscribers of a channel in this worker."""
+        return len(self.channels.get(channel, ()))
+
+    def publish(self, channel: str, message: Data) -> int:
+        """Publish a message to the subscribers of a channel.
+
+        Like `Websocket.send`, a `str` is sent as a text frame, and a
+        bytes-like object as a binary frame.
+
+        Args:
+            channel (str): The channel.
+            message (Data): The message.
+
+        Returns:
+            int: The number of subscribers of this worker that it was
+                written to.
+        """
+        if self.relay:
+            self.relay.send(channel, message)
+        return self._deliver(channel, message)
+
+    @staticmethod
+    def frame(message: Data) -> bytes:
+        """Serialize a message into an unmasked frame, without extensions."""
+        if isinstance(message, str):
+            return Frame(Opcode.TEXT, message.encode("utf-8")).serialize(
+                mask=False
+            )
+        if isinstance(message, (bytes, bytearray, memoryview)):
+            return Frame(Opcode.BINARY, bytes(message)).serialize(mask=False)
+        raise TypeError("Websocket data must be bytes, str.")
+
+    def close(self) -> None:
+        """Stop relaying, and forget every subscriber."""
+        if self.relay:
+            self.relay.stop()
+        self.channels.clear()
+
+    def _deliver(self, channel: str, message: Data) -> int:
+        subscribers = self.channels.get(channel)
+        if not subscribers:
+            return 0
+        frame = self.frame(message)
+        written = 0
+        gone = []
+        for ws in subscribers:
+            backlog = ws.write_backlog
+            if backlog is None:
+                gone.append(ws)
+            elif backlog > self.max_backlog:
+                if self.policy == "close":
+                    gone.append(ws)
+                    ws.fail_connection(1008, "Slow consumer")
+                    self.closed += 1
+                else:
+                    self.dropped += 1
+            elif ws.ws_proto.extensions:
+                task = asyncio.create_task(ws.send(message))
+                self._tasks.add(task)
+                task.add_done_callback(self._sent)
+                written += 1
+            else:
+                ws.write_frame(frame)
+                written += 1
+        for ws in gone:
+            subscribers.discard(ws)
+        if not subscribers:
+            del self.channels[channel]
+        self.sent += written
+        return written
+
+    def _sent(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            websockets_logger.debug(
+                "Hub message not sent: %r", task.exception()
+            )
+
+
+class HubRelay:
+    """Relay the messages of a hub to the other workers of this machine.
+
+    Each worker binds a Unix datagram socket named after its pid in
+    ``directory``, and sends every message to all of the other sockets in
+    it. The list of sockets is kept until the directory changes, and the
+    sockets of workers that are gone are removed.
+
+    A message has to fit in one datagram, so messages bigger than
+    ``MAX_SIZE`` are not relayed. The system may lower this limit; on Linux
+    it is the ``net.core.wmem_default`` sysctl, about 200 KiB.
+
+    Args:
+        directory (Union[str, Path]): The directory of the sockets.
+        deliver (Callable[[str, Data], int]): Called with the channel and
+            the message of each relayed message.
+    """
+
+    HEADER = struct.Struct("!?H")
+    MAX_SIZE = 1 << 20
+
+    __slots__ = (
+        "deliver",
+        "directory",
+        "path",
+        "sock",
+        "_buffer",
+        "_mtime",
+        "_peers",
+    )
+
+    def __init__(
+        self, directory: str | Path, deliver: Callable[[str, Data], int]
+    ) -> None:
+        if not hasattr(socket, "AF_UNIX"):  # no cov
+            raise RuntimeError("Relaying needs Unix domain sockets")
+        self.directory = Path(directory)
+        self.deliver = deliver
+        self.path = self.directory / f"{os.getpid()}.sock"
+        self.sock: socket.socket | None = None
+        self._buffer = bytearray(self.MAX_SIZE)
+        self._mtime = -1
+        self._peers: list[str] = []
+
+    def start(self) -> None:
+        """Bind the socket of this worker, if it is not bound yet."""
+        if self.sock is not None:
+            return
+        loop = asyncio.get_running_loop()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / f"{os.getpid()}.sock"
+        self.path.unlink(missing_ok=True)
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.setblocking(False)
+        sock.bind(str(self.path))
+        self.sock = sock
+        loop.add_reader(sock.fileno(), self._receive)
+
+    def stop(self) -> None:
+        """Close the socket of this worker."""
+        if self.sock is None:
+            return
+        asyncio.get_running_loop().remove_reader(self.sock.fileno())
+        self.sock.close()
+        self.sock = None
+        self.path.unlink(missing_ok=True)
+
+    def send(self, channel: str, message: Data) -> None:
+        """Send a message to the other workers."""
+        self.start()
+        is_text = isinstance(message, str)
+        name = channel.encode("utf-8")
+        data = b"".join(
+            (
+                self.HEADER.pack(is_text, len(name)),
+                name,
+                message.encode("utf-8") if is_text else message,  # type: ignore
+            )
+        )
+        if len(data) > self.MAX_SIZE:
+            websockets_logger.warning(
+                "Hub message of %d bytes is too big to relay", len(data)
+            )
+            return
+        for peer in self.peers():
+            try:
+                self.sock.sendto(data, peer)  # type: ignore
+            except (ConnectionRefusedError, FileNotFoundError):
+                self._remove(peer)
+            except BlockingIOError:
+                websockets_logger.debug("Hub relay to %s is full", peer)
+            except OSError as e:
+                websockets_logger.warning("Hub message not relayed: %s", e)
+                return
+
+    def peers(self) -> list[str]:
+        """The sockets of the other workers."""
+        mtime = self.directory.stat().st_mtime_ns
+        if mtime != self._mtime:
+            self._mtime = mtime
+            self._peers = [
+                entry.path
+                for entry in os.scandir(self.directory)
+                if entry.name.endswith(".sock")
+                and entry.path != str(self.path)
+            ]
+        return self._peers
+
+    def _remove(self, peer: str) -> None:
+        try:
+            os.unlink(peer)
+        except FileNotFoundError:
+            pass
+        if peer in self._peers:
+            self._peers.remove(peer)
+
+    def _receive(self) -> None:
+        view = memoryview(self._buffer)
+        while self.sock is not None:
+            try:
+                size = self.sock.recv_into(self._buffer)
+            except (BlockingIOError, InterruptedError):
+                return
+            is_text, length = self.HEADER.unpack_from(view)
+            start = self.HEADER.size + length
+            channel = str(view[self.HEADER.size : start], "utf-8")
+            payload = bytes(view[start:size])
+            self.deliver(
+                channel, payload.decode("utf-8") if is_text else payload
+            )
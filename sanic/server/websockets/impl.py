@@ -22,6 +22,7 @@ from websockets.typing import Data
 
 from sanic.log import websockets_logger
 from sanic.server.protocols.base_protocol import SanicProtocol
+from sanic.server.timers import TimerWheel
 
 from ...exceptions import ServerError, WebsocketClosed
 from .frame import WebsocketFrameAssembler
@@ -46,8 +47,6 @@ class WebsocketImplProtocol:
     conn_mutex: asyncio.Lock
     recv_lock: asyncio.Lock
     recv_cancel: asyncio.Future | None
-    process_event_mutex: asyncio.Lock
-    can_pause: bool
     # asyncio.Future[None] | None
     data_finished_fut: asyncio.Future | None
     # asyncio.Future[None] | None
@@ -73,14 +72,16 @@ class WebsocketImplProtocol:
         self.close_timeout = close_timeout
         self.ping_interval = ping_interval
         self.ping_timeout = ping_timeout
-        self.assembler = WebsocketFrameAssembler(self)
+        self.assembler = (
+            WebsocketFrameAssembler(self)
+            if max_queue is None
+            else WebsocketFrameAssembler(self, max_queue)
+        )
         self.pings = {}
         self.conn_mutex = asyncio.Lock()
         self.recv_lock = asyncio.Lock()
         self.recv_cancel = None
-        self.process_event_mutex = asyncio.Lock()
         self.data_finished_fut = None
-        self.can_pause = True
         self.pause_frame_fut = None
         self.keepalive_ping_task = None
         self.auto_closer_task = None
@@ -91,8 +92,6 @@ class WebsocketImplProtocol:
         return self.ws_proto.subprotocol
 
     def pause_frames(self):
-        if not self.can_pause:
-            return False
         if self.pause_frame_fut:
             websockets_logger.debug("Websocket connection already paused.")
             return False
@@ -178,26 +177,23 @@ class WebsocketImplProtocol:
                 # timeout occurs and the moment this coroutine resumes running
                 return self.connection_lost_waiter.done()
 
-    async def process_events(self, events: Sequence[Event]) -> None:
-        """
-        Process a list of incoming events.
-        """
-        # Wrapped in a mutex lock, to prevent other incoming events
-        # from processing at the same time
-        async with self.process_event_mutex:
-            for event in events:
-                if not isinstance(event, Frame):
-                    # Event is not a frame. Ignore it.
-                    continue
-                if event.opcode == Opcode.PONG:
-                    await self.process_pong(event)
-                elif event.opcode == Opcode.CLOSE:
-                    if self.recv_cancel:
-                        self.recv_cancel.cancel()
-                else:
-                    await self.assembler.put(event)
+    def process_events(self, events: Sequence[Event]) -> None:
+        """
+        Process a list of incoming events, in order, as they are received.
+        """
+        for event in events:
+            if not isinstance(event, Frame):
+                # Event is not a frame. Ignore it.
+                continue
+            if event.opcode == Opcode.PONG:
+                self.process_pong(event)
+            elif event.opcode == Opcode.CLOSE:
+                if self.recv_cancel:
+                    self.recv_cancel.cancel()
+            else:
+                self.assembler.put(event)
 
-    async def process_pong(self, frame: Frame) -> None:
+    def process_pong(self, frame: Frame) -> None:
         if frame.data in self.pings:
             # Acknowledge all pings up to the one matching this pong.
             ping_ids = []
@@ -225,8 +221,9 @@ class WebsocketImplProtocol:
             return
 
         try:
+            timer = TimerWheel.for_loop(self.loop)
             while True:
-                await asyncio.sleep(self.ping_interval)
+                await timer.sleep(self.ping_interval)
 
                 # ping() raises CancelledError if the connection is closed,
                 # when auto_close_connection() cancels keepalive_ping_task.
@@ -568,6 +565,8 @@ class WebsocketImplProtocol:
     async def recv_burst(self, max_recv=256) -> Sequence[Data]:
         """
         Receive the messages which have arrived since last checking.
+        Messages are queued as they arrive, so this does not wait: it takes
+        up to ``max_recv`` of them at once.
         Return a :class:`list` containing :class:`str` for a text frame
         and :class:`bytes` for a binary frame.
         When the end of the message stream is reached, :meth:`recv_burst`
@@ -593,48 +592,10 @@ class WebsocketImplProtocol:
             raise WebsocketClosed(
                 "Cannot receive from websocket interface after it is closed."
             )
-        messages = []
-        assembler_get: asyncio.Task | None = None
         try:
-            # Prevent pausing the transport when we're
-            # receiving a burst of messages
-            self.can_pause = False
-            self.recv_cancel = asyncio.Future()
-            while True:
-                assembler_get = asyncio.create_task(self.assembler.get(0))
-                tasks = (self.recv_cancel, assembler_get)
-                done, pending = await asyncio.wait(
-                    tasks,
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                done_task = next(iter(done))
-                if done_task is self.recv_cancel:
-                    # recv_burst was cancelled
-                    for p in pending:
-                        p.cancel()
-                    raise asyncio.CancelledError()
-                m = done_task.result()
-                if m is None:
-                    # None left in the burst. This is good!
-                    break
-                messages.append(m)
-                if len(messages) >= max_recv:
-                    # Too much data in the pipe. Hit our burst limit.
-                    break
-                # Allow an eventloop iteration for the
-                # next message to pass into the Assembler
-                await asyncio.sleep(0)
-            self.recv_cancel.cancel()
-        except asyncio.CancelledError:
-            # recv_burst was cancelled
-            if assembler_get:
-                assembler_get.cancel()
-            raise
+            return self.assembler.get_many(max_recv)
         finally:
-            self.recv_cancel = None
-            self.can_pause = True
             self.recv_lock.release()
-        return messages
 
     async def recv_streaming(self) -> AsyncIterator[Data]:
         """
@@ -659,7 +620,6 @@ class WebsocketImplProtocol:
         try:
             cancelled = False
             self.recv_cancel = asyncio.Future()
-            self.can_pause = False
             async for m in self.assembler.get_iter():
                 if self.recv_cancel.done():
                     cancelled = True
@@ -668,7 +628,6 @@ class WebsocketImplProtocol:
             if cancelled:
                 raise asyncio.CancelledError()
         finally:
-            self.can_pause = True
             self.recv_cancel = None
             self.recv_lock.release()
 
@@ -723,6 +682,33 @@ class WebsocketImplProtocol:
             else:
                 raise TypeError("Websocket data must be bytes, str.")
 
+    @property
+    def write_backlog(self) -> int | None:
+        """
+        The number of bytes waiting to be written to the transport, or None
+        if the connection cannot take any more frames.
+        """
+        if self.ws_proto.state is not OPEN or not self.io_proto:
+            return None
+        transport = self.io_proto.transport
+        if transport is None or transport.is_closing():
+            return None
+        return transport.get_write_buffer_size()
+
+    def write_frame(self, frame: bytes) -> None:
+        """
+        Write a serialized frame to the transport, without waiting.
+        This is meant for frames that are serialized once and written to
+        many connections, like the messages of a
+        :class:`~sanic.server.websockets.hub.WebsocketHub`. The frame must
+        be unmasked and use no extensions, and the connection must be open,
+        see :attr:`write_backlog`. As it is written at once, it cannot be
+        interleaved with the frames of :meth:`send`, but it may be written
+        before those that are waiting for the transport.
+        """
+        self.io_proto.transport.write(frame)  # type: ignore
+        self.io_proto._time = self.io_proto._timer.time()  # type: ignore
+
     async def ping(self, data: Data | None = None) -> asyncio.Future:
         """
         Send a ping.
@@ -794,46 +780,28 @@ class WebsocketImplProtocol:
             if data:
                 await self.io_proto.send(data)
             else:
-                # Send an EOF - We don't actually send it,
-                # just trigger to autoclose the connection
-                if (
-                    self.auto_closer_task
-                    and not self.auto_closer_task.done()
-                    and self.data_finished_fut
-                    and not self.data_finished_fut.done()
-                ):
-                    # Auto-close the connection
-                    self.data_finished_fut.set_result(None)
-                else:
-                    # This will fail the connection appropriately
-                    SanicProtocol.close(self.io_proto, timeout=1.0)
+                self.data_finished()
 
-    async def async_data_received(self, data_to_send, events_to_process):
-        if self.ws_proto.state in (OPEN, CLOSING) and len(data_to_send) > 0:
-            # receiving data can generate data to send (eg, pong for a ping)
-            # send connection.data_to_send()
-            await self.send_data(data_to_send)
-        if len(events_to_process) > 0:
-            await self.process_events(events_to_process)
-
-    def data_received(self, data):
-        self.ws_proto.receive_data(data)
-        data_to_send = self.ws_proto.data_to_send()
-        events_to_process = self.ws_proto.events_received()
-        if len(data_to_send) > 0 or len(events_to_process) > 0:
-            asyncio.create_task(
-                self.async_data_received(data_to_send, events_to_process)
-            )
+    def write_data(self, data_to_send):
+        """
+        Write data without waiting, like the replies to control frames that
+        the connection sends while receiving.
+        """
+        for data in data_to_send:
+            if not data:
+                self.data_finished()
+            elif (
+                self.io_proto
+                and self.io_proto.transport
+                and not self.io_proto.transport.is_closing()
+            ):
+                self.io_proto.transport.write(data)
 
-    async def async_eof_received(self, data_to_send, events_to_process):
-        # receiving EOF can generate data to send
-        # send connection.data_to_send()
-        if self.ws_proto.state in (OPEN, CLOSING) and len(data_to_send) > 0:
-            await self.send_data(data_to_send)
-        if len(events_to_process) > 0:
-            await self.process_events(events_to_process)
-        if self.recv_cancel:
-            self.recv_cancel.cancel()
+    def data_finished(self):
+        """
+        Send an EOF - We don't actually send it, just trigger to autoclose
+        the connection
+        """
         if (
             self.auto_closer_task
             and not self.auto_closer_task.done()
@@ -842,18 +810,33 @@ class WebsocketImplProtocol:
         ):
             # Auto-close the connection
             self.data_finished_fut.set_result(None)
-            # Cancel the running handler if its waiting
         else:
             # This will fail the connection appropriately
             SanicProtocol.close(self.io_proto, timeout=1.0)
 
+    def data_received(self, data):
+        self.ws_proto.receive_data(data)
+        # Receiving data can generate data to send (eg, pong for a ping),
+        # which is sent before the events are processed. Neither needs to
+        # wait, so there is no task per chunk of data.
+        data_to_send = self.ws_proto.data_to_send()
+        if data_to_send and self.ws_proto.state in (OPEN, CLOSING):
+            self.write_data(data_to_send)
+        events_to_process = self.ws_proto.events_received()
+        if events_to_process:
+            self.process_events(events_to_process)
+
     def eof_received(self) -> bool | None:
         self.ws_proto.receive_eof()
         data_to_send = self.ws_proto.data_to_send()
+        if data_to_send and self.ws_proto.state in (OPEN, CLOSING):
+            self.write_data(data_to_send)
         events_to_process = self.ws_proto.events_received()
-        asyncio.create_task(
-            self.async_eof_received(data_to_send, events_to_process)
-        )
+        if events_to_process:
+            self.process_events(events_to_process)
+        if self.recv_cancel:
+            self.recv_cancel.cancel()
+        self.data_finished()
         return False
 
     def connection_lost(self, exc):
@@ -11,12 +11,14 @@ class TouchUp:
         for target, method_name in cls._registry:
             method = getattr(target, method_name)
 
-            if app.test_mode:
-                placeholder = f"_{method_name}"
-                if hasattr(target, placeholder):
-                    method = getattr(target, placeholder)
-                else:
-                    setattr(target, placeholder, method)
+            # Always build from the original method, since it may already be
+            # touched (in test mode, or in a process forked from a preloaded
+            # main process)
+            placeholder = f"_{method_name}"
+            if hasattr(target, placeholder):
+                method = getattr(target, placeholder)
+            else:
+                setattr(target, placeholder, method)
 
             module = getmodule(target)
             module_globals = dict(getmembers(module))
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import struct
+import sys
+
+from functools import lru_cache
+
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+
+# struct inotify_event {int wd; uint32_t mask, cookie, len; char name[];}
+EVENT = struct.Struct("iIII")
+READ_SIZE = 65536
+
+
+@lru_cache(maxsize=1)
+def _libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        init, add_watch = libc.inotify_init1, libc.inotify_add_watch
+    except (OSError, AttributeError):  # no cov
+        return None
+    init.argtypes = [ctypes.c_int]
+    add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+class Inotify:
+    """A minimal ctypes binding for the Linux inotify API.
+
+    Watches are added per directory, and `read` returns the events of all of
+    them as ``(directory, mask, name)`` tuples.
+    """
+
+    __slots__ = ("fd", "watches")
+
+    def __init__(self) -> None:
+        libc = _libc()
+        if libc is None:
+            raise OSError("inotify is not available")
+        self.fd: int = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches: dict[int, str] = {}
+
+    @staticmethod
+    def available() -> bool:
+        return _libc() is not None
+
+    def add_watch(self, path: str, mask: int) -> int:
+        """Watch a directory.
+
+        Args:
+            path (str): The directory to watch.
+            mask (int): The events to watch for.
+
+        Raises:
+            OSError: If the watch cannot be added, for example when the
+                ``fs.inotify.max_user_watches`` limit is reached.
+
+        Returns:
+            int: The watch descriptor.
+        """
+        wd = _libc().inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self.watches[wd] = path
+        return wd
+
+    def read(self, timeout: float | None) -> list[tuple[str, int, str]]:
+        """Wait for events.
+
+        Args:
+            timeout (Optional[float]): Seconds to wait for the first event.
+
+        Returns:
+            List[Tuple[str, int, str]]: The directory, event mask and file
+                name of each event. Empty if the timeout expired.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, READ_SIZE)
+        except BlockingIOError:  # no cov
+            return []
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT.unpack_from(data, offset)
+            offset += EVENT.size
+            name = data[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_IGNORED:
+                self.watches.pop(wd, None)
+                continue
+            events.append((self.watches.get(wd, ""), mask, os.fsdecode(name)))
+        return events
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> Inotify:
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
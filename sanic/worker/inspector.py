@@ -109,7 +109,7 @@ class Inspector:
 
     def _state_to_json(self) -> dict[str, Any]:
         output = {"info": self.app_info}
-        output["workers"] = self._make_safe(dict(self.worker_state))
+        output["workers"] = self._make_safe(dict(self.worker_state.items()))
         return output
 
     @staticmethod
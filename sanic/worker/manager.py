@@ -20,6 +20,7 @@ from sanic.log import error_logger, logger
 from sanic.worker.constants import RestartOrder
 from sanic.worker.process import ProcessState, Worker, WorkerProcess
 from sanic.worker.restarter import Restarter
+from sanic.worker.state import SharedWorkerState
 
 
 SIGKILL: int
@@ -440,6 +441,9 @@ class WorkerManager:
 
     def _sync_states(self):
         for process in self.processes:
+            alive = process.is_alive()
+            if not alive and isinstance(self.worker_state, SharedWorkerState):
+                self.worker_state.reset(process.name)
             try:
                 state = self.worker_state[process.name].get("state")
             except KeyError:
@@ -448,7 +452,7 @@ class WorkerManager:
             # Skip state sync if process is restarting to avoid race condition
             if process.state == ProcessState.RESTARTING:
                 continue
-            if not process.is_alive():
+            if not alive:
                 state = "FAILED" if process.exitcode else "COMPLETED"
             if state and process.state.name != state:
                 process.set_state(ProcessState[state], True)
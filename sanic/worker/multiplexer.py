@@ -5,7 +5,7 @@ from os import environ, getpid
 from typing import Any, Callable
 
 from sanic.log import Colors, logger
-from sanic.worker.process import ProcessState
+from sanic.worker.process import ProcessState, get_now
 from sanic.worker.state import WorkerState
 
 
@@ -36,10 +36,15 @@ class WorkerMultiplexer:
             self.name,
             self.pid,
         )
-        self._state._state[self.name] = {
+        record = {
             **self._state._state[self.name],
             "state": ProcessState.ACKED.name,
         }
+        started = record.get("restart_at") or record.get("start_at")
+        if started:
+            # Time from starting the process until it is ready to serve
+            record["startup"] = round((get_now() - started).total_seconds(), 3)
+        self._state._state[self.name] = record
 
     def manage(
         self,
@@ -94,6 +99,23 @@ class WorkerMultiplexer:
             "serving": serving,
         }
 
+    def report(
+        self,
+        metrics: dict[str, Any],
+        memory: dict[str, int] | None = None,
+    ) -> None:
+        """Publish runtime metrics of the worker to the Inspector.
+
+        Args:
+            metrics (Dict[str, Any]): The metrics, keyed by application name.
+            memory (Optional[Dict[str, int]]): The memory usage of the worker
+                process, in bytes.
+        """
+        record = {**self._state._state[self.name], "metrics": metrics}
+        if memory is not None:
+            record["memory"] = memory
+        self._state._state[self.name] = record
+
     def exit(self):
         """Run cleanup at worker exit."""
         try:
@@ -4,19 +4,67 @@ import os
 import sys
 
 from asyncio import new_event_loop
+from collections.abc import Iterator
 from itertools import chain
 from multiprocessing.connection import Connection
 from pathlib import Path
 from signal import SIGINT, SIGTERM
 from signal import signal as signal_func
-from time import sleep
+from time import monotonic, sleep
 
+from sanic.exceptions import SanicException
+from sanic.log import logger
 from sanic.server.events import trigger_events
+from sanic.worker.inotify import (
+    IN_CLOSE_WRITE,
+    IN_CREATE,
+    IN_ISDIR,
+    IN_MOVED_TO,
+    IN_ONLYDIR,
+    IN_Q_OVERFLOW,
+    Inotify,
+)
 from sanic.worker.loader import AppLoader
 
 
+try:
+    import watchfiles  # type: ignore
+
+    WATCHFILES_AVAILABLE = True
+except ModuleNotFoundError:  # no cov
+    WATCHFILES_AVAILABLE = False
+
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_ONLYDIR
+
+
 class Reloader:
+    """Watch the application's files and restart the workers on changes.
+
+    The files watched are all loaded Python modules and everything inside
+    the reload directories. Changes are detected with one of these watchers:
+
+    - ``"watchfiles"``: the ``watchfiles`` package, if it is installed
+    - ``"inotify"``: inotify events, on Linux
+    - ``"poll"``: checking the modification time of every file each
+      ``interval`` seconds
+
+    ``"auto"`` uses the first one available. The event based watchers wait
+    until changes stop for ``DEBOUNCE`` seconds, so that a burst of changes,
+    like a ``git checkout``, causes a single reload.
+
+    Args:
+        publisher (Connection): The connection to the worker manager.
+        interval (float): Seconds between polls, and the longest time to
+            notice that the reloader was stopped. Defaults to ``INTERVAL``.
+        reload_dirs (Set[Path]): Directories to watch in addition to the
+            Python modules.
+        app_loader (AppLoader): The loader of the application.
+        watcher (str): The watcher to use. Defaults to ``"auto"``.
+    """
+
     INTERVAL = 1.0  # seconds
+    DEBOUNCE = 0.1  # seconds
+    WATCHERS = ("auto", "watchfiles", "inotify", "poll")
 
     def __init__(
         self,
@@ -24,18 +72,38 @@ class Reloader:
         interval: float,
         reload_dirs: set[Path],
         app_loader: AppLoader,
+        watcher: str = "auto",
     ):
+        if watcher not in self.WATCHERS:
+            raise SanicException(
+                f"Unknown reload watcher: {watcher}. Choose one of: "
+                f"{', '.join(self.WATCHERS)}"
+            )
+        if watcher == "auto":
+            if WATCHFILES_AVAILABLE:
+                watcher = "watchfiles"
+            elif Inotify.available():
+                watcher = "inotify"
+            else:
+                watcher = "poll"
+        elif (watcher == "watchfiles" and not WATCHFILES_AVAILABLE) or (
+            watcher == "inotify" and not Inotify.available()
+        ):
+            raise SanicException(
+                f"Reload watcher {watcher} is not available. "
+                "Is its dependency installed?"
+            )
         self._publisher = publisher
         self.interval = interval or self.INTERVAL
         self.reload_dirs = reload_dirs
         self.run = True
         self.app_loader = app_loader
+        self.watcher = watcher
 
     def __call__(self) -> None:
         app = self.app_loader.load()
         signal_func(SIGINT, self.stop)
         signal_func(SIGTERM, self.stop)
-        mtimes: dict[str, float] = {}
 
         reloader_start = app.listeners.get("reload_process_start")
         reloader_stop = app.listeners.get("reload_process_stop")
@@ -45,6 +113,36 @@ class Reloader:
         if reloader_start:
             trigger_events(reloader_start, loop, app)
 
+        for changed in self.changes():
+            if before_trigger:
+                trigger_events(before_trigger, loop, app)
+            self.reload(",".join(changed))
+            if after_trigger:
+                trigger_events(after_trigger, loop, app, changed=changed)
+        if reloader_stop:
+            trigger_events(reloader_stop, loop, app)
+
+    def stop(self, *_):
+        self.run = False
+
+    def reload(self, reloaded_files):
+        message = f"__ALL_PROCESSES__:{reloaded_files}"
+        self._publisher.send(message)
+
+    def changes(self) -> Iterator[set[str]]:
+        """Wait for changes with the configured watcher until stopped.
+
+        Yields:
+            Set[str]: The paths of the changed files.
+        """
+        if self.watcher == "watchfiles":
+            return self.watchfiles_changes()
+        if self.watcher == "inotify":
+            return self.inotify_changes()
+        return self.poll_changes()
+
+    def poll_changes(self) -> Iterator[set[str]]:
+        mtimes: dict[str, float] = {}
         while self.run:
             changed = set()
             for filename in self.files():
@@ -59,22 +157,105 @@ class Reloader:
                 except OSError:
                     continue
             if changed:
-                if before_trigger:
-                    trigger_events(before_trigger, loop, app)
-                self.reload(",".join(changed) if changed else "unknown")
-                if after_trigger:
-                    trigger_events(after_trigger, loop, app, changed=changed)
+                yield changed
             sleep(self.interval)
-        else:
-            if reloader_stop:
-                trigger_events(reloader_stop, loop, app)
 
-    def stop(self, *_):
-        self.run = False
+    def inotify_changes(self) -> Iterator[set[str]]:
+        watched = self.watched_dirs()
+        with Inotify() as inotify:
+            try:
+                for directory in watched:
+                    inotify.add_watch(directory, INOTIFY_MASK)
+            except OSError as e:
+                logger.warning(
+                    "Cannot watch %s with inotify (%s), falling back to "
+                    "polling for changes",
+                    e.filename,
+                    e.strerror,
+                )
+                inotify.close()
+                yield from self.poll_changes()
+                return
 
-    def reload(self, reloaded_files):
-        message = f"__ALL_PROCESSES__:{reloaded_files}"
-        self._publisher.send(message)
+            while self.run:
+                events = inotify.read(self.interval)
+                if not events:
+                    continue
+                deadline = monotonic() + self.interval
+                while monotonic() < deadline:
+                    batch = inotify.read(self.DEBOUNCE)
+                    if not batch:
+                        break
+                    events.extend(batch)
+
+                changed = set()
+                for directory, mask, name in events:
+                    names = watched.get(directory, ())
+                    if mask & IN_Q_OVERFLOW:
+                        changed.add("unknown")
+                    elif mask & IN_ISDIR:
+                        if names is None:
+                            path = os.path.join(directory, name)
+                            self._watch_tree(inotify, path, watched)
+                    elif names is None or name in names:
+                        changed.add(os.path.join(directory, name))
+                if changed:
+                    yield changed
+
+    def watchfiles_changes(self) -> Iterator[set[str]]:
+        watched = self.watched_dirs()
+
+        def watch_filter(_, path: str) -> bool:
+            directory, name = os.path.split(path)
+            names = watched.get(directory, ())
+            return names is None or name in names
+
+        for changes in watchfiles.watch(
+            *watched,
+            watch_filter=watch_filter,
+            debounce=int(self.DEBOUNCE * 1000),
+            rust_timeout=int(self.interval * 1000),
+            yield_on_timeout=True,
+            raise_interrupt=False,
+            recursive=False,
+        ):
+            if not self.run:
+                break
+            if changes:
+                yield {path for _, path in changes}
+
+    def watched_dirs(self) -> dict[str, set[str] | None]:
+        """Find the directories to watch.
+
+        Directories are watched without their subdirectories, so that the
+        directories of the standard library and other installed packages
+        can be watched for the few modules that are loaded from them.
+
+        Returns:
+            Dict[str, Optional[Set[str]]]: The names of the files to watch
+                by directory, or `None` to watch all files in it.
+        """
+        watched: dict[str, set[str] | None] = {}
+        for filename in self.python_files():
+            directory, name = os.path.split(os.path.abspath(filename))
+            names = watched.setdefault(directory, set())
+            if names is not None:
+                names.add(name)
+        for reload_dir in self.reload_dirs:
+            for directory, _, _ in os.walk(reload_dir.resolve()):
+                watched[directory] = None
+        return watched
+
+    @staticmethod
+    def _watch_tree(
+        inotify: Inotify, path: str, watched: dict[str, set[str] | None]
+    ) -> None:
+        for directory, _, _ in os.walk(path):
+            try:
+                inotify.add_watch(directory, INOTIFY_MASK)
+            except OSError:
+                continue
+            watched[directory] = None
 
     def files(self):
         return chain(
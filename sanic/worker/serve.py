@@ -3,12 +3,13 @@ from __future__ import annotations
 import asyncio
 import os
 import socket
+import sys
 import warnings
 
 from functools import partial
 from multiprocessing.connection import Connection
 from ssl import SSLContext
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sanic.application.constants import ServerStage
 from sanic.application.state import ApplicationServerInfo
@@ -18,11 +19,21 @@ from sanic.logging.setup import setup_logging
 from sanic.models.server_types import Signal
 from sanic.server.protocols.http_protocol import HttpProtocol
 from sanic.server.runners import _serve_http_1, _serve_http_3
+from sanic.server.websockets.deflate import websocket_info
 from sanic.worker.loader import AppLoader, CertLoader
 from sanic.worker.multiplexer import WorkerMultiplexer
 from sanic.worker.process import Worker, WorkerProcess
 
 
+try:
+    import resource
+except ModuleNotFoundError:  # no cov
+    resource = None  # type: ignore
+
+if TYPE_CHECKING:
+    from sanic import Sanic
+
+
 def worker_serve(
     host,
     port,
@@ -104,6 +115,10 @@ def worker_serve(
                 a.multiplexer = WorkerMultiplexer(
                     monitor_publisher, worker_state
                 )
+            if app.config.INSPECTOR:
+                app.after_server_start(
+                    partial(_start_metrics_reporter, apps=apps)
+                )
 
         if app.debug:
             loop.set_debug(app.debug)
@@ -145,3 +160,72 @@ def worker_serve(
             multiplexer.terminate(True)
         else:
             raise e
+
+
+def _collect_metrics(app: Sanic) -> dict[str, Any]:
+    metrics: dict[str, Any] = {
+        "router_cache": app.router.cache.info(),
+        "router_errors": app.router.error_info(),
+    }
+    if app.error_pages is not None:
+        metrics["error_pages"] = app.error_pages.info()
+    if app.static_cache is not None:
+        metrics["static_cache"] = app.static_cache.info()
+    if app.compression is not None:
+        metrics["compression"] = app.compression.info()
+    if app.session_tickets is not None:
+        metrics["tls_sessions"] = app.session_tickets.info()
+    if app.ticket_store is not None:
+        metrics["http3_sessions"] = app.ticket_store.info()
+    if app.websocket_enabled:
+        metrics["websockets"] = websocket_info(app.websocket_connections)
+    return metrics
+
+
+def _memory_usage() -> dict[str, int]:
+    """Memory usage of the current process, in bytes.
+
+    On Linux, the resident memory is split into the pages that are shared
+    with other processes (such as those inherited from a preloaded main
+    process) and the pages that are private to this one. Elsewhere, only the
+    peak resident memory is known.
+    """
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            fields = dict(line.split(":", 1) for line in f if ":" in line)
+    except OSError:
+        if resource is None:  # no cov
+            return {}
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return {"peak_rss": peak if sys.platform == "darwin" else peak * 1024}
+
+    def kib(*names: str) -> int:
+        return 1024 * sum(int(fields[name].split()[0]) for name in names)
+
+    return {
+        "rss": kib("Rss"),
+        "shared": kib("Shared_Clean", "Shared_Dirty"),
+        "private": kib("Private_Clean", "Private_Dirty"),
+    }
+
+
+async def _report_metrics(app: Sanic, apps: list[Sanic]) -> None:
+    warned = False
+    while True:
+        memory = _memory_usage()
+        try:
+            app.multiplexer.report(
+                {a.name: _collect_metrics(a) for a in apps}, memory
+            )
+        except ValueError as e:
+            # The record of the worker is too large for the worker state,
+            # so only the memory usage is reported
+            if not warned:
+                error_logger.warning(f"Cannot report worker metrics: {e}")
+                warned = True
+            app.multiplexer.report({}, memory)
+        await asyncio.sleep(app.config.INSPECTOR_METRICS_INTERVAL)
+
+
+def _start_metrics_reporter(app: Sanic, apps: list[Sanic]) -> None:
+    app.add_task(_report_metrics(app, apps), name="ReportMetrics")
@@ -1,19 +1,38 @@
 from __future__ import annotations
 
-from collections.abc import ItemsView, Iterator, KeysView, Mapping, ValuesView
+import pickle
+import struct
+
+from collections.abc import (
+    ItemsView,
+    Iterator,
+    KeysView,
+    Mapping,
+    MutableMapping,
+    ValuesView,
+)
 from collections.abc import Mapping as MappingType
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from multiprocessing.shared_memory import SharedMemory
+from time import sleep
 from typing import Any
 
+from sanic.worker.constants import ProcessState
+
 
 class WorkerState(Mapping):
     RESTRICTED = (
         "health",
+        "memory",
+        "metrics",
         "pid",
         "requests",
         "restart_at",
         "server",
         "start_at",
         "starts",
+        "startup",
         "state",
     )
 
@@ -74,10 +93,342 @@ class WorkerState(Mapping):
         raise NotImplementedError
 
     def full(self) -> dict[str, Any]:
-        return dict(self._state)
+        return dict(self._state.items())
 
     def _write_error(self, keys: list[str]) -> None:
         raise LookupError(
             f"Cannot set restricted key{'s' if len(keys) > 1 else ''} on "
             f"WorkerState: {', '.join(keys)}"
         )
+
+
+class SharedWorkerState(MutableMapping):
+    """The state of all processes, kept in a table in shared memory.
+
+    This replaces a ``multiprocessing.Manager().dict()``, where every read and
+    write is a round trip to the manager process. It behaves like a mapping
+    of process names to state dicts, but every process reads the table in
+    its own memory.
+
+    Each process has a record of a fixed layout. The common keys (``state``,
+    ``server``, ``serving``, ``pid``, ``starts``, ``start_at``,
+    ``restart_at`` and ``requests``) are stored in fixed fields. Any other
+    keys are pickled into the rest of the record, which holds up to
+    ``extra_size`` bytes.
+
+    Writers hold a lock. Readers do not: every record has a sequence number
+    that is odd while the record is written, and a read is retried if the
+    number was odd or changed while reading (a seqlock). A process that dies
+    while writing leaves its record odd and the lock held. Readers then give
+    up after ``READ_RETRIES`` and use the last copy they read, writers give
+    up after ``LOCK_TIMEOUT`` seconds, and the main process repairs the
+    record with ``reset``.
+
+    Args:
+        lock (Any): A ``multiprocessing`` lock, shared by all writers.
+        slots (int): The maximum number of processes in the table.
+        extra_size (int): The size of the pickled keys of a record.
+    """
+
+    LOCK_TIMEOUT = 5.0
+    NAME_SIZE = 64
+    READ_RETRIES = 10_000
+    # seq, name, present, state, server, serving, pid, starts, start_at,
+    # restart_at, requests, extra length
+    HEADER = struct.Struct("=I64sHB??iIddQI")
+    SEQ = struct.Struct("=I")
+    STATES = tuple(state.name for state in ProcessState)
+    FIELDS = (
+        "state",
+        "server",
+        "serving",
+        "pid",
+        "starts",
+        "start_at",
+        "restart_at",
+        "requests",
+    )
+
+    def __init__(
+        self, lock: Any, slots: int = 256, extra_size: int = 16384
+    ) -> None:
+        self._lock = lock
+        self._slots = slots
+        self._extra_size = extra_size
+        self._record_size = self.HEADER.size + extra_size
+        self._shm = SharedMemory(create=True, size=slots * self._record_size)
+        self._shm.buf[: self._shm.size] = bytes(self._shm.size)
+        self._owner = True
+        self._index: dict[str, int] = {}
+        self._copies: dict[int, tuple[tuple[Any, ...], bytes]] = {}
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {
+            "name": self._shm.name,
+            "lock": self._lock,
+            "slots": self._slots,
+            "extra_size": self._extra_size,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self._lock = state["lock"]
+        self._slots = state["slots"]
+        self._extra_size = state["extra_size"]
+        self._record_size = self.HEADER.size + self._extra_size
+        self._shm = SharedMemory(name=state["name"])
+        self._owner = False
+        self._index = {}
+        self._copies = {}
+
+    def __getitem__(self, name: str) -> dict[str, Any]:
+        slot = self._find(name)
+        if slot is None:
+            raise KeyError(name)
+        record_name, record = self._read(slot)
+        if record_name != name:
+            raise KeyError(name)
+        return record
+
+    def __setitem__(self, name: str, record: Mapping[str, Any]) -> None:
+        encoded = self._encode_name(name)
+        header, extra = self._encode(name, record)
+        with self._locked():
+            slot = self._find(name)
+            if slot is None:
+                slot = self._find_free()
+            self._write(slot, encoded, header, extra)
+            self._index[name] = slot
+
+    def __delitem__(self, name: str) -> None:
+        with self._locked():
+            slot = self._find(name)
+            if slot is None:
+                raise KeyError(name)
+            self._write(slot, b"", (0,) * 10, b"")
+            self._index.pop(name, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.snapshot())
+
+    def __len__(self) -> int:
+        return len(self.snapshot())
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.snapshot()!r})"
+
+    def items(self) -> ItemsView[str, dict[str, Any]]:
+        return self.snapshot().items()
+
+    def values(self) -> ValuesView[dict[str, Any]]:
+        return self.snapshot().values()
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Read the records of all processes.
+
+        Every record is read with its name, so a process that is removed
+        while the table is read is left out, rather than listed without a
+        record.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The records, by process name.
+        """
+        buf = self._shm.buf
+        records = {}
+        for slot in range(self._slots):
+            if not self._name_at(buf, slot).strip(b"\0"):
+                continue
+            name, record = self._read(slot)
+            if name:
+                records[name] = record
+        return records
+
+    def reset(self, name: str) -> None:
+        """Repair the record of a process that died while writing it.
+
+        The last copy of the record that was read here is restored, or the
+        record is removed, and the lock is released. This must only be
+        called for a process that is no longer running.
+
+        Args:
+            name (str): The name of the process.
+        """
+        slot = self._find(name)
+        if slot is None:
+            return
+        buf = self._shm.buf
+        offset = slot * self._record_size
+        (seq,) = self.SEQ.unpack_from(buf, offset)
+        if not seq & 1:
+            return
+        # Only a writer that holds the lock leaves the sequence odd, so the
+        # record is repaired before the lock of the dead writer is released
+        copy = self._copies.get(slot)
+        if copy is not None and copy[0][1] == self._name_at(buf, slot):
+            header, extra = copy
+            self._write(slot, header[1], header[2:], extra)
+        else:
+            self._write(slot, b"", (0,) * 10, b"")
+            self._index.pop(name, None)
+        self._lock.release()
+
+    def close(self) -> None:
+        """Detach from the table, and remove it if it was created here."""
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        if not self._lock.acquire(timeout=self.LOCK_TIMEOUT):
+            raise RuntimeError(
+                "Timed out waiting for the lock of the worker state. A "
+                "process may have died while writing it."
+            )
+        try:
+            yield
+        finally:
+            self._lock.release()
+
+    def _find(self, name: str) -> int | None:
+        encoded = self._encode_name(name)
+        buf = self._shm.buf
+        slot = self._index.get(name)
+        if slot is not None and self._name_at(buf, slot) == encoded:
+            return slot
+        for slot in range(self._slots):
+            if self._name_at(buf, slot) == encoded:
+                self._index[name] = slot
+                return slot
+        return None
+
+    def _find_free(self) -> int:
+        buf = self._shm.buf
+        for slot in range(self._slots):
+            if not self._name_at(buf, slot).strip(b"\0"):
+                return slot
+        raise RuntimeError(
+            f"Cannot track more than {self._slots} processes in the worker "
+            "state"
+        )
+
+    def _name_at(self, buf: memoryview, slot: int) -> bytes:
+        offset = slot * self._record_size + self.SEQ.size
+        return bytes(buf[offset : offset + self.NAME_SIZE])
+
+    def _encode_name(self, name: str) -> bytes:
+        encoded = name.encode()
+        if not encoded or len(encoded) > self.NAME_SIZE:
+            raise KeyError(
+                f"Invalid process name for the worker state: {name}"
+            )
+        return encoded.ljust(self.NAME_SIZE, b"\0")
+
+    def _write(
+        self, slot: int, name: bytes, header: tuple[Any, ...], extra: bytes
+    ) -> None:
+        buf = self._shm.buf
+        offset = slot * self._record_size
+        (seq,) = self.SEQ.unpack_from(buf, offset)
+        # The sequence is already odd if a writer died while writing
+        seq |= 1
+        self.SEQ.pack_into(buf, offset, seq)
+        self.HEADER.pack_into(buf, offset, seq, name, *header)
+        start = offset + self.HEADER.size
+        buf[start : start + len(extra)] = extra
+        self.SEQ.pack_into(buf, offset, seq + 1)
+
+    def _read(self, slot: int) -> tuple[str, dict[str, Any]]:
+        buf = self._shm.buf
+        offset = slot * self._record_size
+        start = offset + self.HEADER.size
+        for _ in range(self.READ_RETRIES):
+            (seq,) = self.SEQ.unpack_from(buf, offset)
+            if not seq & 1:
+                header = self.HEADER.unpack_from(buf, offset)
+                length = min(header[-1], self._extra_size)
+                extra = bytes(buf[start : start + length])
+                if self.SEQ.unpack_from(buf, offset)[0] == seq:
+                    self._copies[slot] = header, extra
+                    break
+            sleep(0)
+        else:
+            # The writer did not finish, it may have died while writing
+            if slot not in self._copies:
+                raise RuntimeError(
+                    f"Cannot read the worker state in slot {slot}, it is "
+                    "being written"
+                )
+            header, extra = self._copies[slot]
+        name = header[1].rstrip(b"\0").decode()
+        return name, self._decode(header[2:], extra)
+
+    def _encode(
+        self, name: str, record: Mapping[str, Any]
+    ) -> tuple[tuple[Any, ...], bytes]:
+        values: dict[str, Any] = {}
+        extra: dict[str, Any] = {}
+        for key, value in record.items():
+            if key in self.FIELDS and self._fits(key, value):
+                values[key] = value
+            else:
+                extra[key] = value
+        present = 0
+        for bit, key in enumerate(self.FIELDS):
+            if key in values:
+                present |= 1 << bit
+        encoded = pickle.dumps(extra) if extra else b""
+        if len(encoded) > self._extra_size:
+            raise ValueError(
+                f"The worker state of {name} is too large: {len(encoded)} "
+                f"bytes, the limit is {self._extra_size}"
+            )
+        header = (
+            present,
+            self.STATES.index(values["state"]) if "state" in values else 0,
+            values.get("server", False),
+            values.get("serving", False),
+            values.get("pid", 0),
+            values.get("starts", 0),
+            values["start_at"].timestamp() if "start_at" in values else 0.0,
+            values["restart_at"].timestamp()
+            if "restart_at" in values
+            else 0.0,
+            values.get("requests", 0),
+            len(encoded),
+        )
+        return header, encoded
+
+    def _decode(self, header: tuple[Any, ...], extra: bytes) -> dict[str, Any]:
+        present, state, server, serving, pid, starts, start_at = header[:7]
+        restart_at, requests = header[7:9]
+        fields = {
+            "state": self.STATES[state],
+            "server": server,
+            "serving": serving,
+            "pid": pid,
+            "starts": starts,
+            "start_at": datetime.fromtimestamp(start_at, tz=timezone.utc),
+            "restart_at": datetime.fromtimestamp(restart_at, tz=timezone.utc),
+            "requests": requests,
+        }
+        record = {
+            key: fields[key]
+            for bit, key in enumerate(self.FIELDS)
+            if present & (1 << bit)
+        }
+        if extra:
+            record.update(pickle.loads(extra))
+        return record
+
+    def _fits(self, key: str, value: Any) -> bool:
+        if key == "state":
+            return value in self.STATES
+        if key in ("server", "serving"):
+            return isinstance(value, bool)
+        if key in ("start_at", "restart_at"):
+            return isinstance(value, datetime) and value.tzinfo is timezone.utc
+        if key == "pid":
+            return type(value) is int and -(2**31) <= value < 2**31
+        if key == "starts":
+            return type(value) is int and 0 <= value < 2**32
+        return type(value) is int and 0 <= value < 2**64
@@ -188,6 +188,7 @@ extras_require = {
     "all": all_require,
     "ext": ["sanic-ext"],
     "http3": ["aioquic"],
+    "compression": ["brotli", "zstandard"],
 }
 
 setup_kwargs["install_requires"] = requirements
@@ -0,0 +1,33 @@
+import pytest
+
+from sanic.http.parser import HeadParser
+
+
+SIMPLE_HEAD = b"GET / HTTP/1.1\r\nHost: localhost"
+BROWSER_HEAD = (
+    b"GET /static/css/app.css?v=1234 HTTP/1.1\r\n"
+    b"Host: www.example.com\r\n"
+    b"User-Agent: Mozilla/5.0 (X11; Linux x86_64; rv:130.0) "
+    b"Gecko/20100101 Firefox/130.0\r\n"
+    b"Accept: text/css,*/*;q=0.1\r\n"
+    b"Accept-Language: en-US,en;q=0.5\r\n"
+    b"Accept-Encoding: gzip, deflate, br, zstd\r\n"
+    b"Connection: keep-alive\r\n"
+    b"Referer: https://www.example.com/\r\n"
+    b"Cookie: " + b"; ".join(b"c%d=%s" % (i, b"x" * 32) for i in range(20))
+)
+
+
+class TestSanicHeadParser:
+    @pytest.mark.parametrize("name", ("python", "httptools"))
+    @pytest.mark.parametrize(
+        "head", (SIMPLE_HEAD, BROWSER_HEAD), ids=("simple", "browser")
+    )
+    def test_parse_head(self, benchmark, name, head):
+        parser = HeadParser.get(name)
+        head = bytearray(head)
+
+        result = benchmark.pedantic(
+            parser.parse, (head,), iterations=1000, rounds=100
+        )
+        assert result.method == "GET"
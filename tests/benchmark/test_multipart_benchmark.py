@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+
+from sanic.request import parse_multipart_form, parse_multipart_stream
+
+
+BOUNDARY = b"----sanic"
+
+
+def make_body(size: int) -> bytes:
+    return (
+        b"------sanic\r\n"
+        b'Content-Disposition: form-data; name="field"\r\n'
+        b"\r\n"
+        b"value\r\n"
+        b"------sanic\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="a.bin"\r\n'
+        b"Content-Type: application/octet-stream\r\n"
+        b"\r\n" + b"x" * size + b"\r\n------sanic--\r\n"
+    )
+
+
+async def chunked(body: bytes, size: int = 65536):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+class TestSanicMultipart:
+    @pytest.mark.parametrize("size", (1024, 1_048_576), ids=("1k", "1m"))
+    def test_parse_multipart_form(self, benchmark, size):
+        body = make_body(size)
+
+        fields, files = benchmark.pedantic(
+            parse_multipart_form, (body, BOUNDARY), rounds=200
+        )
+        assert len(files.get("file").body) == size
+
+    @pytest.mark.parametrize("size", (1024, 1_048_576), ids=("1k", "1m"))
+    @pytest.mark.parametrize("spool_size", (None, 65536), ids=("mem", "spool"))
+    def test_parse_multipart_stream(self, benchmark, size, spool_size):
+        body = make_body(size)
+        loop = asyncio.new_event_loop()
+
+        def parse():
+            return loop.run_until_complete(
+                parse_multipart_stream(chunked(body), BOUNDARY, spool_size)
+            )
+
+        fields, files = benchmark.pedantic(parse, rounds=200)
+        loop.close()
+        assert fields.get("field") == "value"
@@ -0,0 +1,487 @@
+import tracemalloc
+
+import pytest
+
+from websockets.frames import Frame, Opcode
+
+from sanic import Request, Sanic, empty, json, raw, text
+from sanic.compat import Header
+from tests.client import Http3Client, ProtocolClient
+
+
+def make_request(
+    method: str = "GET",
+    path: str = "/",
+    headers: dict[str, str] | None = None,
+    body: bytes = b"",
+) -> bytes:
+    head = f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+    for name, value in (headers or {}).items():
+        head += f"{name}: {value}\r\n"
+    if body:
+        head += f"Content-Length: {len(body)}\r\n"
+    return head.encode() + b"\r\n" + body
+
+
+@pytest.fixture
+def client(app: Sanic):
+    clients = []
+
+    def make_client(client_class=ProtocolClient):
+        client = client_class(app)
+        clients.append(client)
+        return client
+
+    yield make_client
+    for client in clients:
+        client.close()
+
+
+class TestSanicRequest:
+    """End-to-end benchmarks of one request on a keep-alive connection.
+
+    Run with ``tox -e benchmark`` to save the results as a JSON baseline in
+    ``.benchmarks`` and compare them with the previous run.
+    """
+
+    @pytest.mark.parametrize("count", (5, 50), ids=("5h", "50h"))
+    def test_header_parsing(self, benchmark, app, client, count):
+        @app.get("/")
+        async def handler(request):
+            return empty()
+
+        headers = {f"X-Header-{i}": "x" * 32 for i in range(count)}
+        http = client()
+        data = make_request(headers=headers)
+
+        response = benchmark.pedantic(http.send, (data,), rounds=2000)
+        assert response.startswith(b"HTTP/1.1 204 ")
+
+    @pytest.mark.parametrize("static", (False, True), ids=("dynamic", "block"))
+    def test_response_headers(self, benchmark, app, client, static):
+        headers = {
+            "server": "sanic",
+            "access-control-allow-origin": "*",
+            "strict-transport-security": "max-age=63072000",
+            "x-content-type-options": "nosniff",
+            "x-frame-options": "DENY",
+            "referrer-policy": "no-referrer",
+            "content-security-policy": "default-src 'self'",
+            "cross-origin-opener-policy": "same-origin",
+        }
+        if static:
+            app.config.RESPONSE_HEADERS = headers
+
+        @app.get("/")
+        async def handler(request):
+            return empty(headers=None if static else headers)
+
+        http = client()
+        data = make_request()
+
+        response = benchmark.pedantic(http.send, (data,), rounds=2000)
+        assert b"\r\nx-frame-options: DENY\r\n" in response
+
+    @pytest.mark.parametrize(
+        "path", ("/static/99", "/typed/42/slug-99"), ids=("static", "typed")
+    )
+    def test_routing(self, benchmark, app, client, path):
+        async def handler(request, **_):
+            return empty()
+
+        for i in range(100):
+            app.add_route(handler, f"/static/{i}", name=f"static_{i}")
+            app.add_route(
+                handler, f"/typed/<id:int>/slug-{i}", name=f"typed_{i}"
+            )
+        http = client()
+        data = make_request(path=path)
+
+        response = benchmark.pedantic(http.send, (data,), rounds=2000)
+        assert response.startswith(b"HTTP/1.1 204 ")
+
+    @pytest.mark.parametrize("fast", (False, True), ids=("raise", "fast"))
+    def test_not_found(self, benchmark, app, client, fast):
+        app.config.FAST_ROUTING_ERRORS = fast
+
+        @app.get("/")
+        async def handler(request):
+            return empty()
+
+        http = client()
+        data = make_request(path="/wp-login.php")
+
+        response = benchmark.pedantic(http.send, (data,), rounds=2000)
+        assert response.startswith(b"HTTP/1.1 404 ")
+        assert (app.error_pages is not None) is fast
+
+    @pytest.mark.parametrize("count", (0, 10), ids=("0m", "10m"))
+    def test_middleware(self, benchmark, app, client, count):
+        @app.get("/")
+        async def handler(request):
+            return empty()
+
+        for _ in range(count // 2):
+
+            @app.on_request
+            async def on_request(request):
+                request.ctx.seen = True
+
+            @app.on_response
+            async def on_response(request, response):
+                response.headers["x-seen"] = "1"
+
+        http = client()
+        data = make_request()
+
+        response = benchmark.pedantic(http.send, (data,), rounds=2000)
+        assert response.startswith(b"HTTP/1.1 204 ")
+
+    @pytest.mark.parametrize("size", (10, 1000), ids=("10i", "1000i"))
+    def test_json_response(self, benchmark, app, client, size):
+        payload = [{"id": i, "name": f"item {i}"} for i in range(size)]
+
+        @app.get("/")
+        async def handler(request):
+            return json(payload)
+
+        http = client()
+        data = make_request()
+
+        response = benchmark.pedantic(http.send, (data,), rounds=1000)
+        assert response.startswith(b"HTTP/1.1 200 ")
+
+    @pytest.mark.parametrize("chunks", (1, 16), ids=("1c", "16c"))
+    def test_streaming_response(self, benchmark, app, client, chunks):
+        chunk = b"x" * 4096
+
+        @app.get("/")
+        async def handler(request):
+            response = await request.respond(content_type="text/plain")
+            for _ in range(chunks):
+                await response.send(chunk)
+            await response.eof()
+
+        http = client()
+        data = make_request()
+
+        response = benchmark.pedantic(http.send, (data,), rounds=1000)
+        assert response.endswith(b"0\r\n\r\n")
+
+    @pytest.mark.parametrize("size", (1024, 262_144), ids=("1k", "256k"))
+    def test_multipart_upload(self, benchmark, app, client, size):
+        @app.post("/")
+        async def handler(request):
+            return text(str(len(request.files["file"][0].body)))
+
+        body = (
+            b"--sanic\r\n"
+            b'Content-Disposition: form-data; name="field"\r\n'
+            b"\r\n"
+            b"value\r\n"
+            b"--sanic\r\n"
+            b'Content-Disposition: form-data; name="file"; '
+            b'filename="a.bin"\r\n'
+            b"Content-Type: application/octet-stream\r\n"
+            b"\r\n" + b"x" * size + b"\r\n--sanic--\r\n"
+        )
+        headers = {"Content-Type": "multipart/form-data; boundary=sanic"}
+        http = client()
+        data = make_request("POST", headers=headers, body=body)
+
+        response = benchmark.pedantic(http.send, (data,), rounds=500)
+        assert response.endswith(str(size).encode())
+
+    @pytest.mark.parametrize("size", (16, 16384), ids=("16b", "16k"))
+    def test_websocket_frames(self, benchmark, app, client, size):
+        @app.websocket("/ws")
+        async def handler(request, ws):
+            while True:
+                await ws.send(await ws.recv())
+
+        http = client()
+        response = http.send(
+            make_request(
+                path="/ws",
+                headers={
+                    "Upgrade": "websocket",
+                    "Connection": "Upgrade",
+                    "Sec-WebSocket-Key": "dGhlIHNhbXBsZSBub25jZQ==",
+                    "Sec-WebSocket-Version": "13",
+                },
+            )
+        )
+        assert response.startswith(b"HTTP/1.1 101 ")
+
+        payload = b"x" * size
+        frame = Frame(Opcode.BINARY, payload).serialize(
+            mask=True, extensions=[]
+        )
+        length = len(
+            Frame(Opcode.BINARY, payload).serialize(mask=False, extensions=[])
+        )
+
+        def echoed(transport):
+            return len(transport.buffer) >= length
+
+        response = benchmark.pedantic(http.send, (frame, echoed), rounds=2000)
+        assert response.endswith(payload)
+
+    @pytest.mark.parametrize("count", (1, 30), ids=("1c", "30c"))
+    def test_cookie_parsing(self, benchmark, app, client, count):
+        @app.get("/")
+        async def handler(request):
+            return text(str(len(request.cookies)))
+
+        cookie = "; ".join(f"cookie{i}=value{i}" for i in range(count))
+        http = client()
+        data = make_request(headers={"Cookie": cookie})
+
+        response = benchmark.pedantic(http.send, (data,), rounds=2000)
+        assert response.endswith(str(count).encode())
+
+
+class TestSanicThroughput:
+    """Upload and download throughput of HTTP/1.1 and HTTP/3.
+
+    Both run in memory. HTTP/3 datagrams are passed between an aioquic
+    client and the server protocol, so QUIC flow control and congestion
+    control are part of the measurement.
+    """
+
+    SIZE = 1 << 20
+
+    @pytest.fixture
+    def app(self, app: Sanic):
+        data = b"x" * self.SIZE
+
+        @app.post("/upload", stream=True)
+        async def upload(request):
+            size = 0
+            async for chunk in request.stream:
+                size += len(chunk)
+            return text(str(size))
+
+        @app.get("/download")
+        async def download(request):
+            response = await request.respond(
+                content_type="application/octet-stream"
+            )
+            for i in range(0, len(data), 65536):
+                await response.send(data[i : i + 65536])
+            await response.eof()
+
+        return app
+
+    def test_upload_http1(self, benchmark, client):
+        http = client()
+        data = make_request("POST", "/upload", body=b"x" * self.SIZE)
+
+        response = benchmark.pedantic(http.send, (data,), rounds=20)
+        assert response.endswith(str(self.SIZE).encode())
+
+    def test_upload_http3(self, benchmark, client):
+        http = client(Http3Client)
+        args = ("POST", "/upload", b"x" * self.SIZE)
+
+        _, body = benchmark.pedantic(http.request, args, rounds=20)
+        assert body == str(self.SIZE).encode()
+
+    def test_download_http1(self, benchmark, client):
+        http = client()
+        data = make_request(path="/download")
+
+        response = benchmark.pedantic(http.send, (data,), rounds=20)
+        assert len(response) > self.SIZE
+
+    def test_download_http3(self, benchmark, client):
+        http = client(Http3Client)
+
+        _, body = benchmark.pedantic(
+            http.request, ("GET", "/download"), rounds=20
+        )
+        assert len(body) == self.SIZE
+
+
+class TestSanicAllocations:
+    """Memory allocated to send large HTTP/1.1 response bodies.
+
+    The peak traced by `tracemalloc` while sending a response is saved in
+    ``extra_info``. The transport only counts what it is given, so the peak
+    is made of the copies that Sanic makes of the body.
+    """
+
+    SIZE = 8 << 20
+    CHUNK = 1 << 20
+
+    @pytest.fixture
+    def app(self, app: Sanic):
+        data = b"x" * self.SIZE
+
+        @app.get("/body")
+        async def body(request):
+            return raw(data)
+
+        @app.get("/stream")
+        async def stream(request):
+            response = await request.respond(
+                content_type="application/octet-stream"
+            )
+            view = memoryview(data)
+            for i in range(0, len(data), self.CHUNK):
+                await response.send(view[i : i + self.CHUNK])
+            await response.eof()
+
+        return app
+
+    @pytest.mark.parametrize(
+        "path,end",
+        (("/body", b"x"), ("/stream", b"0\r\n\r\n")),
+        ids=("body", "stream"),
+    )
+    def test_large_response(self, benchmark, client, path, end):
+        http = client()
+        transport = http.transport
+        written = 0
+
+        def write(data):
+            nonlocal written
+            written += len(data)
+            if written > self.SIZE and bytes(data[-len(end) :]) == end:
+                transport.waiter.set_result(None)
+
+        def writelines(list_of_data):
+            for data in list_of_data:
+                write(data)
+
+        transport.write, transport.writelines = write, writelines
+        data = make_request(path=path)
+
+        def send():
+            nonlocal written
+            written = 0
+            tracemalloc.start()
+            try:
+                http.send(data)
+                return tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        peak = benchmark.pedantic(send, rounds=5)
+        benchmark.extra_info["peak_memory"] = peak
+        assert written > self.SIZE
+        assert peak < self.CHUNK
+
+
+class TestRequestAllocations:
+    """Memory blocks allocated to construct a `Request`.
+
+    The blocks that are still allocated by `Request.__init__` for each
+    request, as counted by `tracemalloc`, are saved in ``extra_info``.
+    """
+
+    COUNT = 1000
+
+    @pytest.mark.parametrize(
+        "url", (b"/", b"/items/42?page=2&sort=name"), ids=("path", "query")
+    )
+    def test_request_construction(self, benchmark, app, url):
+        headers = Header(
+            [("host", "localhost")]
+            + [(f"x-header-{i}", "x" * 32) for i in range(10)]
+        )
+
+        def construct():
+            tracemalloc.start()
+            try:
+                requests = [
+                    Request(url, headers, "1.1", "GET", None, app)
+                    for _ in range(self.COUNT)
+                ]
+                snapshot = tracemalloc.take_snapshot()
+            finally:
+                tracemalloc.stop()
+            del requests
+            stats = snapshot.filter_traces(
+                [
+                    tracemalloc.Filter(
+                        True, Request.__init__.__code__.co_filename
+                    )
+                ]
+            ).statistics("filename")
+            return sum(stat.count for stat in stats) / self.COUNT
+
+        blocks = benchmark.pedantic(construct, rounds=5)
+        benchmark.extra_info["blocks_per_request"] = blocks
+        assert blocks < 4
+
+
+class TestHandleRequest:
+    """`Sanic.handle_request` on its own, without the HTTP protocol.
+
+    The requests are given a stream that only keeps the response, so the
+    time is spent routing the request and running the handler, middleware
+    and signals of its route.
+    """
+
+    COUNT = 1000
+
+    class Stream:
+        request_body = 0
+        response = None
+
+        def respond(self, response):
+            response.stream = self
+            self.response = response
+            return response
+
+        async def send(self, data, end_stream): ...
+
+    @pytest.mark.parametrize(
+        "kind",
+        ("async", "sync", "middleware", "signal"),
+        ids=("async", "sync", "middleware", "signal"),
+    )
+    def test_handle_request(self, benchmark, app, client, kind):
+        if kind == "sync":
+
+            @app.get("/")
+            def sync_handler(request):
+                return empty()
+
+        else:
+
+            @app.get("/")
+            async def handler(request):
+                return empty()
+
+        if kind == "middleware":
+
+            @app.on_request
+            async def on_request(request):
+                request.ctx.seen = True
+
+            @app.on_response
+            async def on_response(request, response):
+                response.headers["x-seen"] = "1"
+
+        elif kind == "signal":
+
+            @app.signal("http.handler.before")
+            async def before(request): ...
+
+        loop = client().loop
+        headers = Header([("host", "localhost")])
+
+        async def handle():
+            for _ in range(self.COUNT):
+                request = Request(b"/", headers, "1.1", "GET", None, app)
+                request.stream = self.Stream()
+                await app.handle_request(request)
+            return request.stream.response
+
+        def run():
+            return loop.run_until_complete(handle())
+
+        response = benchmark.pedantic(run, rounds=50)
+        assert response.status == 204
@@ -0,0 +1,70 @@
+import pytest
+
+from sanic import Sanic
+from sanic.http import Http
+from sanic.request import Request
+
+
+class FakeProtocol:
+    def __init__(self, app: Sanic, chunks: list[bytes]):
+        self.app = app
+        self.chunks = chunks
+        self.recv_buffer = bytearray()
+        self.request_class = Request
+        self.request_max_size = app.config.REQUEST_MAX_SIZE
+        self.state = {"requests_count": 0}
+        self.transport = None
+        self.trace = None
+
+    async def send(self, data):  # no cov
+        ...
+
+    async def receive_more(self):
+        self.recv_buffer += self.chunks.pop(0)
+
+
+def make_head(size: int) -> bytes:
+    head = b"GET / HTTP/1.1\r\nHost: localhost\r\n"
+    cookie = b"Cookie: " + b"x" * (size - len(head) - 12) + b"\r\n"
+    return head + cookie + b"\r\n"
+
+
+async def dispatch(*_, **__):
+    # Signals are removed by the ODE touchup when nothing listens to them
+    ...
+
+
+def drive(coro):
+    try:
+        coro.send(None)
+    except StopIteration:
+        pass
+    else:  # no cov
+        raise RuntimeError("Coroutine should not suspend")
+
+
+class TestSanicRequestHead:
+    @pytest.mark.parametrize("size", (1024, 8192, 16384), ids=str)
+    @pytest.mark.parametrize("chunk_size", (None, 512), ids=("whole", "512b"))
+    def test_http1_request_header(self, benchmark, app, size, chunk_size):
+        app.config.REQUEST_MAX_HEADER_SIZE = 16384
+        app.config.REQUEST_BUFFER_SIZE = 65536
+        head = make_head(size)
+        chunks = [
+            head[i : i + (chunk_size or size)]
+            for i in range(0, len(head), chunk_size or size)
+        ]
+
+        def setup():
+            http = Http(FakeProtocol(app, list(chunks)))
+            http.dispatch = dispatch
+            http.init_for_request()
+            return (http,), {}
+
+        def parse(http):
+            drive(http.http1_request_header())
+            return http
+
+        http = benchmark.pedantic(parse, setup=setup, rounds=2000)
+        assert len(http.request.head) == len(head) - 4
+        assert not http.recv_buffer
@@ -1,16 +1,17 @@
 from random import choice, seed
 
-from pytest import mark
-
-import sanic.router
+from pytest import fixture, mark
 
 from sanic.request import Request
 
 
 seed("Pack my box with five dozen liquor jugs.")
 
-# Disable Caching for testing purpose
-sanic.router.ROUTER_CACHE_SIZE = 0
+
+@fixture(autouse=True)
+def disable_cache(app):
+    # Disable Caching for testing purpose
+    app.config.ROUTER_CACHE_SIZE = 0
 
 
 class TestSanicRouteResolution:
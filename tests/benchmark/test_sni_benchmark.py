@@ -0,0 +1,40 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sanic.http.tls.context import CertSelector, selector_sni_callback
+
+
+class TestCertSelector:
+    """Selection of a certificate for the SNI of a TLS handshake.
+
+    Every context lists an exact name and a wildcard, and the names are
+    requested from the last certificates, which are the slowest to find
+    when the contexts are walked in order.
+    """
+
+    @pytest.mark.parametrize(
+        "count", (10, 1_000, 10_000), ids=("10", "1k", "10k")
+    )
+    def test_sni_callback(self, benchmark, count):
+        ctxs = [
+            SimpleNamespace(
+                sanic={"names": [f"host{i}.example", f"*.host{i}.test"]}
+            )
+            for i in range(count)
+        ]
+        selector = CertSelector([None, *ctxs])
+        names = [
+            name
+            for i in range(count - 10, count)
+            for name in (f"host{i}.example", f"www.host{i}.test")
+        ]
+        sslobj = SimpleNamespace()
+
+        def handshakes():
+            for name in names:
+                selector_sni_callback(sslobj, name, selector)
+
+        benchmark(handshakes)
+        assert sslobj.context is ctxs[-1]
+        assert sslobj.sanic_server_name == f"www.host{count - 1}.test"
@@ -0,0 +1,50 @@
+import pytest
+
+from sanic import Sanic, empty
+
+
+@pytest.fixture
+def app(app: Sanic):
+    async def handler(request, **_):
+        return empty()
+
+    for i in range(100):
+        app.add_route(handler, f"/static/{i}", name=f"static_{i}")
+        app.add_route(
+            handler,
+            f"/typed/<item_id:int>/<slug:slug>/{i}",
+            name=f"typed_{i}",
+        )
+    app.config.SERVER_NAME = "example.com"
+    app.router.finalize()
+    return app
+
+
+class TestSanicURLFor:
+    """Building 100 URLs with `Sanic.url_for`, as a page of links would."""
+
+    def test_static(self, benchmark, app):
+        def build():
+            return [app.url_for(f"static_{i}") for i in range(100)]
+
+        urls = benchmark.pedantic(build, rounds=1000)
+        assert urls[-1] == "/static/99"
+
+    def test_external(self, benchmark, app):
+        def build():
+            return [
+                app.url_for(f"static_{i}", _external=True) for i in range(100)
+            ]
+
+        urls = benchmark.pedantic(build, rounds=1000)
+        assert urls[-1] == "http://example.com/static/99"
+
+    def test_params(self, benchmark, app):
+        def build():
+            return [
+                app.url_for(f"typed_{i}", item_id=i, slug="some-slug", page=2)
+                for i in range(100)
+            ]
+
+        urls = benchmark.pedantic(build, rounds=1000)
+        assert urls[-1] == "/typed/99/some-slug/99?page=2"
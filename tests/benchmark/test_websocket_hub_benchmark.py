@@ -0,0 +1,69 @@
+import asyncio
+
+from types import SimpleNamespace
+
+import pytest
+
+from sanic.server.websockets.hub import WebsocketHub
+from sanic.server.websockets.impl import (
+    OPEN,
+    ServerProtocol,
+    WebsocketImplProtocol,
+)
+
+
+class CountingTransport(asyncio.Transport):
+    """A transport that counts the bytes written to it, and drops them."""
+
+    def __init__(self):
+        super().__init__()
+        self.written = 0
+
+    def write(self, data):
+        self.written += len(data)
+
+    def get_write_buffer_size(self):
+        return 0
+
+    def is_closing(self):
+        return False
+
+
+class TestWebsocketHub:
+    """Fan-out of one message to every subscriber of a channel.
+
+    The rate of messages written to subscribers is saved in ``extra_info``
+    as ``messages_per_second``.
+    """
+
+    @pytest.mark.parametrize(
+        "count", (1_000, 10_000, 50_000), ids=("1k", "10k", "50k")
+    )
+    def test_publish(self, benchmark, count):
+        hub = WebsocketHub()
+        transports = []
+        for _ in range(count):
+            ws = WebsocketImplProtocol(ServerProtocol(state=OPEN))
+            transport = CountingTransport()
+            ws.io_proto = SimpleNamespace(
+                transport=transport,
+                _time=0.0,
+                _timer=SimpleNamespace(time=lambda: 0.0),
+            )
+            transports.append(transport)
+            hub.subscribe(ws, "news")
+        message = "x" * 128
+
+        written = benchmark.pedantic(hub.publish, ("news", message), rounds=20)
+        # There are no stats when benchmarks are disabled
+        if benchmark.stats:
+            benchmark.extra_info["messages_per_second"] = (
+                count / benchmark.stats.stats.mean
+            )
+        assert written == count
+        # Every round writes one frame to each subscriber, and a disabled
+        # benchmark runs a single round
+        size = len(hub.frame(message))
+        rounds = transports[0].written // size
+        assert rounds in (1, 20)
+        assert all(t.written == rounds * size for t in transports)
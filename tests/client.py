@@ -1,4 +1,5 @@
 import asyncio
+import re
 
 from textwrap import dedent
 from typing import AnyStr
@@ -45,3 +46,276 @@ class RawClient:
             .lstrip("\n")
             .replace("\n", self.CRLF.decode("utf-8"))
         )
+
+
+class ProtocolTransport(asyncio.Transport):
+    """In-memory transport that collects everything a protocol writes."""
+
+    def __init__(self):
+        super().__init__()
+        self.buffer = bytearray()
+        self.protocol = None
+        self.waiter = None
+        self.expected = None
+        self.closing = False
+
+    def write(self, data):
+        self.buffer += data
+        if self.waiter and not self.waiter.done() and self.expected(self):
+            self.waiter.set_result(None)
+
+    def writelines(self, list_of_data):
+        for data in list_of_data:
+            self.buffer += data
+        self.write(b"")
+
+    def is_closing(self):
+        return self.closing
+
+    def get_protocol(self):
+        return self.protocol
+
+    def set_protocol(self, protocol):
+        self.protocol = protocol
+
+    def close(self):
+        self.closing = True
+
+    def abort(self):
+        self.closing = True
+
+    def can_write_eof(self):
+        return False
+
+    def get_extra_info(self, name, default=None):
+        return {
+            "peername": ("127.0.0.1", 54321),
+            "sockname": ("127.0.0.1", 8000),
+        }.get(name, default)
+
+    def set_write_buffer_limits(self, high=None, low=None): ...
+
+    def pause_reading(self): ...
+
+    def resume_reading(self): ...
+
+    def response_complete(self) -> bool:
+        end = self.buffer.find(b"\r\n\r\n")
+        if end < 0:
+            return False
+        head = bytes(self.buffer[:end]).lower()
+        if b"\r\ntransfer-encoding: chunked" in head:
+            return self.buffer.endswith(b"0\r\n\r\n")
+        match = re.search(rb"\r\ncontent-length: (\d+)", head)
+        length = int(match[1]) if match else 0
+        return len(self.buffer) - end - 4 >= length
+
+
+class ProtocolClient:
+    """Drive a Sanic protocol with raw bytes, without any sockets.
+
+    The app is started on a private event loop, and each call to `send`
+    feeds bytes to ``data_received`` and runs the loop until the response
+    has been written to the transport.
+    """
+
+    def __init__(self, app):
+        from sanic.server import HttpProtocol
+        from sanic.server.protocols.websocket_protocol import (
+            WebSocketProtocol,
+        )
+
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(app._startup())
+        protocol_class = (
+            WebSocketProtocol if app.websocket_enabled else HttpProtocol
+        )
+        self.protocol = protocol_class(loop=self.loop, app=app)
+        self.transport = ProtocolTransport()
+        self.transport.set_protocol(self.protocol)
+        self.protocol.connection_made(self.transport)
+
+    def send(self, data: bytes, expected=None) -> bytes:
+        """Send data and wait for the response.
+
+        Args:
+            data: The raw bytes to send.
+            expected: A callable that is given the transport and returns
+                whether everything expected was written. Defaults to waiting
+                for one whole HTTP response.
+
+        Returns:
+            The bytes written by the protocol.
+        """
+        transport = self.transport
+        transport.buffer.clear()
+        transport.expected = expected or ProtocolTransport.response_complete
+        transport.waiter = self.loop.create_future()
+        self.loop.call_soon(self.protocol.data_received, data)
+        self.loop.run_until_complete(transport.waiter)
+        return bytes(transport.buffer)
+
+    def close(self):
+        self.transport.close()
+        self.protocol.connection_lost(None)
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(
+            asyncio.gather(*tasks, return_exceptions=True)
+        )
+        self.loop.close()
+
+
+class Http3Transport(asyncio.DatagramTransport):
+    """Deliver the datagrams of a server protocol to a callback."""
+
+    def __init__(self, receive):
+        self.receive = receive
+
+    def sendto(self, data, addr=None):
+        self.receive(data)
+
+    def get_extra_info(self, name, default=None):
+        if name in ("peername", "sockname"):
+            return ("127.0.0.1", 8443)
+        return default
+
+
+class Http3Client:
+    """Drive an HTTP/3 server protocol through in-memory QUIC connections.
+
+    Like `ProtocolClient`, there are no sockets. Datagrams are passed
+    between an aioquic client connection and `Http3Protocol` on a private
+    event loop, so flow control and congestion control still apply.
+    """
+
+    ADDR = ("127.0.0.1", 8443)
+
+    def __init__(self, app):
+        from pathlib import Path
+
+        from aioquic.buffer import Buffer
+        from aioquic.h3.connection import H3_ALPN, H3Connection
+        from aioquic.quic.configuration import QuicConfiguration
+        from aioquic.quic.connection import QuicConnection
+        from aioquic.quic.packet import pull_quic_header
+
+        from sanic.server.protocols.http_protocol import Http3Protocol
+
+        self.app = app
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_until_complete(app._startup())
+
+        self.quic = QuicConnection(
+            configuration=QuicConfiguration(
+                alpn_protocols=H3_ALPN,
+                is_client=True,
+                max_datagram_frame_size=65536,
+                verify_mode=0,
+            )
+        )
+        self.quic._ack_delay = 0
+        self.quic.connect(self.ADDR, now=self.loop.time())
+        self.h3 = H3Connection(self.quic)
+        self.responses = {}
+        self._scheduled = False
+
+        first = self.quic.datagrams_to_send(now=self.loop.time())
+        header = pull_quic_header(Buffer(data=first[0][0]), host_cid_length=8)
+        certs = Path(__file__).parent / "certs" / "localhost"
+        configuration = QuicConfiguration(
+            alpn_protocols=H3_ALPN,
+            is_client=False,
+            max_datagram_frame_size=65536,
+        )
+        configuration.load_cert_chain(
+            certs / "fullchain.pem", certs / "privkey.pem"
+        )
+        server = QuicConnection(
+            configuration=configuration,
+            original_destination_connection_id=header.destination_cid,
+        )
+        server._ack_delay = 0
+
+        async def connect():
+            self.protocol = Http3Protocol(server, app=app, stream_handler=None)
+            self.protocol.connection_made(Http3Transport(self._receive))
+            waiter = self.loop.create_future()
+            self.responses[None] = waiter
+            for data, _ in first:
+                self.protocol.datagram_received(data, self.ADDR)
+            await waiter
+
+        self.loop.run_until_complete(connect())
+
+    def _receive(self, data: bytes) -> None:
+        self.quic.receive_datagram(data, self.ADDR, now=self.loop.time())
+        if not self._scheduled:
+            self._scheduled = True
+            self.loop.call_soon(self._process)
+
+    def _process(self) -> None:
+        from aioquic.h3.events import DataReceived, HeadersReceived
+        from aioquic.quic.events import HandshakeCompleted
+
+        self._scheduled = False
+        event = self.quic.next_event()
+        while event is not None:
+            if isinstance(event, HandshakeCompleted):
+                self.responses.pop(None).set_result(None)
+            for http_event in self.h3.handle_event(event):
+                response = self.responses.get(http_event.stream_id)
+                if response is None:
+                    continue
+                if isinstance(http_event, HeadersReceived):
+                    response[0].extend(http_event.headers)
+                elif isinstance(http_event, DataReceived):
+                    response[1].extend(http_event.data)
+                if http_event.stream_ended:
+                    del self.responses[http_event.stream_id]
+                    response[2].set_result((response[0], bytes(response[1])))
+            event = self.quic.next_event()
+        self._transmit()
+
+    def _transmit(self) -> None:
+        for data, _ in self.quic.datagrams_to_send(now=self.loop.time()):
+            self.protocol.datagram_received(data, self.ADDR)
+
+    def request(self, method: str, path: str, body: bytes = b""):
+        """Send a request and wait for the response.
+
+        Returns:
+            The response headers and body.
+        """
+        stream_id = self.quic.get_next_available_stream_id()
+        waiter = self.loop.create_future()
+        self.responses[stream_id] = ([], bytearray(), waiter)
+        self.h3.send_headers(
+            stream_id,
+            [
+                (b":method", method.encode()),
+                (b":scheme", b"https"),
+                (b":authority", b"localhost"),
+                (b":path", path.encode()),
+            ],
+            end_stream=not body,
+        )
+        if body:
+            self.h3.send_data(stream_id, body, end_stream=True)
+        self.loop.call_soon(self._transmit)
+        return self.loop.run_until_complete(waiter)
+
+    def close(self):
+        self.quic.close()
+        self._transmit()
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(
+            asyncio.gather(*tasks, return_exceptions=True)
+        )
+        self.loop.close()
@@ -1,3 +1,5 @@
+import asyncio
+
 from unittest.mock import Mock
 
 import pytest
@@ -134,12 +136,13 @@ async def test_http_receiver_respond(app: Sanic, http_request: Request):
 async def test_http_receiver_receive_body(app: Sanic, http_request: Request):
     receiver = generate_http_receiver(app, http_request)
     receiver.request_max_size = 4
+    receiver.request_body = True
 
     receiver.receive_body(b"..")
-    assert receiver.request.body == b".."
+    assert list(receiver.body_chunks) == [b".."]
 
     receiver.receive_body(b"..")
-    assert receiver.request.body == b"...."
+    assert list(receiver.body_chunks) == [b"..", b".."]
 
     with pytest.raises(
         PayloadTooLarge, match="Request body exceeds the size limit"
@@ -147,6 +150,69 @@ async def test_http_receiver_receive_body(app: Sanic, http_request: Request):
         receiver.receive_body(b"..")
 
 
+async def test_http_receiver_read(app: Sanic, http_request: Request):
+    receiver = generate_http_receiver(app, http_request)
+    receiver.request_body = True
+    receiver.receive_body(b"foo")
+    receiver.receive_body(b"bar")
+
+    assert await receiver.read() == b"foobar"
+
+    read = asyncio.ensure_future(receiver.read())
+    await asyncio.sleep(0)
+    assert not read.done()
+
+    receiver.receive_body(b"baz")
+    assert await read == b"baz"
+
+    receiver.receive_body(b"", end_stream=True)
+    assert await receiver.read() is None
+    assert receiver.request_body is False
+
+
+async def test_http_receiver_iterate(app: Sanic, http_request: Request):
+    receiver = generate_http_receiver(app, http_request)
+    receiver.request_body = True
+
+    async def feed():
+        for chunk in (b"foo", b"bar", b"baz"):
+            await asyncio.sleep(0)
+            receiver.receive_body(chunk, end_stream=chunk == b"baz")
+
+    task = asyncio.ensure_future(feed())
+    assert [chunk async for chunk in receiver] == [b"foo", b"bar", b"baz"]
+    await task
+
+
+async def test_http_receiver_send_waits_for_credit(
+    app: Sanic, http_request: Request
+):
+    receiver = generate_http_receiver(app, http_request)
+    receiver.protocol.quic_event_received(
+        ProtocolNegotiated(alpn_protocol="h3")
+    )
+    http_request._protocol = receiver.protocol
+    receiver.head_only = False
+    receiver.stage = Stage.HANDLER
+    receiver.respond(empty(status=200))
+    buffered = HTTPReceiver.WRITE_HIGH_WATER + 1
+    receiver.send_buffered = lambda: buffered  # type: ignore
+
+    send = asyncio.ensure_future(receiver.send(b"x", False))
+    await asyncio.sleep(0)
+    assert not send.done()
+    assert receiver.protocol.http.paused == {receiver}
+
+    receiver.protocol.transmit()
+    await asyncio.sleep(0)
+    assert not send.done()
+
+    buffered = HTTPReceiver.WRITE_LOW_WATER
+    receiver.protocol.transmit()
+    await send
+    assert not receiver.protocol.http.paused
+
+
 async def test_http3_events(app):
     protocol = generate_protocol(app)
     http3 = Http3(protocol, protocol.transmit)
@@ -163,7 +229,8 @@ async def test_http3_events(app):
             False,
         )
     )
-    http3.http_event_received(DataReceived(b"foobar", 1, False))
+    http3.http_event_received(DataReceived(b"foo", 1, False))
+    http3.http_event_received(DataReceived(b"bar", 1, True))
     receiver = http3.receivers[1]
 
     assert len(http3.receivers) == 1
@@ -171,7 +238,8 @@ async def test_http3_events(app):
     assert receiver.request.path == "/location"
     assert receiver.request.method == "GET"
     assert receiver.request.headers["foo"] == "bar"
-    assert receiver.request.body == b"foobar"
+    assert receiver.request_body is False
+    assert await receiver.read() == b"foobar"
 
 
 async def test_send_headers(app: Sanic, http_request: Request):
@@ -213,6 +281,35 @@ async def test_send_headers(app: Sanic, http_request: Request):
     )
 
 
+async def test_send_traces_size(app: Sanic, http_request: Request):
+    receiver = generate_http_receiver(app, http_request)
+    receiver.protocol.quic_event_received(
+        ProtocolNegotiated(alpn_protocol="h3")
+    )
+    http_request._protocol = receiver.protocol
+    receiver.head_only = False
+    receiver.stage = Stage.HANDLER
+    receiver.respond(empty(status=200))
+    receiver.trace = Mock()
+
+    await receiver.send(b"\xff\xfe", True)
+
+    assert receiver.trace.call_args_list[0].args[1:] == (2, True)
+
+
+async def test_send_headers_streaming(app: Sanic, http_request: Request):
+    receiver = generate_http_receiver(app, http_request)
+    response = json({}, headers={"transfer-encoding": "chunked"})
+    response.body = None
+
+    headers = receiver._prepare_headers(response)
+
+    assert headers == [
+        (b":status", b"200"),
+        (b"content-type", b"application/json"),
+    ]
+
+
 async def test_multiple_streams(app):
     protocol = generate_protocol(app)
     http3 = Http3(protocol, protocol.transmit)
@@ -337,3 +434,23 @@ async def test_request_url_encoding(app):
         )
     assert exc_info.value.status_code == 400
     assert str(exc_info.value) == "URL may only contain US-ASCII characters."
+
+
+async def test_http_receiver_send_buffered(app: Sanic, http_request: Request):
+    receiver = generate_http_receiver(app, http_request)
+    receiver.protocol.quic_event_received(
+        ProtocolNegotiated(alpn_protocol="h3")
+    )
+    http_request._protocol = receiver.protocol
+    quic = receiver.protocol._quic
+    stream_id = http_request.stream_id
+    quic.send_stream_data(stream_id, b"x" * 100)
+
+    # Fails if aioquic no longer has the attributes that are read
+    assert receiver.send_buffered() == 100
+
+    quic._streams[stream_id].sender = object()
+    assert receiver.send_buffered() == 0
+
+    del quic._streams[stream_id]
+    assert receiver.send_buffered() == 0
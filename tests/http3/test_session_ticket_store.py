@@ -1,4 +1,8 @@
-from datetime import datetime
+import os
+import threading
+import time
+
+from datetime import datetime, timezone
 
 from aioquic.tls import CipherSuite, SessionTicket
 
@@ -44,3 +48,109 @@ def test_session_ticket_store():
 
     assert len(store.tickets) == 0
     assert popped1 is ticket1
+
+
+def test_session_ticket_store_bounds(monkeypatch):
+    now = 100.0
+    monkeypatch.setattr("sanic.http.http3.time.monotonic", lambda: now)
+    store = SessionTicketStore(max_size=2, lifetime=10)
+
+    for label in (b"foo", b"bar", b"baz"):
+        store.add(_generate_ticket(label))
+    assert list(store.tickets) == [b"bar", b"baz"]
+
+    now = 111.0
+    assert store.pop(b"bar") is None
+    store.add(_generate_ticket(b"qux"))
+    assert list(store.tickets) == [b"qux"]
+
+    assert store.pop(b"qux").ticket == b"qux"
+    assert store.pop(b"qux") is None
+    assert store.info() == {"size": 0, "hits": 1, "misses": 2}
+
+
+def test_session_ticket_store_directory(tmp_path):
+    directory = tmp_path / "tickets"
+    first = SessionTicketStore(directory=directory)
+    second = SessionTicketStore(directory=directory)
+    ticket = _generate_ticket(b"foo")
+    ticket.other_extensions = [(1, b"\x00")]
+
+    first.add(ticket)
+    first.close()
+    assert directory.stat().st_mode & 0o777 == 0o700
+    assert (directory / b"foo".hex()).stat().st_mode & 0o777 == 0o600
+
+    shared = second.pop(b"foo")
+    assert shared == SessionTicket(
+        ticket.age_add,
+        ticket.cipher_suite,
+        ticket.not_valid_after.astimezone(timezone.utc),
+        ticket.not_valid_before.astimezone(timezone.utc),
+        ticket.resumption_secret,
+        ticket.server_name,
+        ticket.ticket,
+        ticket.max_early_data_size,
+        ticket.other_extensions,
+    )
+    assert not list(directory.iterdir())
+    assert second.pop(b"foo") is None
+
+
+def test_session_ticket_store_single_use(tmp_path):
+    first = SessionTicketStore(directory=tmp_path)
+    second = SessionTicketStore(directory=tmp_path)
+    foo, bar = _generate_ticket(b"foo"), _generate_ticket(b"bar")
+    first.add(foo)
+    first.add(bar)
+    first.close()
+
+    # The worker that issued a ticket cannot use it after another one did
+    assert second.pop(b"foo").ticket == b"foo"
+    assert first.pop(b"foo") is None
+    # The worker that issued it uses its own copy, and then no one can
+    assert first.pop(b"bar") is bar
+    assert second.pop(b"bar") is None
+    assert not list(tmp_path.iterdir())
+    assert first.info() == {"size": 0, "hits": 1, "misses": 1}
+
+
+def test_session_ticket_store_prune(tmp_path):
+    store = SessionTicketStore(max_size=2, lifetime=10, directory=tmp_path)
+    for label in (b"foo", b"bar", b"baz"):
+        store.add(_generate_ticket(label))
+    store.close()
+    old = time.time() - 11
+    os.utime(tmp_path / b"foo".hex(), (old, old))
+    os.utime(tmp_path / b"bar".hex(), (old + 2, old + 2))
+    (tmp_path / b"qux".hex()).touch()
+
+    store.prune()
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(
+        [b"baz".hex(), b"qux".hex()]
+    )
+    assert (
+        SessionTicketStore(lifetime=10, directory=tmp_path).pop(b"bar") is None
+    )
+
+
+def test_session_ticket_store_thread(tmp_path, monkeypatch):
+    threads = []
+    store = SessionTicketStore(directory=tmp_path)
+    write = store._write
+
+    def record(ticket):
+        threads.append(threading.current_thread())
+        write(ticket)
+
+    monkeypatch.setattr(store, "_write", record)
+    ticket = _generate_ticket(b"foo")
+
+    store.add(ticket)
+    store.close()
+    assert store.pop(b"foo") is ticket
+
+    assert len(threads) == 1
+    assert threading.current_thread() not in threads
+    assert not list(tmp_path.iterdir())
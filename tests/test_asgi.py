@@ -674,3 +674,16 @@ async def test_asgi_url_decoding(app):
 
     _, response = await app.asgi_client.get("/dir/some%F0%9F%98%80path")
     assert response.text == "some😀path"
+
+
+@pytest.mark.asyncio
+async def test_asgi_response_headers_config(app):
+    app.config.RESPONSE_HEADERS = {"X-Frame-Options": "DENY", "Server": "a"}
+
+    @app.get("/")
+    def handler(request: Request):
+        return text("hi", headers={"server": "handler"})
+
+    _, response = await app.asgi_client.get("/")
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers.get_list("server") == ["handler"]
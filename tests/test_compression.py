@@ -0,0 +1,205 @@
+import gzip
+import os
+
+import pytest
+
+from sanic_testing.reusable import ReusableClient
+
+from sanic import Sanic, json, text
+from sanic.exceptions import SanicException
+from sanic.http.compression import GzipCompressor, ResponseCompression
+from sanic.response import HTTPResponse
+
+
+BODY = "The quick brown fox jumps over the lazy dog. " * 100
+
+
+@pytest.fixture
+def app(app: Sanic):
+    app.config.COMPRESSION = True
+
+    @app.route("/text", methods=["GET", "HEAD"])
+    async def text_handler(request):
+        return text(BODY)
+
+    @app.get("/small")
+    async def small_handler(request):
+        return text("small")
+
+    @app.get("/json")
+    async def json_handler(request):
+        return json({"text": BODY}, headers={"ETag": '"abc"'})
+
+    @app.get("/binary")
+    async def binary_handler(request):
+        return HTTPResponse(
+            BODY.encode(), content_type="application/octet-stream"
+        )
+
+    @app.get("/encoded")
+    async def encoded_handler(request):
+        return text(BODY, headers={"Content-Encoding": "identity"})
+
+    @app.get("/stream")
+    async def stream_handler(request):
+        response = await request.respond(content_type="text/plain")
+        for i in range(0, len(BODY), 100):
+            await response.send(BODY[i : i + 100])
+        await response.eof()
+
+    return app
+
+
+def test_compression_disabled_by_default(app: Sanic):
+    app.config.COMPRESSION = False
+
+    _, response = app.test_client.get(
+        "/text", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert app.compression is None
+    assert "Content-Encoding" not in response.headers
+    assert "Vary" not in response.headers
+    assert response.text == BODY
+
+
+def test_compression_gzip(app: Sanic):
+    _, response = app.test_client.get(
+        "/text", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(BODY)
+    assert response.text == BODY
+
+
+def test_compression_weakens_etag(app: Sanic):
+    _, response = app.test_client.get(
+        "/json", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == 'W/"abc"'
+    assert response.json == {"text": BODY}
+
+
+@pytest.mark.parametrize(
+    "path,accept_encoding,vary",
+    (
+        ("/text", "identity", True),
+        ("/text", "gzip;q=0", True),
+        ("/small", "gzip", True),
+        ("/binary", "gzip", False),
+        ("/encoded", "gzip", False),
+    ),
+)
+def test_compression_skipped(app: Sanic, path, accept_encoding, vary):
+    _, response = app.test_client.get(
+        path, headers={"Accept-Encoding": accept_encoding}
+    )
+
+    assert response.headers.get("Content-Encoding") in (None, "identity")
+    assert ("Vary" in response.headers) is vary
+    assert response.headers["Content-Length"] == str(len(response.body))
+
+
+def test_compression_head(app: Sanic):
+    _, response = app.test_client.head(
+        "/text", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Content-Length"] == str(len(BODY))
+
+
+def test_compression_streaming(app: Sanic):
+    _, response = app.test_client.get(
+        "/stream", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Transfer-Encoding"] == "chunked"
+    assert "Content-Length" not in response.headers
+    assert response.text == BODY
+
+
+def test_compression_reuses_compressors(app: Sanic, port: int):
+    client = ReusableClient(app, port=port)
+
+    with client:
+        for path in ("/text", "/stream", "/text"):
+            _, response = client.get(path, headers={"Accept-Encoding": "gzip"})
+            assert response.text == BODY
+
+    assert app.compression.info() == {
+        "responses": {"gzip": 3},
+        "created": 1,
+        "reused": 2,
+        "pooled": 1,
+    }
+
+
+def test_gzip_compressor_reuse():
+    compressor = GzipCompressor()
+    for _ in range(3):
+        data = os.urandom(64) * 64
+        encoded = (
+            compressor.compress(data[:1000])
+            + compressor.flush()
+            + compressor.compress(data[1000:])
+            + compressor.finish()
+        )
+        assert gzip.decompress(encoded) == data
+        assert compressor.reset()
+
+    assert gzip.decompress(compressor.finish()) == b""
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,expected",
+    (
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("deflate, gzip", "gzip"),
+        ("*", "zstd"),
+        ("gzip, zstd", "zstd"),
+        ("gzip, zstd;q=0.5", "gzip"),
+        ("*, zstd;q=0", "gzip"),
+        ("gzip;q=0.5, identity", None),
+        ("deflate", None),
+    ),
+)
+def test_negotiate(accept_encoding, expected):
+    compression = ResponseCompression("gzip", 0, "text/")
+    # Pretend that zstd is installed, and preferred over gzip
+    compression.codings = ("zstd", "gzip")
+
+    assert compression.negotiate(accept_encoding) == expected
+
+
+@pytest.mark.parametrize(
+    "content_type,expected",
+    (
+        ("text/html; charset=utf-8", True),
+        ("TEXT/CSS", True),
+        ("application/json", True),
+        ("application/problem+json", True),
+        ("application/jsonp", False),
+        ("image/png", False),
+        ("", False),
+    ),
+)
+def test_compressible(content_type, expected):
+    compression = ResponseCompression(
+        ["gzip"], 0, "text/, application/json, +json"
+    )
+
+    assert compression.compressible(content_type) is expected
+
+
+def test_unknown_coding():
+    with pytest.raises(SanicException, match="Unknown content coding: lzma"):
+        ResponseCompression("gzip, lzma", 0, "text/")
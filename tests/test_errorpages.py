@@ -11,6 +11,8 @@ from sanic.exceptions import NotFound, SanicException
 from sanic.handlers import ErrorHandler
 from sanic.request import Request
 from sanic.response import HTTPResponse, empty, html, json, text
+from sanic.worker.serve import _collect_metrics
+from tests.client import ProtocolClient
 
 
 @pytest.fixture
@@ -573,3 +575,106 @@ def test_exception_header_on_renderers(app: Sanic, format, expected):
     assert response.status == 400
     assert response.headers.get("exception") == "test"
     assert response.content_type == expected
+
+
+@pytest.fixture
+def fast_app(app: Sanic):
+    app.config.FAST_ROUTING_ERRORS = True
+
+    @app.get("/only-get")
+    async def handler(request):
+        return empty()
+
+    return app
+
+
+@pytest.fixture
+def fast_client(fast_app: Sanic):
+    clients = []
+
+    def send(method: str, path: str, accept: str = "*/*"):
+        if not clients:
+            clients.append(ProtocolClient(fast_app))
+        data = clients[0].send(
+            f"{method} {path} HTTP/1.1\r\naccept: {accept}\r\n\r\n".encode()
+        )
+        head, body = data.split(b"\r\n\r\n", 1)
+        status, *lines = head.decode().split("\r\n")
+        headers = {
+            name.lower(): value
+            for name, value in (line.split(": ", 1) for line in lines)
+        }
+        return int(status.split()[1]), headers, body
+
+    yield send
+    for client in clients:
+        client.close()
+
+
+@pytest.mark.parametrize(
+    "accept,content_type",
+    (
+        ("text/html", "text/html; charset=utf-8"),
+        ("application/json", "application/json"),
+        ("text/plain", "text/plain; charset=utf-8"),
+    ),
+)
+def test_fast_routing_errors(
+    fast_app: Sanic, fast_client, accept, content_type
+):
+    status, headers, first = fast_client("GET", "/missing", accept)
+    _, _, second = fast_client("GET", "/other", accept)
+
+    assert status == 404
+    assert headers["content-type"] == content_type
+    assert first == second
+    assert b"Not Found" in first
+    assert b"/missing" not in first
+
+    status, headers, body = fast_client("POST", "/only-get", accept)
+    assert status == 405
+    assert headers["allow"] == "GET"
+    assert b"Method Not Allowed" in body
+    assert fast_app.error_pages.info() == {"size": 2, "hits": 1}
+    assert fast_app.router.error_info() == {
+        "not_found": 2,
+        "method_not_allowed": 1,
+    }
+    assert _collect_metrics(fast_app)["router_errors"] == {
+        "not_found": 2,
+        "method_not_allowed": 1,
+    }
+
+
+def test_fast_routing_errors_disabled(app: Sanic):
+    _, response = app.test_client.get("/missing")
+
+    assert response.status == 404
+    assert b"/missing" in response.body
+    assert app.error_pages is None
+
+
+@pytest.mark.parametrize("customize", ("handler", "middleware", "signal"))
+def test_fast_routing_errors_not_used(fast_app: Sanic, fast_client, customize):
+    if customize == "handler":
+
+        @fast_app.exception(SanicException)
+        async def on_error(request, exception):
+            return text("custom", status=exception.status_code)
+
+    elif customize == "middleware":
+
+        @fast_app.on_response
+        async def on_response(request, response):
+            response.headers["x-seen"] = "1"
+
+    else:
+
+        @fast_app.signal("http.lifecycle.exception")
+        async def on_exception(request, exception): ...
+
+    status, _, body = fast_client("GET", "/missing")
+
+    assert status == 404
+    assert b"/missing" in body or body == b"custom"
+    assert fast_app.error_pages is None
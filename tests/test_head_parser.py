@@ -0,0 +1,112 @@
+import pytest
+
+from sanic import Sanic, text
+from sanic.exceptions import SanicException
+from sanic.http import Http
+from sanic.http.parser import (
+    HeadParser,
+    HttptoolsHeadParser,
+    PythonHeadParser,
+    RequestHead,
+)
+
+
+PARSERS = [PythonHeadParser(), HttptoolsHeadParser()]
+
+
+@pytest.fixture(autouse=True)
+def reset_parser():
+    yield
+    Http.set_head_parser("python")
+
+
+@pytest.mark.parametrize("parser", PARSERS, ids=lambda p: p.name)
+def test_parse_head(parser: HeadParser):
+    head = (
+        b"POST /foo?bar=baz HTTP/1.1\r\n"
+        b"Host: localhost\r\n"
+        b"Content-Length: 5\r\n"
+        b"X-Multi: 1\r\n"
+        b"X-Multi: 2"
+    )
+    parsed = parser.parse(bytearray(head))
+
+    assert parsed == RequestHead(
+        "POST",
+        "/foo?bar=baz",
+        "HTTP/1.1",
+        [
+            ("host", "localhost"),
+            ("content-length", "5"),
+            ("x-multi", "1"),
+            ("x-multi", "2"),
+        ],
+        True,
+        True,
+    )
+
+
+@pytest.mark.parametrize("parser", PARSERS, ids=lambda p: p.name)
+@pytest.mark.parametrize(
+    "head,keep_alive",
+    (
+        (b"GET / HTTP/1.1", True),
+        (b"GET / HTTP/1.0", False),
+        (b"GET / HTTP/1.1\r\nConnection: close", False),
+        (b"GET / HTTP/1.0\r\nConnection: keep-alive", True),
+    ),
+)
+def test_parse_keep_alive(parser: HeadParser, head: bytes, keep_alive: bool):
+    assert parser.parse(head).keep_alive is keep_alive
+
+
+@pytest.mark.parametrize("parser", PARSERS, ids=lambda p: p.name)
+@pytest.mark.parametrize(
+    "head",
+    (
+        b"GET / HTTP/2.0",
+        b"GET /\r\nHost: localhost",
+        b"GET / HTTP/1.1\r\nbroken header",
+        b"POST / HTTP/1.1\r\nContent-Length: 1\r\nContent-Length: 1",
+        b"POST / HTTP/1.1\r\nContent-Length: 1\r\nTransfer-Encoding: chunked",
+    ),
+)
+def test_parse_invalid_head(parser: HeadParser, head: bytes):
+    with pytest.raises(Exception):
+        parser.parse(head)
+
+
+def test_get_parser():
+    assert isinstance(HeadParser.get("python"), PythonHeadParser)
+    assert isinstance(HeadParser.get("httptools"), HttptoolsHeadParser)
+    assert isinstance(HeadParser.get("auto"), HttptoolsHeadParser)
+
+
+def test_get_unknown_parser():
+    message = "Unknown request head parser: foo"
+    with pytest.raises(SanicException, match=message):
+        HeadParser.get("foo")
+
+
+def test_config_sets_parser(app: Sanic):
+    assert isinstance(Http.HEAD_PARSER, PythonHeadParser)
+
+    app.config.REQUEST_HEAD_PARSER = "httptools"
+
+    assert isinstance(Http.HEAD_PARSER, HttptoolsHeadParser)
+
+
+@pytest.mark.parametrize("name", ("python", "httptools"))
+def test_request_with_parser(app: Sanic, name: str):
+    app.config.REQUEST_HEAD_PARSER = name
+
+    @app.post("/")
+    async def handler(request):
+        return text(f"{request.headers['x-foo']} {request.body.decode()}")
+
+    _, response = app.test_client.post(
+        "/", headers={"X-Foo": "bar"}, content="baz"
+    )
+
+    assert response.status == 200
+    assert response.text == "bar baz"
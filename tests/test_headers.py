@@ -3,7 +3,7 @@ from unittest.mock import Mock
 import pytest
 
 from sanic import Sanic, headers, json, text
-from sanic.exceptions import InvalidHeader, PayloadTooLarge
+from sanic.exceptions import InvalidHeader, PayloadTooLarge, SanicException
 from sanic.http import Http
 from sanic.request import Request
 
@@ -222,6 +222,24 @@ def test_empty_accept():
     assert not a.match("*/*")
 
 
+@pytest.mark.parametrize(
+    "raw,expected",
+    (
+        (None, {}),
+        ("", {}),
+        ("gzip", {"gzip": 1.0}),
+        ("GZip, br", {"gzip": 1.0, "br": 1.0}),
+        ("gzip;q=0.5, br", {"br": 1.0, "gzip": 0.5}),
+        ("br;q=0, *;q=0.2, ,", {"*": 0.2, "br": 0.0}),
+        ("gzip;q=bad, zstd;q=2", {"zstd": 1.0, "gzip": 0.0}),
+    ),
+)
+def test_parse_accept_encoding(raw, expected):
+    parsed = headers.parse_accept_encoding(raw)
+    assert parsed == expected
+    assert list(parsed) == list(expected)
+
+
 def test_wildcard_accept_set_ok():
     accept = headers.parse_accept("*/*")[0]
     assert accept.type == "*"
@@ -467,3 +485,55 @@ def test_multiple_fields_accessor(app: Sanic):
         "/", headers=(("Example-Field", "Foo, Bar"), ("Example-Field", "Baz"))
     )
     assert response.json["field"] == "Foo, Bar,Baz"
+
+
+def test_header_block():
+    block = headers.HeaderBlock({"Server": "sanic", "X-Retries": 3})
+
+    assert block.names == ("server", "x-retries")
+    assert block.items == ((b"server", b"sanic"), (b"x-retries", b"3"))
+    assert block.encoded == b"server: sanic\r\nx-retries: 3\r\n"
+    assert headers.format_http1_response(
+        200, [(b"content-length", b"0")], block.encoded
+    ) == (
+        b"HTTP/1.1 200 OK\r\n"
+        b"server: sanic\r\nx-retries: 3\r\n"
+        b"content-length: 0\r\n\r\n"
+    )
+
+
+def test_header_block_exclude():
+    block = headers.HeaderBlock({"Server": "sanic", "X-Retries": 3})
+
+    assert block.exclude({"content-type": "text/plain"}) is block
+    assert block.exclude(
+        make_request({"SERVER": "other"}).headers
+    ).encoded == (b"x-retries: 3\r\n")
+
+
+@pytest.mark.parametrize(
+    "name,value",
+    (("bad name", "x"), ("x-bad:", "x"), ("x-split", "a\r\nx-b: c")),
+)
+def test_header_block_invalid(name, value):
+    with pytest.raises(SanicException, match="Invalid"):
+        headers.HeaderBlock({name: value})
+
+
+def test_response_headers_config(app: Sanic):
+    app.config.RESPONSE_HEADERS = {
+        "X-Frame-Options": "DENY",
+        "Server": "sanic",
+    }
+
+    @app.get("/")
+    async def handler(request: Request):
+        return text("hi", headers={"server": "handler"})
+
+    _, response = app.test_client.get("/")
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers.get_list("server") == ["handler"]
+
+    _, response = app.test_client.get("/missing")
+    assert response.status == 404
+    assert response.headers["server"] == "sanic"
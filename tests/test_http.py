@@ -8,9 +8,9 @@ import pytest
 
 from sanic_testing.reusable import ReusableClient
 
-from sanic import json, text
+from sanic import json, raw, text
 from sanic.app import Sanic
-from tests.client import RawClient
+from tests.client import ProtocolClient, RawClient
 
 
 parent_dir = Path(__file__).parent
@@ -191,3 +191,103 @@ def test_smuggle(client):
     headers, body = response.rsplit(b"\r\n\r\n", 1)
     assert b"400 Bad Request" in headers
     assert b"Bad Request" in body
+
+
+@pytest.fixture
+def writes(app: Sanic):
+    """Record the writes of a protocol client, with their buffers."""
+    body = b"x" * 65536
+
+    @app.get("/small")
+    async def small(request):
+        return raw(b"x" * 100)
+
+    @app.get("/large")
+    async def large(request):
+        return raw(body)
+
+    @app.get("/stream")
+    async def stream(request):
+        response = await request.respond()
+        await response.send(body)
+        await response.send(b"x" * 100)
+        await response.eof()
+
+    http = ProtocolClient(app)
+    calls = []
+    write, writelines = http.transport.write, http.transport.writelines
+
+    def record_write(data):
+        calls.append(data)
+        write(data)
+
+    def record_writelines(list_of_data):
+        calls.append(list(list_of_data))
+        writelines(list_of_data)
+
+    http.transport.write = record_write
+    http.transport.writelines = record_writelines
+
+    def send(path):
+        calls.clear()
+        response = http.send(f"GET {path} HTTP/1.1\r\n\r\n".encode())
+        return response, [c for c in calls if c]
+
+    send.body = body
+    yield send
+    http.close()
+
+
+def test_small_response_is_one_write(writes):
+    response, calls = writes("/small")
+
+    assert response.endswith(b"\r\n\r\n" + b"x" * 100)
+    assert len(calls) == 1
+    assert isinstance(calls[0], bytes)
+
+
+def test_large_response_is_not_copied(writes):
+    response, calls = writes("/large")
+
+    assert response.endswith(b"\r\n\r\n" + writes.body)
+    assert len(calls) == 1
+    head, body = calls[0]
+    assert head.startswith(b"HTTP/1.1 200 OK\r\n")
+    assert body is writes.body
+
+
+def test_large_chunk_is_not_copied(writes):
+    response, calls = writes("/stream")
+
+    assert response.endswith(
+        b"\r\n\r\n10000\r\n"
+        + writes.body
+        + b"\r\n64\r\n"
+        + b"x" * 100
+        + b"\r\n0\r\n\r\n"
+    )
+    assert calls[0][1:] == [b"10000\r\n", writes.body, b"\r\n"]
+    assert calls[0][2] is writes.body
+    assert calls[1] == b"64\r\n" + b"x" * 100 + b"\r\n"
+
+
+def test_send_signal_data_is_bytes(app: Sanic):
+    body = b"x" * 65536
+    sent = []
+
+    @app.get("/")
+    async def handler(request):
+        return raw(body)
+
+    @app.signal("http.lifecycle.send")
+    async def on_send(data):
+        sent.append(data)
+
+    http = ProtocolClient(app)
+    response = http.send(b"GET / HTTP/1.1\r\n\r\n")
+    http.close()
+
+    assert response.endswith(b"\r\n\r\n" + body)
+    assert len(sent) == 1
+    assert isinstance(sent[0], bytes)
+    assert sent[0] == response
@@ -2,8 +2,10 @@ import logging
 import sys
 import uuid
 
+from dataclasses import dataclass
 from importlib import reload
 from io import StringIO
+from itertools import count
 from unittest.mock import ANY, Mock
 
 import pytest
@@ -20,6 +22,7 @@ from sanic.logging.formatter import (
     ProdFormatter,
 )
 from sanic.logging.setup import setup_logging
+from sanic.logging.trace import ProtocolTracer
 from sanic.response import text
 
 
@@ -300,3 +303,57 @@ def test_log_extra_config_respected():
     app.test_client.get("/", debug=True)
 
     assert AutoFormatter.LOG_EXTRA is False
+
+
+@pytest.mark.parametrize("sample,traced", ((0, False), (1, True)))
+def test_protocol_trace_sample(app, caplog, sample, traced):
+    app.config.PROTOCOL_TRACE_SAMPLE = sample
+
+    @app.get("/")
+    def handler(request):
+        return text("hello")
+
+    with caplog.at_level(logging.INFO):
+        app.test_client.get("/")
+
+    messages = [
+        record.message
+        for record in caplog.records
+        if record.message.startswith("[conn ")
+    ]
+    assert bool(messages) is traced
+    if traced:
+        assert messages[0].endswith("] [request]: GET /")
+        assert "] [send]: HEADERS status=200 " in messages[1]
+
+
+def test_protocol_tracer_sampling(monkeypatch):
+    monkeypatch.setattr(ProtocolTracer, "_sampled", count())
+
+    traced = [ProtocolTracer.for_connection(3) for _ in range(6)]
+
+    assert [tracer is not None for tracer in traced] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+    assert traced[0].level == logging.INFO
+    assert ProtocolTracer.for_connection(0) is None
+
+
+def test_protocol_tracer_describe():
+    @dataclass
+    class DataReceived:
+        data: bytes
+        stream_id: int
+        stream_ended: bool
+
+    event = DataReceived(b"\xff" * 100, 4, False)
+
+    assert (
+        ProtocolTracer.describe(event)
+        == "DataReceived(data=<100>, stream_id=4, stream_ended=False)"
+    )
@@ -347,3 +347,26 @@ def test_middleware_run_on_timeout(app):
     app.test_client.get("/")
     assert request_middleware_run_count == 1
     assert response_middleware_run_count == 1
+
+
+def test_middleware_awaitable_from_callable(app):
+    class Header:
+        async def __call__(self, request, response):
+            response.headers["x-header"] = "1"
+
+    def defer(request):
+        async def set_ctx():
+            request.ctx.deferred = True
+
+        return set_ctx()
+
+    app.on_request(defer)
+    app.on_response(Header())
+
+    @app.get("/")
+    async def handler(request):
+        return json(request.ctx.deferred)
+
+    _, response = app.test_client.get("/")
+    assert response.json is True
+    assert response.headers["x-header"] == "1"
@@ -0,0 +1,235 @@
+import asyncio
+import os
+
+from tempfile import SpooledTemporaryFile
+
+import pytest
+
+from sanic import Sanic, json, text
+from sanic.request import (
+    MultipartParser,
+    parse_multipart_form,
+    parse_multipart_stream,
+)
+from sanic.request.form import MultipartEvent
+
+
+BOUNDARY = "----sanic"
+HEADERS = {"content-type": f"multipart/form-data; boundary={BOUNDARY}"}
+PAYLOAD = (
+    b"preamble\r\n"
+    b"------sanic\r\n"
+    b'Content-Disposition: form-data; name="test"\r\n'
+    b"\r\n"
+    b"OK\r\n"
+    b"------sanic\r\n"
+    b'Content-Disposition: form-data; name="file"; filename="a.txt"\r\n'
+    b"Content-Type: application/octet-stream\r\n"
+    b"\r\n" + b"x" * 10_000 + b"\r\n------sanic\r\n"
+    b'Content-Disposition: form-data; name="test"\r\n'
+    b"\r\n"
+    b"\r\n"
+    b"------sanic--\r\n"
+)
+
+
+async def chunked(body: bytes, size: int):
+    for i in range(0, len(body), size):
+        yield body[i : i + size]
+
+
+@pytest.mark.parametrize("size", (1, 7, 4096, len(PAYLOAD)))
+def test_parse_multipart_stream_matches_form(size):
+    expected = parse_multipart_form(PAYLOAD, BOUNDARY.encode())
+    fields, files = asyncio.run(
+        parse_multipart_stream(chunked(PAYLOAD, size), BOUNDARY.encode())
+    )
+
+    assert fields == expected[0] == {"test": ["OK", ""]}
+    assert files == expected[1]
+    assert files.get("file").body == b"x" * 10_000
+
+
+def test_parser_events():
+    parser = MultipartParser(BOUNDARY.encode())
+    parser.feed(PAYLOAD[:75])
+    events = []
+    while (event := parser.next_event()) is not None:
+        events.append(event)
+
+    assert events == [
+        (
+            MultipartEvent.HEADERS,
+            b'Content-Disposition: form-data; name="test"',
+        )
+    ]
+
+    parser.feed(PAYLOAD[75:])
+    parser.feed_eof()
+    kinds = []
+    while (event := parser.next_event())[0] is not MultipartEvent.CLOSE:
+        kinds.append(event[0])
+
+    assert kinds == [
+        MultipartEvent.END,
+        MultipartEvent.HEADERS,
+        MultipartEvent.END,
+        MultipartEvent.HEADERS,
+        MultipartEvent.END,
+    ]
+
+
+def test_parser_header_limit():
+    parser = MultipartParser(b"sanic", max_header_size=16)
+    parser.feed(b"--sanic\r\n" + b"x" * 32)
+
+    with pytest.raises(ValueError, match="too large"):
+        parser.next_event()
+
+
+def test_spooled_files():
+    fields, files = asyncio.run(
+        parse_multipart_stream(
+            chunked(PAYLOAD, 1024), BOUNDARY.encode(), spool_size=1024
+        )
+    )
+    file = files.get("file")
+
+    assert fields.getlist("test") == ["OK", ""]
+    assert file.name == "a.txt"
+    assert file.type == "application/octet-stream"
+    assert file.body._rolled
+    assert file.body.read() == b"x" * 10_000
+
+
+def test_spooled_files_closed_on_error(monkeypatch):
+    spooled = []
+
+    class RecordingFile(SpooledTemporaryFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            spooled.append(self)
+
+    monkeypatch.setattr(
+        "sanic.request.form.SpooledTemporaryFile", RecordingFile
+    )
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            parse_multipart_stream(
+                chunked(PAYLOAD[:5000], 1024),
+                BOUNDARY.encode(),
+                spool_size=1024,
+            )
+        )
+
+    assert len(spooled) == 1
+    assert spooled[0].closed
+
+
+def test_request_multipart(app: Sanic):
+    @app.post("/", stream=True)
+    async def handler(request):
+        parts = []
+        async for part in request.multipart():
+            size = 0
+            async for chunk in part:
+                size += len(chunk)
+            parts.append([part.name, part.filename, size])
+        return json(parts)
+
+    _, response = app.test_client.post("/", content=PAYLOAD, headers=HEADERS)
+
+    assert response.json == [
+        ["test", None, 2],
+        ["file", "a.txt", 10_000],
+        ["test", None, 0],
+    ]
+
+
+def test_request_multipart_skips_unread_parts(app: Sanic):
+    @app.post("/", stream=True)
+    async def handler(request):
+        names = [part.name async for part in request.multipart()]
+        return json(names)
+
+    _, response = app.test_client.post("/", content=PAYLOAD, headers=HEADERS)
+
+    assert response.json == ["test", "file", "test"]
+
+
+def test_request_multipart_not_multipart(app: Sanic):
+    @app.post("/", stream=True)
+    async def handler(request):
+        request.multipart()
+
+    _, response = app.test_client.post("/", content=b"foo")
+
+    assert response.status == 400
+
+
+def test_request_receive_form(app: Sanic):
+    @app.post("/", stream=True)
+    async def handler(request):
+        await request.receive_form()
+        file = request.files.get("file")
+        return json([request.form.getlist("test"), len(file.body)])
+
+    _, response = app.test_client.post("/", content=PAYLOAD, headers=HEADERS)
+
+    assert response.json == [["OK", ""], 10_000]
+
+
+def test_request_receive_form_truncated(app: Sanic):
+    @app.post("/", stream=True)
+    async def handler(request):
+        await request.receive_form()
+        return text("OK")
+
+    _, response = app.test_client.post(
+        "/", content=PAYLOAD[:5000], headers=HEADERS
+    )
+
+    assert response.status == 400
+
+
+def test_multipart_spool_size_config(app: Sanic):
+    app.config.MULTIPART_SPOOL_SIZE = 1024
+
+    @app.post("/")
+    async def handler(request):
+        file = request.files.get("file")
+        return json(
+            {
+                "body": len(request.body),
+                "form": request.form.getlist("test"),
+                "file": len(file.body.read()),
+            }
+        )
+
+    _, response = app.test_client.post("/", content=PAYLOAD, headers=HEADERS)
+
+    assert response.json == {"body": 0, "form": ["OK", ""], "file": 10_000}
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="Needs /proc/self/fd"
+)
+def test_spooled_files_closed_after_request(app: Sanic):
+    app.config.MULTIPART_SPOOL_SIZE = 1024
+    files = []
+
+    @app.post("/")
+    async def handler(request):
+        file = request.files.get("file")
+        files.append(file.body)
+        return json({"rolled": file.body._rolled, "fds": open_fds()})
+
+    def open_fds():
+        return len(os.listdir("/proc/self/fd"))
+
+    _, response = app.test_client.post("/", content=PAYLOAD, headers=HEADERS)
+
+    assert response.json["rolled"]
+    assert files[0].closed
+    assert open_fds() < response.json["fds"]
@@ -48,7 +48,7 @@ def test_multiprocessing(app, port):
     with use_context("fork"):
         app.run(HOST, port, workers=num_workers, debug=True)
 
-    assert len(process_list) == num_workers + 1
+    assert len(process_list) == num_workers
 
 
 @pytest.mark.skipif(
@@ -81,7 +81,7 @@ def test_multiprocessing_with_blueprint(app: object, port) -> object:
     with use_context("fork"):
         app.run(HOST, port, workers=num_workers, debug=True)
 
-    assert len(process_list) == num_workers + 1
+    assert len(process_list) == num_workers
 
 
 # this function must be outside a test function so that it can be
@@ -1,5 +1,6 @@
 import uuid
 
+from collections import defaultdict
 from unittest.mock import Mock
 from uuid import UUID, uuid4
 
@@ -7,7 +8,7 @@ import pytest
 
 from sanic import Sanic, response
 from sanic.exceptions import BadURL, SanicException
-from sanic.request import Request
+from sanic.request import Request, RequestParameters
 from sanic.server import HttpProtocol
 
 
@@ -336,3 +337,17 @@ def test_custom_ctx():
     _, resp = app.test_client.get("/")
 
     assert resp.json == [True, True, "foo"]
+
+
+def test_assign_parsed_args(app):
+    request = Request(b"/?foo=bar", {}, "1.1", "GET", Mock(), app)
+    assert request.args == {"foo": ["bar"]}
+    assert request.query_args == [("foo", "bar")]
+
+    request.parsed_args = defaultdict(RequestParameters)
+    request.parsed_not_grouped_args = defaultdict(list)
+
+    assert not request.parsed_args
+    assert not request.parsed_not_grouped_args
+    assert request.args == {"foo": ["bar"]}
+    assert request.query_args == [("foo", "bar")]
@@ -1,6 +1,7 @@
 import asyncio
 import inspect
 import os
+import socket
 import time
 
 from collections import namedtuple
@@ -30,8 +31,10 @@ from sanic.response import (
     file_stream,
     json,
     raw,
+    sendfile,
     text,
 )
+from sanic.server.protocols.base_protocol import SanicProtocol
 
 
 JSON_DATA = {"ok": True}
@@ -548,6 +551,185 @@ def test_file_stream_response_range(
     )
 
 
+@pytest.mark.parametrize(
+    "file_name", ["test.file", "decode me.txt", "python.png"]
+)
+@pytest.mark.parametrize("use_uvloop", [True, False])
+def test_sendfile_response(
+    app: Sanic, file_name, static_file_directory, use_uvloop, monkeypatch
+):
+    app.config.USE_UVLOOP = use_uvloop
+    available = []
+    sent = []
+    original = SanicProtocol.sendfile
+
+    async def spy(self, *args):
+        sent.append(args)
+        return await original(self, *args)
+
+    monkeypatch.setattr(SanicProtocol, "sendfile", spy)
+
+    @app.route("/files/<filename>", methods=["GET"])
+    async def file_route(request, filename):
+        available.append(request.stream.protocol.sendfile_available)
+        file_path = os.path.join(static_file_directory, filename)
+        file_path = os.path.abspath(unquote(file_path))
+        return await sendfile(file_path, chunk_size=32)
+
+    request, response = app.test_client.get(f"/files/{file_name}")
+    content = get_file_content(static_file_directory, file_name)
+    assert response.status == 200
+    assert response.body == content
+    assert int(response.headers["Content-Length"]) == len(content)
+    assert bool(sent) is available[0]
+
+
+def test_sendfile_send_signal(app: Sanic, static_file_directory, monkeypatch):
+    app.config.USE_UVLOOP = False
+    sent = []
+    bodies = []
+    original = SanicProtocol.sendfile
+
+    async def spy(self, *args):
+        sent.append(args)
+        return await original(self, *args)
+
+    monkeypatch.setattr(SanicProtocol, "sendfile", spy)
+
+    @app.get("/")
+    async def file_route(request):
+        return await sendfile(os.path.join(static_file_directory, "test.file"))
+
+    @app.signal("http.lifecycle.send")
+    async def on_send(data):
+        bodies.append(data)
+
+    request, response = app.test_client.get("/")
+    content = get_file_content(static_file_directory, "test.file")
+    assert response.body == content
+    assert not sent
+    assert content in b"".join(bodies)
+
+
+def test_sendfile_slow_reader(
+    app: Sanic, tmp_path: Path, port: int, monkeypatch
+):
+    app.config.RESPONSE_TIMEOUT = 0.3
+    monkeypatch.setattr(SanicProtocol, "SENDFILE_SLICE_SIZE", 65536)
+    path = tmp_path / "large.file"
+    body = os.urandom(2 * 1024 * 1024)
+    path.write_bytes(body)
+    sent = []
+    original = SanicProtocol.sendfile
+
+    async def spy(self, *args):
+        sent.append(args)
+        return await original(self, *args)
+
+    monkeypatch.setattr(SanicProtocol, "sendfile", spy)
+
+    @app.get("/")
+    async def file_route(request):
+        # Small socket buffers, so that the kernel cannot take the whole file
+        sock = request.transport.get_extra_info("socket")
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 65536)
+        return await sendfile(path)
+
+    async def slow_get() -> bytes:
+        sock = socket.socket()
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        sock.connect(("127.0.0.1", port))
+        sock.setblocking(False)
+        reader, writer = await asyncio.open_connection(sock=sock)
+        writer.write(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        received = b""
+        # About 1.6 MB/s, so the download outlasts the response timeout
+        while chunk := await reader.read(32768):
+            received += chunk
+            await asyncio.sleep(0.02)
+            if received.endswith(body[-64:]):
+                break
+        writer.close()
+        return received
+
+    loop = asyncio.SelectorEventLoop()
+    asyncio.set_event_loop(loop)
+    try:
+        server = loop.run_until_complete(
+            app.create_server(port=port, return_asyncio_server=True)
+        )
+        loop.run_until_complete(server.startup())
+        start = time.monotonic()
+        received = loop.run_until_complete(slow_get())
+        duration = time.monotonic() - start
+        loop.run_until_complete(server.close())
+    finally:
+        loop.close()
+
+    assert sent
+    assert duration > 3 * app.config.RESPONSE_TIMEOUT
+    assert received.split(b"\r\n\r\n", 1)[1] == body
+
+
+@pytest.mark.parametrize("use_uvloop", [True, False])
+def test_sendfile_response_range(
+    app: Sanic, static_file_directory, use_uvloop
+):
+    app.config.USE_UVLOOP = use_uvloop
+    Range = namedtuple("Range", ["size", "start", "end", "total"])
+    content = get_file_content(static_file_directory, "python.png")
+    range = Range(size=100, start=10, end=109, total=len(content))
+
+    @app.get("/")
+    async def file_route(request):
+        return await sendfile(
+            os.path.join(static_file_directory, "python.png"), _range=range
+        )
+
+    request, response = app.test_client.get("/")
+    assert response.status == 206
+    assert response.body == content[10:110]
+    assert response.headers["Content-Range"] == f"bytes 10-109/{len(content)}"
+    assert response.headers["Content-Length"] == "100"
+
+
+def test_sendfile_head_response(app: Sanic, static_file_directory):
+    @app.route("/", methods=["GET", "HEAD"])
+    async def file_route(request):
+        return await sendfile(os.path.join(static_file_directory, "test.file"))
+
+    request, response = app.test_client.head("/")
+    assert response.status == 200
+    assert response.body == b""
+    assert int(response.headers["Content-Length"]) == len(
+        get_file_content(static_file_directory, "test.file")
+    )
+
+
+@pytest.mark.asyncio
+async def test_sendfile_response_asgi(app: Sanic, static_file_directory):
+    @app.get("/")
+    async def file_route(request):
+        return await sendfile(
+            os.path.join(static_file_directory, "python.png"), chunk_size=32
+        )
+
+    request, response = await app.asgi_client.get("/")
+    assert response.status == 200
+    assert response.body == get_file_content(
+        static_file_directory, "python.png"
+    )
+
+
+def test_sendfile_directory(app: Sanic, static_file_directory):
+    @app.get("/")
+    async def file_route(request):
+        return await sendfile(static_file_directory)
+
+    request, response = app.test_client.get("/")
+    assert response.status == 500
+
+
 def test_raw_response(app):
     @app.get("/test")
     def handler(request: Request):
@@ -1289,3 +1289,137 @@ async def test_duplicate_route_error(app):
     )
     with pytest.raises(ServerError, match=message):
         await app._startup()
+
+
+def test_route_pipeline_details(app: Sanic):
+    @app.get("/async")
+    async def async_handler(request):
+        return text("async")
+
+    @app.get("/sync")
+    def sync_handler(request):
+        return text("sync")
+
+    @app.get("/awaitable")
+    def awaitable_handler(request):
+        return async_handler(request)
+
+    @app.post("/stream", stream=True)
+    async def stream_handler(request):
+        return text("stream")
+
+    @app.websocket("/ws")
+    async def ws_handler(request, ws): ...
+
+    app.router.finalize()
+    extras = {route.path: route.extra for route in app.router.routes}
+
+    assert extras["async"].is_coroutine
+    assert not extras["sync"].is_coroutine
+    assert not extras["awaitable"].is_coroutine
+    assert extras["stream"].is_stream
+    assert not extras["async"].is_stream
+    assert extras["ws"].is_websocket
+    assert not extras["async"].is_websocket
+
+    app.router.reset()
+    for path, expected in (
+        ("/async", "async"),
+        ("/sync", "sync"),
+        ("/awaitable", "async"),
+    ):
+        _, response = app.test_client.get(path)
+        assert response.status == 200
+        assert response.text == expected
+
+
+def test_route_cache_static_and_dynamic(app: Sanic):
+    @app.get("/static")
+    async def static_handler(request):
+        return text("static")
+
+    @app.get("/user/<user_id:int>")
+    async def dynamic_handler(request, user_id: int):
+        return text(str(user_id))
+
+    app.config.ROUTER_CACHE_SIZE = 2
+    app.router.finalize()
+    cache = app.router.cache
+
+    assert ("/static", "GET", None) in cache.static
+    assert not cache.dynamic
+
+    route, _, _ = app.router.get("/static", "GET", "localhost")
+    assert route.path == "static"
+    assert cache.static_hits == 1
+
+    for user_id in range(3):
+        app.router.get(f"/user/{user_id}", "GET", None)
+    app.router.get("/user/2", "GET", None)
+
+    assert list(cache.dynamic) == [
+        ("/user/1", "GET", None),
+        ("/user/2", "GET", None),
+    ]
+    assert cache.info() == {
+        "maxsize": 2,
+        "static_size": 1,
+        "dynamic_size": 2,
+        "static_hits": 1,
+        "hits": 1,
+        "misses": 3,
+        "evictions": 1,
+    }
+
+    with pytest.raises(NotFound):
+        app.router.get("/missing", "GET", None)
+    assert ("/missing", "GET", None) not in cache.dynamic
+
+
+def test_route_cache_disabled(app: Sanic):
+    @app.get("/static")
+    async def static_handler(request): ...
+
+    app.config.ROUTER_CACHE_SIZE = 0
+    app.router.finalize()
+    app.router.get("/static", "GET", None)
+
+    assert not app.router.cache.static
+    assert not app.router.cache.dynamic
+
+
+def test_route_cache_host_routing(app: Sanic):
+    @app.get("/", host="one.com")
+    async def one(request):
+        return text("one")
+
+    @app.get("/", host="two.com")
+    async def two(request):
+        return text("two")
+
+    app.router.finalize()
+    cache = app.router.cache
+
+    assert not cache.static
+    assert app.router.get("/", "GET", "one.com")[1] is one
+    assert app.router.get("/", "GET", "two.com")[1] is two
+    assert ("/", "GET", "one.com") in cache.dynamic
+    assert ("/", "GET", "two.com") in cache.dynamic
+
+
+def test_route_cache_invalidated_on_reset(app: Sanic):
+    @app.get("/")
+    async def handler(request): ...
+
+    async def replacement(request): ...
+
+    app.router.finalize()
+    assert app.router.get("/", "GET", None)[1] is handler
+
+    app.router.reset()
+    assert not app.router.cache.static
+
+    app.router.add("/", ["GET"], replacement, overwrite=True)
+    app.router.finalize()
+    assert app.router.get("/", "GET", None)[1] is replacement
+    assert app.router.cache.static_hits == 2
@@ -1,16 +1,23 @@
+import gzip
 import logging
 import os
 import sys
+
 from collections import Counter
 from pathlib import Path
 from time import gmtime, strftime
 from urllib.parse import unquote
 
 import pytest
+
+from sanic_testing.reusable import ReusableClient
+
 from sanic import Sanic, text
 from sanic.exceptions import FileNotFound, ServerError
+from sanic.handlers.static_cache import StaticAsset, StaticCache
 from sanic.response import file
 
+
 pytestmark = pytest.mark.xdist_group(name="static_files")
 
 
@@ -704,3 +711,126 @@ def test_double_backslash_prohibited_on_win32(
     assert response.status == 404
     _, response = app.test_client.get("/foo/static\\../static/test.file")
     assert response.status == 404
+
+
+@pytest.fixture
+def cached_assets(tmp_path: Path):
+    css = b"body { color: red; }" * 10
+    (tmp_path / "app.css").write_bytes(css)
+    (tmp_path / "app.css.br").write_bytes(b"BROTLI")
+    (tmp_path / "app.css.gz").write_bytes(gzip.compress(css))
+    (tmp_path / "plain.txt").write_bytes(b"plain")
+    (tmp_path / "large.bin").write_bytes(b"x" * 2048)
+    return tmp_path
+
+
+def test_static_cache(app: Sanic, port: int, cached_assets: Path):
+    app.config.STATIC_CACHE_SIZE = 4096
+    app.config.STATIC_CACHE_MAX_FILE = 1024
+    app.config.STATIC_CACHE_TTL = 60
+    app.static("/static", cached_assets)
+    client = ReusableClient(app, port=port)
+
+    with client:
+        _, response = client.get("/static/plain.txt")
+        etag = response.headers["ETag"]
+        (cached_assets / "plain.txt").unlink()
+        _, cached = client.get("/static/plain.txt")
+        _, not_modified = client.get(
+            "/static/plain.txt", headers={"If-None-Match": f"W/{etag}"}
+        )
+        _, head = client.head("/static/plain.txt")
+        _, large = client.get("/static/large.bin")
+
+    assert response.status == cached.status == 200
+    assert response.body == cached.body == b"plain"
+    assert response.headers["Content-Type"] == "text/plain; charset=utf-8"
+    assert cached.headers["ETag"] == etag
+    assert "Vary" not in response.headers
+    assert not_modified.status == 304
+    assert not_modified.headers["ETag"] == etag
+    assert head.status == 200
+    assert head.headers["Content-Length"] == "5"
+    assert large.status == 200
+    assert "ETag" not in large.headers
+    assert app.static_cache.info() == {
+        "maxsize": 4096,
+        "currsize": 5,
+        "files": 1,
+        "hits": 3,
+        "misses": 2,
+        "evictions": 0,
+    }
+
+
+@pytest.mark.parametrize(
+    "accept_encoding,encoding,variant",
+    (
+        ("gzip, deflate, br", "br", "app.css.br"),
+        ("gzip", "gzip", "app.css.gz"),
+        ("br;q=0, gzip;q=0.5", "gzip", "app.css.gz"),
+        ("identity", None, "app.css"),
+    ),
+)
+def test_static_cache_precompressed(
+    app: Sanic, cached_assets: Path, accept_encoding, encoding, variant
+):
+    app.config.STATIC_CACHE_SIZE = 4096
+    app.static("/static", cached_assets)
+
+    _, response = app.test_client.get(
+        "/static/app.css", headers={"Accept-Encoding": accept_encoding}
+    )
+
+    assert response.status == 200
+    assert response.headers.get("Content-Encoding") == encoding
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert response.headers["Content-Type"] == "text/css; charset=utf-8"
+    assert int(response.headers["Content-Length"]) == len(
+        (cached_assets / variant).read_bytes()
+    )
+    if encoding != "br":
+        assert response.body == (cached_assets / "app.css").read_bytes()
+
+
+def test_static_cache_revalidates(app: Sanic, port: int, cached_assets: Path):
+    app.config.STATIC_CACHE_SIZE = 4096
+    app.config.STATIC_CACHE_TTL = 0
+    app.static("/static", cached_assets)
+    client = ReusableClient(app, port=port)
+
+    with client:
+        _, first = client.get("/static/plain.txt")
+        (cached_assets / "plain.txt").write_bytes(b"changed")
+        _, second = client.get("/static/plain.txt")
+
+    assert first.body == b"plain"
+    assert second.body == b"changed"
+    assert first.headers["ETag"] != second.headers["ETag"]
+
+
+def test_static_cache_skips_ranges(app: Sanic, cached_assets: Path):
+    app.config.STATIC_CACHE_SIZE = 4096
+    app.static("/static", cached_assets, use_content_range=True)
+
+    _, response = app.test_client.get(
+        "/static/plain.txt", headers={"Range": "bytes=1-2"}
+    )
+
+    assert response.status == 206
+    assert response.body == b"la"
+    assert app.static_cache.info()["files"] == 0
+
+
+def test_static_cache_eviction():
+    cache = StaticCache(maxsize=10, max_file_size=10, ttl=60)
+    assets = [
+        StaticAsset(Path(str(i)), 0, 4, "text/plain", {"": b"1234"})
+        for i in range(3)
+    ]
+    for i, asset in enumerate(assets):
+        cache.add(("/", str(i), None), asset)
+
+    assert list(cache.assets) == [("/", "1", None), ("/", "2", None)]
+    assert cache.currsize == 8
+    assert cache.evictions == 1
@@ -1,6 +1,6 @@
 import asyncio
 
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -8,6 +8,7 @@ from sanic import Sanic
 from sanic.exceptions import RequestTimeout, ServiceUnavailable
 from sanic.http import Stage
 from sanic.server import HttpProtocol
+from sanic.server.timers import TimerWheel
 
 
 @pytest.fixture
@@ -40,16 +41,24 @@ def test_setup(protocol: HttpProtocol):
 
 def test_check_timeouts_no_timeout(protocol: HttpProtocol):
     protocol.keep_alive_timeout = 1
-    protocol.loop.call_later = Mock()
-    protocol.check_timeouts()
+    with patch.object(TimerWheel, "schedule") as schedule:
+        protocol.check_timeouts()
     protocol._task.cancel.assert_not_called()
     assert protocol._http.stage is Stage.IDLE
     assert protocol._http.exception is None
-    protocol.loop.call_later.assert_called_with(
-        protocol.keep_alive_timeout / 2, protocol.check_timeouts
+    schedule.assert_called_with(
+        protocol,
+        protocol._timer.time() + protocol.keep_alive_timeout / 2,
+        protocol.check_timeouts,
     )
 
 
+def test_check_timeouts_scheduled_on_wheel(protocol: HttpProtocol):
+    assert protocol in protocol._timer
+    protocol.close()
+    assert protocol not in protocol._timer
+
+
 def test_check_timeouts_keep_alive_timeout(protocol: HttpProtocol):
     protocol._http.stage = Stage.IDLE
     protocol._time = 0
@@ -72,3 +81,23 @@ def test_check_timeouts_response_timeout(protocol: HttpProtocol):
     protocol.check_timeouts()
     protocol._task.cancel.assert_called_once()
     assert isinstance(protocol._http.exception, ServiceUnavailable)
+
+
+def test_no_early_timeout_after_idle(app: Sanic, mock_transport):
+    loop = asyncio.new_event_loop()
+    wheel = TimerWheel.for_loop(loop)
+    # The cached time of a wheel that has been idle for a while
+    wheel.now = wheel.previous = wheel.now - 10
+    protocol = HttpProtocol(loop=loop, app=app)
+    protocol.keep_alive_timeout = 0.4
+    protocol.transport = mock_transport
+    protocol.recv_buffer = bytearray()
+    protocol._task = Mock(spec=asyncio.Task)
+    protocol._setup_connection()
+    try:
+        loop.run_until_complete(asyncio.sleep(0.3))
+        protocol._task.cancel.assert_not_called()
+        assert protocol in wheel
+    finally:
+        protocol._timer.cancel(protocol)
+        loop.close()
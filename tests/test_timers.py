@@ -0,0 +1,132 @@
+import asyncio
+
+from unittest.mock import Mock
+
+import pytest
+
+from sanic.server.timers import TimerWheel
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def wheel(loop):
+    return TimerWheel(loop, resolution=0.01, size=8)
+
+
+def run(loop, seconds):
+    loop.run_until_complete(asyncio.sleep(seconds))
+
+
+def test_for_loop(loop):
+    assert TimerWheel.for_loop(loop) is TimerWheel.for_loop(loop)
+    other = asyncio.new_event_loop()
+    assert TimerWheel.for_loop(other) is not TimerWheel.for_loop(loop)
+    other.close()
+
+
+def test_schedule_expires(loop, wheel):
+    callback = Mock()
+    wheel.schedule("foo", wheel.now + 0.03, callback)
+    assert "foo" in wheel
+    run(loop, 0.01)
+    callback.assert_not_called()
+    run(loop, 0.05)
+    callback.assert_called_once_with()
+    assert "foo" not in wheel
+
+
+def test_schedule_replaces_deadline(loop, wheel):
+    callback = Mock()
+    wheel.schedule("foo", wheel.now + 0.02, callback)
+    wheel.schedule("foo", wheel.now + 0.15, callback)
+    assert len(wheel) == 1
+    run(loop, 0.06)
+    callback.assert_not_called()
+    run(loop, 0.15)
+    callback.assert_called_once_with()
+
+
+def test_schedule_beyond_one_turn(loop, wheel):
+    callback = Mock()
+    # 8 slots of 0.01s make one turn in 0.08s
+    wheel.schedule("foo", wheel.now + 0.2, callback)
+    run(loop, 0.12)
+    callback.assert_not_called()
+    run(loop, 0.15)
+    callback.assert_called_once_with()
+
+
+def test_cancel(loop, wheel):
+    callback = Mock()
+    wheel.schedule("foo", wheel.now + 0.02, callback)
+    wheel.cancel("foo")
+    wheel.cancel("bar")
+    run(loop, 0.05)
+    callback.assert_not_called()
+    assert len(wheel) == 0
+
+
+def test_stops_when_empty(loop, wheel):
+    wheel.schedule("foo", wheel.now, Mock())
+    assert wheel._handle is not None
+    run(loop, 0.05)
+    assert wheel._handle is None
+
+
+def test_refreshes_now(loop, wheel):
+    wheel.schedule("foo", wheel.now + 1, Mock())
+    before = wheel.now
+    run(loop, 0.05)
+    assert wheel.now > before
+    assert wheel.previous > before
+
+
+def test_time_refreshed_while_idle(loop, wheel):
+    wheel.schedule("foo", wheel.now, Mock())
+    run(loop, 0.05)
+    assert wheel._handle is None
+    before = wheel.now
+    run(loop, 0.05)
+    assert wheel.now == before
+    assert wheel.time() - before >= 0.05
+    assert wheel.previous == wheel.now
+
+
+def test_elapsed_after_idle(loop, wheel):
+    wheel.schedule("foo", wheel.now, Mock())
+    run(loop, 0.05)
+    # The wheel idles, then a connection records its activity
+    run(loop, 0.2)
+    since = wheel.time()
+    wheel.schedule("bar", since + 1, Mock())
+    run(loop, 0.03)
+    assert wheel.elapsed(since) < 0.1
+
+
+def test_elapsed(wheel):
+    wheel.previous = 10.0
+    wheel.now = 12.0
+    assert wheel.elapsed(11.0) == 0.0
+    assert wheel.elapsed(10.0) == 0.0
+    assert wheel.elapsed(8.0) == 4.0
+
+
+def test_callback_error_is_logged(loop, wheel, caplog):
+    wheel.schedule("foo", wheel.now, Mock(side_effect=ValueError))
+    wheel.schedule("bar", wheel.now, (callback := Mock()))
+    run(loop, 0.05)
+    callback.assert_called_once_with()
+    assert "TimerWheel callback failed" in caplog.text
+
+
+def test_sleep(loop, wheel):
+    start = loop.time()
+    loop.run_until_complete(wheel.sleep(0.05))
+    assert loop.time() - start >= 0.04
+    assert len(wheel) == 0
@@ -7,6 +7,7 @@ import sys
 from contextlib import contextmanager
 from multiprocessing import Event
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from urllib.parse import urlparse
 
@@ -22,7 +23,12 @@ from sanic.compat import use_context
 from sanic.constants import LocalCertCreator
 from sanic.exceptions import SanicException
 from sanic.helpers import _default
-from sanic.http.tls.context import SanicSSLContext
+from sanic.http.tls.context import (
+    CertSelector,
+    SanicSSLContext,
+    find_cert,
+    match_hostname,
+)
 from sanic.http.tls.creators import (
     MkcertCreator,
     TrustmeCreator,
@@ -348,6 +354,61 @@ def test_wildcards(app):
         assert "Request and response object expected" in str(exc.value)
 
 
+def sni_ctx(*names):
+    return SimpleNamespace(sanic={"names": list(names)})
+
+
+def test_cert_selector_index():
+    first = sni_ctx("*.sanic.test", "one.example")
+    second = sni_ctx("foo.sanic.test", "two.example", "*.two.example")
+    third = sni_ctx("one.example", "*.example")
+    selector = CertSelector([None, first, second, third])
+
+    for name, expected in (
+        ("one.example", first),
+        ("ONE.example", first),
+        ("foo.sanic.test", first),
+        ("two.example", second),
+        ("www.two.example", second),
+        ("three.example", third),
+        ("sub.foo.sanic.test", None),
+        ("sanic.test", None),
+    ):
+        matches = [
+            ctx for ctx in selector.sanic_select if match_hostname(ctx, name)
+        ]
+        assert matches[:1] == ([expected] if expected else [])
+        if expected:
+            assert find_cert(selector, name) is expected
+        else:
+            with pytest.raises(ValueError, match="No certificate found"):
+                find_cert(selector, name)
+    with pytest.raises(ValueError, match="no SNI"):
+        find_cert(selector, "")
+
+
+def test_cert_selector_fallback():
+    fallback = sni_ctx("localhost")
+    selector = CertSelector([fallback, sni_ctx("sanic.example")])
+
+    assert find_cert(selector, "sanic.example") is not fallback
+    assert find_cert(selector, "invalid.test") is fallback
+    assert find_cert(selector, "") is fallback
+
+
+def test_cert_selector_recent(monkeypatch):
+    monkeypatch.setattr(CertSelector, "RECENT_SIZE", 2)
+    ctx = sni_ctx("*.sanic.test")
+    selector = CertSelector([None, ctx])
+
+    for name in ("a.sanic.test", "b.sanic.test", "a.sanic.test"):
+        assert find_cert(selector, name) is ctx
+    with pytest.raises(ValueError):
+        find_cert(selector, "invalid.test")
+
+    assert list(selector.sanic_recent) == ["a.sanic.test", "invalid.test"]
+
+
 def test_invalid_ssl_dict(app):
     @app.get("/test")
     async def handler(request):
@@ -0,0 +1,102 @@
+import os
+import ssl
+
+import pytest
+
+from sanic import Sanic
+from sanic.config import Config
+from sanic.http.tls.context import CertSimple
+from sanic.http.tls.tickets import SessionTickets, share_session_tickets
+from sanic.response import text
+from sanic.worker.serve import _collect_metrics
+
+
+current_dir = os.path.dirname(os.path.realpath(__file__))
+localhost_dir = os.path.join(current_dir, "certs/localhost")
+
+
+def server_context():
+    return CertSimple(
+        os.path.join(localhost_dir, "fullchain.pem"),
+        os.path.join(localhost_dir, "privkey.pem"),
+    )
+
+
+@pytest.fixture(
+    params=(ssl.TLSVersion.TLSv1_2, ssl.TLSVersion.TLSv1_3),
+    ids=("tls1.2", "tls1.3"),
+)
+def client_context(request):
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    context.maximum_version = request.param
+    return context
+
+
+def handshake(server_ctx, client_ctx, session=None) -> ssl.SSLObject:
+    client_in, client_out, server_in, server_out = (
+        ssl.MemoryBIO() for _ in range(4)
+    )
+    client = client_ctx.wrap_bio(
+        client_in, client_out, server_hostname="localhost", session=session
+    )
+    server = server_ctx.wrap_bio(server_in, server_out, server_side=True)
+    for _ in range(4):
+        for obj in (client, server):
+            try:
+                obj.do_handshake()
+            except ssl.SSLWantReadError:
+                pass
+        server_in.write(client_out.read())
+        client_in.write(server_out.read())
+    # TLS 1.3 tickets are only received after the handshake
+    with pytest.raises(ssl.SSLWantReadError):
+        client.read()
+    return client
+
+
+def test_session_tickets_info(client_context):
+    tickets = SessionTickets()
+    first, second = server_context(), server_context()
+    tickets.install(first)
+    tickets.install(second)
+
+    session = handshake(first, client_context).session
+    assert handshake(first, client_context, session).session_reused
+    # Each context encrypts its tickets with its own key
+    assert not handshake(second, client_context, session).session_reused
+
+    assert tickets.info() == {"hits": 1, "misses": 2}
+
+
+def test_share_session_tickets():
+    config = Config()
+    assert share_session_tickets(config, True) == {}
+
+    config.TLS_SESSION_TICKETS_SHARED = True
+    assert share_session_tickets(config, False) == {}
+    shared = share_session_tickets(config, True)
+    directory = shared["TLS_SESSION_TICKET_DIRECTORY"]
+    try:
+        assert os.stat(directory).st_mode & 0o777 == 0o700
+    finally:
+        os.rmdir(directory)
+
+    config.TLS_SESSION_TICKET_DIRECTORY = "/tmp/tickets"
+    assert share_session_tickets(config, True) == {}
+
+
+def test_metrics(app: Sanic):
+    @app.get("/")
+    async def handler(request):
+        return text("ok")
+
+    assert "tls_sessions" not in _collect_metrics(app)
+    _, response = app.test_client.get(
+        f"https://localhost:{app.test_client.port}/",
+        server_kwargs={"ssl": localhost_dir},
+    )
+
+    assert response.status == 200
+    assert _collect_metrics(app)["tls_sessions"] == {"hits": 0, "misses": 1}
@@ -11,6 +11,7 @@ from sanic import Sanic
 from sanic.blueprints import Blueprint
 from sanic.exceptions import URLBuildError
 from sanic.response import text
+from sanic.router import URLBuilder
 from sanic.views import HTTPMethodView
 
 
@@ -363,3 +364,45 @@ def test_versioning(app, path, version, expected):
 
     url = app.url_for("handler")
     assert url == expected
+
+
+def test_url_builder_compiled_on_finalize(app):
+    @app.route("/items/<item_id:int>/<slug>")
+    def handler(*_): ...
+
+    app.router.finalize()
+    builder = app.router.name_index[f"{app.name}.handler"].extra.url_builder
+
+    assert builder.segments == ["items", "<item_id:int>", "<slug:str>"]
+    assert app.url_for("handler", item_id=1, slug="a<b") == "/items/1/a<b"
+    with pytest.raises(URLBuildError):
+        app.url_for("handler", item_id="x", slug="a")
+
+
+def test_url_builder_params_with_shared_prefix(app):
+    @app.route("/<id>/<idx>")
+    def handler(*_): ...
+
+    assert app.url_for("handler", id="a", idx="b") == "/a/b"
+
+
+def test_url_builder_memo(app, monkeypatch):
+    monkeypatch.setattr(URLBuilder, "MEMO_SIZE", 2)
+    app.config.SERVER_NAME = "example.com"
+
+    @app.route("/static")
+    def handler(*_): ...
+
+    app.router.finalize()
+    builder = app.router.name_index[f"{app.name}.handler"].extra.url_builder
+
+    assert app.url_for("handler") == "/static"
+    assert not builder.memo
+    assert app.url_for("handler", _anchor="a") == "/static#a"
+    assert (
+        app.url_for("handler", _external=True) == "http://example.com/static"
+    )
+    assert app.url_for("handler", _anchor="b") == "/static#b"
+    assert list(builder.memo) == [("http", "example.com", ""), ("", "", "b")]
+    assert app.url_for("handler", q=1) == "/static?q=1"
+    assert len(builder.memo) == 2
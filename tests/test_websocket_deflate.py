@@ -0,0 +1,113 @@
+from websockets.frames import OP_CONT, OP_PING, OP_TEXT, Frame
+
+from sanic import Request, Sanic, Websocket
+from sanic.config import Config
+from sanic.server.websockets.deflate import (
+    DeflateFactory,
+    ThresholdPerMessageDeflate,
+    websocket_info,
+)
+from sanic.worker.serve import _collect_metrics
+
+
+def negotiate(config: Config, params=()):
+    factory = DeflateFactory.from_config(config)
+    return factory.process_request_params(list(params), [])
+
+
+def test_disabled_by_default():
+    assert DeflateFactory.from_config(Config()) is None
+
+
+def test_negotiation():
+    config = Config()
+    config.WEBSOCKET_DEFLATE = True
+    config.WEBSOCKET_DEFLATE_WINDOW_BITS = 10
+    config.WEBSOCKET_DEFLATE_NO_CONTEXT_TAKEOVER = True
+
+    response, extension = negotiate(config, [("client_max_window_bits", None)])
+
+    assert isinstance(extension, ThresholdPerMessageDeflate)
+    assert dict(response) == {
+        "server_no_context_takeover": None,
+        "client_no_context_takeover": None,
+        "server_max_window_bits": "10",
+        "client_max_window_bits": "10",
+    }
+    assert extension.local_max_window_bits == 10
+    assert extension.compress_settings == {"memLevel": 5}
+    assert extension.threshold == 128
+    assert extension.memory == 0
+
+
+def test_threshold():
+    config = Config()
+    config.WEBSOCKET_DEFLATE = True
+    config.WEBSOCKET_DEFLATE_THRESHOLD = 16
+    _, extension = negotiate(config)
+
+    small = Frame(OP_TEXT, b"x" * 15)
+    assert extension.encode(small) is small
+
+    large = extension.encode(Frame(OP_TEXT, b"x" * 16, fin=False))
+    assert large.rsv1
+    assert extension.encode(Frame(OP_PING, b"")).data == b""
+    assert len(extension.encode(Frame(OP_CONT, b"x")).data) < 5
+
+    first = Frame(OP_TEXT, b"x", fin=False)
+    rest = Frame(OP_CONT, b"x" * 100)
+    assert extension.encode(first) is first
+    assert extension.encode(rest) is rest
+
+
+def test_memory():
+    config = Config()
+    config.WEBSOCKET_DEFLATE = True
+    config.WEBSOCKET_DEFLATE_WINDOW_BITS = 12
+    config.WEBSOCKET_DEFLATE_MEMORY_LEVEL = 5
+    _, extension = negotiate(config, [("client_max_window_bits", None)])
+
+    assert extension.memory == (6 + 16 + 16) * 1024 + (7 + 4) * 1024
+
+
+def test_deflate_connection(app: Sanic):
+    app.config.WEBSOCKET_DEFLATE = True
+    info = {}
+
+    @app.websocket("/ws")
+    async def handler(request: Request, ws: Websocket):
+        info.update(websocket_info(request.app.websocket_connections))
+        info.update(_collect_metrics(request.app)["websockets"])
+        await ws.send("x" * 1000)
+        await ws.send("small")
+        await ws.recv()
+
+    async def client(ws):
+        info["client"] = [type(e).__name__ for e in ws.extensions]
+        assert await ws.recv() == "x" * 1000
+        assert await ws.recv() == "small"
+        await ws.send("done")
+
+    _, ws_proxy = app.test_client.websocket("/ws", mimic=client)
+
+    assert info == {
+        "connections": 1,
+        "deflate": 1,
+        "deflate_memory": 49 * 1024,
+        "client": ["PerMessageDeflate"],
+    }
+    assert not app.websocket_connections
+
+
+def test_metrics(app: Sanic):
+    assert "websockets" not in _collect_metrics(app)
+
+    @app.websocket("/ws")
+    async def handler(request: Request, ws: Websocket):
+        pass
+
+    assert _collect_metrics(app)["websockets"] == {
+        "connections": 0,
+        "deflate": 0,
+        "deflate_memory": 0,
+    }
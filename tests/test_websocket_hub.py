@@ -0,0 +1,178 @@
+import asyncio
+
+from types import SimpleNamespace
+
+import pytest
+
+from websockets.frames import Frame, Opcode
+
+from sanic import Request, Sanic, Websocket
+from sanic.server.websockets.hub import HubRelay, WebsocketHub
+from sanic.server.websockets.impl import (
+    OPEN,
+    ServerProtocol,
+    WebsocketImplProtocol,
+)
+
+
+class FakeTransport(asyncio.Transport):
+    def __init__(self):
+        super().__init__()
+        self.buffer = bytearray()
+        self.backlog = 0
+        self.closing = False
+
+    def write(self, data):
+        self.buffer += data
+
+    def get_write_buffer_size(self):
+        return self.backlog
+
+    def is_closing(self):
+        return self.closing
+
+    def close(self):
+        self.closing = True
+
+    def pause_reading(self): ...
+
+
+def make_ws() -> WebsocketImplProtocol:
+    ws = WebsocketImplProtocol(ServerProtocol(state=OPEN))
+    ws.io_proto = SimpleNamespace(
+        transport=FakeTransport(),
+        _time=0.0,
+        _timer=SimpleNamespace(time=lambda: 1.0),
+    )
+    return ws
+
+
+def test_publish_writes_the_same_frame():
+    hub = WebsocketHub()
+    subscribers = [make_ws() for _ in range(3)]
+    for ws in subscribers:
+        hub.subscribe(ws, "news")
+    hub.subscribe(make_ws(), "other")
+
+    assert hub.publish("news", "hello") == 3
+    assert hub.publish("nobody", "hello") == 0
+
+    frame = Frame(Opcode.TEXT, b"hello").serialize(mask=False)
+    for ws in subscribers:
+        assert ws.io_proto.transport.buffer == frame
+        assert ws.io_proto._time == 1.0
+    assert hub.sent == 3
+
+
+def test_publish_binary():
+    hub = WebsocketHub()
+    ws = make_ws()
+    hub.subscribe(ws, "news")
+
+    hub.publish("news", memoryview(b"\x00\x01"))
+
+    assert ws.io_proto.transport.buffer == Frame(
+        Opcode.BINARY, b"\x00\x01"
+    ).serialize(mask=False)
+    with pytest.raises(TypeError):
+        hub.publish("news", {"x": 1})
+
+
+def test_unsubscribe():
+    hub = WebsocketHub()
+    ws = make_ws()
+    hub.subscribe(ws, "a", "b")
+    hub.unsubscribe(ws, "a")
+    assert hub.subscribers("a") == 0
+    assert hub.subscribers("b") == 1
+
+    with hub.subscription(ws, "c"):
+        assert hub.subscribers("c") == 1
+    assert hub.subscribers("c") == 0
+
+    hub.unsubscribe(ws)
+    assert not hub.channels
+
+
+def test_closed_subscribers_are_removed():
+    hub = WebsocketHub()
+    ws = make_ws()
+    hub.subscribe(ws, "news")
+    ws.io_proto.transport.closing = True
+
+    assert hub.publish("news", "hello") == 0
+    assert hub.subscribers("news") == 0
+
+
+def test_slow_consumer_drop():
+    hub = WebsocketHub(max_backlog=10)
+    slow, fast = make_ws(), make_ws()
+    slow.io_proto.transport.backlog = 11
+    hub.subscribe(slow, "news")
+    hub.subscribe(fast, "news")
+
+    assert hub.publish("news", "hello") == 1
+    assert not slow.io_proto.transport.buffer
+    assert hub.dropped == 1
+    assert hub.subscribers("news") == 2
+
+    slow.io_proto.transport.backlog = 0
+    assert hub.publish("news", "hello") == 2
+
+
+def test_slow_consumer_close():
+    hub = WebsocketHub(max_backlog=10, policy="close")
+    slow = make_ws()
+    slow.io_proto.transport.backlog = 11
+    hub.subscribe(slow, "news")
+
+    assert hub.publish("news", "hello") == 0
+    assert hub.closed == 1
+    assert hub.subscribers("news") == 0
+    assert slow.io_proto.transport.buffer.startswith(b"\x88")
+
+
+def test_unknown_policy():
+    with pytest.raises(ValueError, match="Unknown slow consumer policy"):
+        WebsocketHub(policy="wait")
+
+
+@pytest.mark.asyncio
+async def test_relay(tmp_path, monkeypatch):
+    received = []
+    first = HubRelay(tmp_path, lambda *args: received.append(args))
+    monkeypatch.setattr("os.getpid", lambda: 1)
+    first.start()
+    second = HubRelay(tmp_path, lambda *args: 0)
+    monkeypatch.setattr("os.getpid", lambda: 2)
+    second.start()
+    (tmp_path / "3.sock").touch()
+
+    second.send("news", "hello")
+    second.send("news", b"\x00")
+    await asyncio.sleep(0.01)
+
+    assert received == [("news", "hello"), ("news", b"\x00")]
+    assert not (tmp_path / "3.sock").exists()
+    second.stop()
+    first.stop()
+    assert not list(tmp_path.iterdir())
+
+
+def test_hub_broadcast(app: Sanic):
+    hub = WebsocketHub()
+
+    @app.websocket("/ws")
+    async def handler(request: Request, ws: Websocket):
+        with hub.subscription(ws, "news"):
+            async for message in ws:
+                hub.publish("news", f"news: {message}")
+
+    async def client(ws):
+        await ws.send("hello")
+        await ws.recv()
+
+    _, ws_proxy = app.test_client.websocket("/ws", mimic=client)
+    assert ws_proxy.client_received == ["news: hello"]
+    assert hub.sent == 1
+    assert not hub.channels
@@ -1,31 +1,34 @@
+import asyncio
 import re
 
-from asyncio import Event, Queue, TimeoutError
-from unittest.mock import Mock, call
+from unittest.mock import Mock
 
 import pytest
 
-from websockets.frames import CTRL_OPCODES, DATA_OPCODES, OP_TEXT, Frame
+from websockets.frames import (
+    CTRL_OPCODES,
+    DATA_OPCODES,
+    OP_BINARY,
+    OP_CONT,
+    OP_TEXT,
+    Frame,
+)
 
 from sanic.exceptions import ServerError
 from sanic.server.websockets.frame import WebsocketFrameAssembler
-
-
-try:
-    from unittest.mock import AsyncMock
-except ImportError:
-    from tests.asyncmock import AsyncMock  # type: ignore
+from sanic.server.websockets.impl import (
+    OPEN,
+    ServerProtocol,
+    WebsocketImplProtocol,
+)
 
 
 @pytest.mark.asyncio
 async def test_ws_frame_get_message_incomplete_timeout_0():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete = AsyncMock(spec=Event)
-    assembler.message_complete.is_set = Mock(return_value=False)
     data = await assembler.get(0)
 
     assert data is None
-    assembler.message_complete.is_set.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -43,93 +46,97 @@ async def test_ws_frame_get_message_in_progress():
 
 
 @pytest.mark.asyncio
-async def test_ws_frame_get_message_incomplete():
+async def test_ws_frame_get_message_with_timeout():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.wait = AsyncMock(return_value=True)
-    assembler.message_complete.is_set = Mock(return_value=False)
-    data = await assembler.get()
+    data = await assembler.get(0.01)
 
     assert data is None
-    assembler.message_complete.wait.assert_awaited_once()
+    assert not assembler.get_in_progress
 
 
 @pytest.mark.asyncio
 async def test_ws_frame_get_message():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.wait = AsyncMock(return_value=True)
-    assembler.message_complete.is_set = Mock(return_value=True)
-    data = await assembler.get()
+    assembler.put(Frame(OP_TEXT, b"foo"))
+    assembler.put(Frame(OP_BINARY, b"bar"))
 
-    assert data == b""
-    assembler.message_complete.wait.assert_awaited_once()
+    assert assembler.message_complete.is_set()
+    assert await assembler.get() == "foo"
+    assert await assembler.get(0) == b"bar"
+    assert not assembler.message_complete.is_set()
 
 
 @pytest.mark.asyncio
-async def test_ws_frame_get_message_with_timeout():
+async def test_ws_frame_get_waits_for_message():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.wait = AsyncMock(return_value=True)
-    assembler.message_complete.is_set = Mock(return_value=True)
-    data = await assembler.get(0.1)
+    get = asyncio.create_task(assembler.get())
+    await asyncio.sleep(0)
+    assert assembler.get_in_progress
 
-    assert data == b""
-    assembler.message_complete.wait.assert_awaited_once()
-    assert assembler.message_complete.is_set.call_count == 2
+    assembler.put(Frame(OP_TEXT, b"foo"))
+
+    assert await get == "foo"
+    assert not assembler.get_in_progress
 
 
 @pytest.mark.asyncio
-async def test_ws_frame_get_message_with_timeouterror():
+async def test_ws_frame_get_fragmented():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.wait = AsyncMock(return_value=True)
-    assembler.message_complete.is_set = Mock(return_value=True)
-    assembler.message_complete.wait.side_effect = TimeoutError("...")
-    data = await assembler.get(0.1)
+    assembler.put(Frame(OP_TEXT, "fóo".encode()[:2], fin=False))
+    assert await assembler.get(0) is None
 
-    assert data == b""
-    assembler.message_complete.wait.assert_awaited_once()
-    assert assembler.message_complete.is_set.call_count == 2
+    assembler.put(Frame(OP_CONT, "fóo".encode()[2:]))
 
+    assert await assembler.get(0) == "fóo"
 
-@pytest.mark.asyncio
-async def test_ws_frame_get_not_completed():
+
+def test_ws_frame_get_many():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete = AsyncMock(spec=Event)
-    assembler.message_complete.is_set = Mock(return_value=False)
-    data = await assembler.get()
+    for i in range(5):
+        assembler.put(Frame(OP_BINARY, b"%d" % i))
 
-    assert data is None
+    assert assembler.get_many(3) == [b"0", b"1", b"2"]
+    assert assembler.get_many(3) == [b"3", b"4"]
+    assert assembler.get_many(3) == []
 
 
-@pytest.mark.asyncio
-async def test_ws_frame_get_not_completed_start():
+def test_ws_frame_get_many_in_progress():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete = AsyncMock(spec=Event)
-    assembler.message_complete.is_set = Mock(side_effect=[False, True])
-    data = await assembler.get(0.1)
+    assembler.get_in_progress = True
 
-    assert data is None
+    with pytest.raises(ServerError, match="Called get_many()"):
+        assembler.get_many(1)
 
 
-@pytest.mark.asyncio
-async def test_ws_frame_get_paused():
-    assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete = AsyncMock(spec=Event)
-    assembler.message_complete.is_set = Mock(side_effect=[False, True])
-    assembler.paused = True
-    data = await assembler.get()
+def test_ws_frame_pause_and_resume():
+    protocol = Mock()
+    assembler = WebsocketFrameAssembler(protocol, 4, 1)
+    for _ in range(3):
+        assembler.put(Frame(OP_BINARY, b""))
+    protocol.pause_frames.assert_not_called()
 
-    assert data is None
-    assembler.protocol.resume_frames.assert_called_once()
+    assembler.put(Frame(OP_BINARY, b""))
+    protocol.pause_frames.assert_called_once()
+    assert assembler.paused
 
+    assembler.get_many(2)
+    protocol.resume_frames.assert_not_called()
+    assembler.get_many(1)
+    protocol.resume_frames.assert_called_once()
+    assert not assembler.paused
+
+
+def test_ws_frame_default_thresholds():
+    assembler = WebsocketFrameAssembler(Mock(), 32)
+
+    assert assembler.pause_threshold == 32
+    assert assembler.resume_threshold == 8
 
-@pytest.mark.asyncio
-async def test_ws_frame_get_data():
-    assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete = AsyncMock(spec=Event)
-    assembler.message_complete.is_set = Mock(return_value=True)
-    assembler.chunks = [b"foo", b"bar"]
-    data = await assembler.get()
 
-    assert data == b"foobar"
+@pytest.mark.parametrize("pause,resume", ((4, 4), (4, -1)))
+def test_ws_frame_invalid_thresholds(pause, resume):
+    with pytest.raises(ValueError, match="resume threshold"):
+        WebsocketFrameAssembler(Mock(), pause, resume)
 
 
 @pytest.mark.asyncio
@@ -147,94 +154,72 @@ async def test_ws_frame_get_iter_in_progress():
 
 
 @pytest.mark.asyncio
-async def test_ws_frame_get_iter_none_in_queue():
+async def test_ws_frame_get_iter_complete_message():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.set()
-    assembler.chunks = [b"foo", b"bar"]
+    assembler.put(Frame(OP_BINARY, b"foo", fin=False))
+    assembler.put(Frame(OP_CONT, b"bar"))
 
     chunks = [x async for x in assembler.get_iter()]
 
-    assert chunks == [b"foo", b"bar"]
-
-
-@pytest.mark.asyncio
-async def test_ws_frame_get_iter_paused():
-    assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.set()
-    assembler.paused = True
-
-    [x async for x in assembler.get_iter()]
-    assembler.protocol.resume_frames.assert_called_once()
+    assert chunks == [b"foobar"]
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("opcode", DATA_OPCODES)
-async def test_ws_frame_put_not_fetched(opcode):
+async def test_ws_frame_get_iter_streaming():
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_fetched.set()
+    assembler.put(Frame(OP_BINARY, b"foo", fin=False))
+    chunks = []
 
-    message = re.escape(
-        "Websocket put() got a new message when the previous message was "
-        "not yet fetched."
-    )
-    with pytest.raises(ServerError, match=message):
-        await assembler.put(Frame(opcode, b""))
+    async def stream():
+        async for chunk in assembler.get_iter():
+            chunks.append(chunk)
 
+    task = asyncio.create_task(stream())
+    await asyncio.sleep(0)
+    assert chunks == [b"foo"]
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("opcode", DATA_OPCODES)
-async def test_ws_frame_put_fetched(opcode):
-    assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_fetched = AsyncMock()
-    assembler.message_fetched.is_set = Mock(return_value=False)
+    assembler.put(Frame(OP_CONT, b"bar"))
+    await task
 
-    await assembler.put(Frame(opcode, b""))
-    assembler.message_fetched.wait.assert_awaited_once()
-    assembler.message_fetched.clear.assert_called_once()
+    assert chunks == [b"foo", b"bar"]
+    assert not assembler.messages
+    assert assembler.chunks_queue is None
+    assert not assembler.get_in_progress
 
 
-@pytest.mark.asyncio
 @pytest.mark.parametrize("opcode", DATA_OPCODES)
-async def test_ws_frame_put_message_complete(opcode):
+def test_ws_frame_put_not_fin(opcode):
     assembler = WebsocketFrameAssembler(Mock())
-    assembler.message_complete.set()
-
-    message = re.escape(
-        "Websocket put() got a new message when a message was "
-        "already in its chamber."
-    )
-    with pytest.raises(ServerError, match=message):
-        await assembler.put(Frame(opcode, b""))
 
+    retval = assembler.put(Frame(opcode, b"foo", fin=False))
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("opcode", DATA_OPCODES)
-async def test_ws_frame_put_message_into_queue(opcode):
-    foo = "foo" if (opcode == OP_TEXT) else b"foo"
-    assembler = WebsocketFrameAssembler(Mock())
-    assembler.chunks_queue = AsyncMock(spec=Queue)
-    assembler.message_fetched = AsyncMock()
-    assembler.message_fetched.is_set = Mock(return_value=False)
-    await assembler.put(Frame(opcode, b"foo"))
-
-    assert assembler.chunks_queue.put.call_args_list == [call(foo), call(None)]
+    assert retval is None
+    assert not assembler.messages
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize("opcode", DATA_OPCODES)
-async def test_ws_frame_put_not_fin(opcode):
+@pytest.mark.parametrize("opcode", CTRL_OPCODES)
+def test_ws_frame_put_skip_ctrl(opcode):
     assembler = WebsocketFrameAssembler(Mock())
 
-    retval = await assembler.put(Frame(opcode, b"foo", fin=False))
+    retval = assembler.put(Frame(opcode, b""))
 
     assert retval is None
+    assert not assembler.messages
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize("opcode", CTRL_OPCODES)
-async def test_ws_frame_put_skip_ctrl(opcode):
-    assembler = WebsocketFrameAssembler(Mock())
+async def test_ws_data_received_processes_frames_in_place():
+    ws = WebsocketImplProtocol(ServerProtocol(state=OPEN))
+    ws.io_proto = Mock()
+    ws.loop = asyncio.get_running_loop()
+    frames = b"".join(
+        Frame(OP_TEXT, b"%d" % i).serialize(mask=True) for i in range(100)
+    )
+    tasks = len(asyncio.all_tasks())
 
-    retval = await assembler.put(Frame(opcode, b""))
+    ws.data_received(frames)
 
-    assert retval is None
+    assert len(asyncio.all_tasks()) == tasks
+    assert await ws.recv_burst() == [str(i) for i in range(100)]
+    ws.io_proto.transport.pause_reading.assert_called_once()
+    ws.io_proto.transport.resume_reading.assert_called_once()
@@ -1,4 +1,5 @@
 from logging import ERROR, INFO
+from multiprocessing import Lock
 from signal import SIGINT
 from unittest.mock import Mock, call, patch
 
@@ -9,6 +10,7 @@ from sanic.exceptions import ServerKilled
 from sanic.worker.constants import RestartOrder
 from sanic.worker.manager import WorkerManager
 from sanic.worker.process import Worker
+from sanic.worker.state import SharedWorkerState
 
 
 if not OS_IS_WINDOWS:
@@ -449,3 +451,27 @@ def test_remove_untracked_worker(manager: WorkerManager, caplog):
     assert len(manager.transient) == 1
     assert len(manager.durable) == 0
     assert ("sanic.root", 20, message) in caplog.record_tuples
+
+
+def test_sync_states_resets_dead_writer():
+    process = Mock()
+    process.is_alive.return_value = False
+    process.exitcode = 1
+    context = Mock()
+    context.Process.return_value = process
+    state = SharedWorkerState(Lock(), slots=4, extra_size=1024)
+    manager = WorkerManager(
+        1, fake_serve, {}, context, (Mock(), Mock()), state
+    )
+    name = "Sanic-Server-0-0"
+    assert state[name] == {"server": True}
+    # The worker dies while writing its record
+    state._lock.acquire()
+    offset = state._find(name) * state._record_size
+    state.SEQ.pack_into(state._shm.buf, offset, 1)
+
+    try:
+        manager._sync_states()
+        assert state[name] == {"server": True, "state": "FAILED"}
+    finally:
+        state.close()
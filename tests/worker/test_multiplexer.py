@@ -1,5 +1,6 @@
 import sys
 
+from datetime import datetime, timedelta, timezone
 from multiprocessing import Event
 from os import environ, getpid
 from typing import Any, Union
@@ -82,6 +83,37 @@ def test_ack(worker_state: dict[str, Any], m: WorkerMultiplexer):
     assert worker_state["Test"] == {"foo": "bar", "state": "ACKED"}
 
 
+def test_ack_startup_time(worker_state: dict[str, Any], m: WorkerMultiplexer):
+    start_at = datetime.now(tz=timezone.utc) - timedelta(seconds=2)
+    worker_state["Test"] = {"start_at": start_at}
+    m.ack()
+    assert worker_state["Test"]["state"] == "ACKED"
+    assert 2 <= worker_state["Test"]["startup"] < 10
+
+    worker_state["Test"]["restart_at"] = datetime.now(tz=timezone.utc)
+    m.ack()
+    assert worker_state["Test"]["startup"] < 2
+
+
+def test_report(worker_state: dict[str, Any], m: WorkerMultiplexer):
+    worker_state["Test"] = {"foo": "bar"}
+    m.report({"app": {"router_cache": {"hits": 1}}})
+    assert worker_state["Test"] == {
+        "foo": "bar",
+        "metrics": {"app": {"router_cache": {"hits": 1}}},
+    }
+
+
+def test_report_memory(worker_state: dict[str, Any], m: WorkerMultiplexer):
+    worker_state["Test"] = {"foo": "bar"}
+    m.report({}, {"rss": 100, "shared": 60, "private": 40})
+    assert worker_state["Test"] == {
+        "foo": "bar",
+        "metrics": {},
+        "memory": {"rss": 100, "shared": 60, "private": 40},
+    }
+
+
 def test_restart_self(monitor_publisher: Mock, m: WorkerMultiplexer):
     m.restart()
     monitor_publisher.send.assert_called_once_with("Test:")
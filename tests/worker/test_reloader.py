@@ -11,7 +11,10 @@ from unittest.mock import Mock
 import pytest
 
 from sanic.app import Sanic
+from sanic.exceptions import SanicException
+from sanic.worker import reloader as reloader_module
 from sanic.worker.constants import ProcessState, RestartOrder
+from sanic.worker.inotify import Inotify
 from sanic.worker.loader import AppLoader
 from sanic.worker.process import WorkerProcess
 from sanic.worker.reloader import Reloader
@@ -196,7 +199,7 @@ def test_triggered(app_loader):
 
     reload_dir = Path(__file__).parent.parent / "fake"
     publisher = Mock()
-    reloader = Reloader(publisher, 0.1, {reload_dir}, app_loader)
+    reloader = Reloader(publisher, 0.1, {reload_dir}, app_loader, "poll")
     reloader.check_file = check_file  # type: ignore
     run_reloader(reloader)
 
@@ -227,7 +230,7 @@ def test_reloader_triggers_reload_listeners(app: Sanic, app_loader: AppLoader):
         after.set()
         changed_files.update(changed)
 
-    reloader = Reloader(Mock(), 0.1, set(), app_loader)
+    reloader = Reloader(Mock(), 0.1, set(), app_loader, "poll")
     reloader.check_file = check_file  # type: ignore
     run_reloader(reloader)
 
@@ -246,3 +249,104 @@ def test_check_file(tmp_path):
     assert Reloader.check_file(current, mtimes) is False
     mtimes[current] = mtimes[current] - 1
     assert Reloader.check_file(current, mtimes) is True
+
+
+requires_inotify = pytest.mark.skipif(
+    not Inotify.available(), reason="inotify is only available on Linux"
+)
+
+
+def write_later(*paths: Path, delay: float = 0.2):
+    def write():
+        for path in paths:
+            path.parent.mkdir(exist_ok=True)
+            path.write_text("changed")
+            sleep(0.01)
+
+    timer = threading.Timer(delay, write)
+    timer.start()
+    return timer
+
+
+def test_unknown_watcher():
+    with pytest.raises(SanicException, match="Unknown reload watcher"):
+        Reloader(Mock(), 0.1, set(), Mock(), "fsevents")
+
+
+def test_auto_watcher(monkeypatch):
+    monkeypatch.setattr(reloader_module, "WATCHFILES_AVAILABLE", False)
+    reloader = Reloader(Mock(), 0.1, set(), Mock())
+
+    assert reloader.watcher == ("inotify" if Inotify.available() else "poll")
+
+
+def test_watched_dirs(tmp_path: Path):
+    (tmp_path / "sub").mkdir()
+    reloader = Reloader(Mock(), 0.1, {tmp_path}, Mock(), "poll")
+
+    watched = reloader.watched_dirs()
+
+    assert watched[str(tmp_path)] is None
+    assert watched[str(tmp_path / "sub")] is None
+    directory, name = Path(reloader_module.__file__).parent, "reloader.py"
+    assert name in watched[str(directory)]
+    assert "loader.py" in watched[str(directory)]
+
+
+@requires_inotify
+def test_inotify_triggered(app: Sanic, app_loader: AppLoader, tmp_path: Path):
+    changed_files = []
+
+    @app.after_reload_trigger
+    async def after_reload_trigger(_, changed):
+        changed_files.append(changed)
+
+    (tmp_path / "sub").mkdir()
+    paths = (
+        tmp_path / "one.html",
+        tmp_path / "two.html",
+        tmp_path / "sub" / "three.html",
+    )
+    publisher = Mock()
+    reloader = Reloader(publisher, 0.1, {tmp_path}, app_loader, "inotify")
+    timer = write_later(*paths)
+    run_reloader(reloader)
+    timer.join()
+
+    publisher.send.assert_called_once()
+    assert changed_files == [{str(path) for path in paths}]
+
+
+@requires_inotify
+def test_inotify_new_directory(app_loader: AppLoader, tmp_path: Path):
+    publisher = Mock()
+    path = tmp_path / "new" / "index.html"
+    reloader = Reloader(publisher, 0.1, {tmp_path}, app_loader, "inotify")
+    mkdir = threading.Timer(0.2, path.parent.mkdir)
+    mkdir.start()
+    timer = write_later(path, delay=0.5)
+    run_reloader(reloader)
+    mkdir.join()
+    timer.join()
+
+    publisher.send.assert_called_once_with(f"__ALL_PROCESSES__:{path}")
+
+
+@requires_inotify
+def test_inotify_fallback(
+    monkeypatch, caplog, app_loader: AppLoader, tmp_path: Path
+):
+    def add_watch(self, path, mask):
+        raise OSError(28, "No space left on device", path)
+
+    def poll_changes():
+        yield {"polled"}
+
+    monkeypatch.setattr(Inotify, "add_watch", add_watch)
+    publisher = Mock()
+    reloader = Reloader(publisher, 0.1, {tmp_path}, app_loader, "inotify")
+    reloader.poll_changes = poll_changes  # type: ignore
+    run_reloader(reloader)
+
+    publisher.send.assert_called_once_with("__ALL_PROCESSES__:polled")
+    assert "falling back to polling" in caplog.text
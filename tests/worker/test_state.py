@@ -1,6 +1,9 @@
+from datetime import datetime, timezone
+from multiprocessing import Lock, get_context
+
 import pytest
 
-from sanic.worker.state import WorkerState
+from sanic.worker.state import SharedWorkerState, WorkerState
 
 
 def gen_state(**kwargs):
@@ -89,3 +92,171 @@ def test_state_restricted_operation(key):
 
     with pytest.raises(LookupError, match=message):
         state.update({"okay": True, key: "bad"})
+
+
+@pytest.fixture
+def shared_state():
+    state = SharedWorkerState(Lock(), slots=4, extra_size=1024)
+    yield state
+    state.close()
+
+
+def test_shared_state_set_get(shared_state):
+    now = datetime.now(tz=timezone.utc)
+    record = {
+        "server": True,
+        "state": "ACKED",
+        "pid": 1234,
+        "starts": 2,
+        "start_at": now,
+        "metrics": {"requests": 5},
+        "custom": "value",
+    }
+    shared_state["Sanic-Server-0-0"] = record
+    assert shared_state["Sanic-Server-0-0"] == record
+    assert list(shared_state) == ["Sanic-Server-0-0"]
+    assert len(shared_state) == 1
+
+
+def test_shared_state_replace_and_delete(shared_state):
+    shared_state["one"] = {"pid": 1}
+    shared_state["two"] = {"pid": 2}
+    shared_state["one"] = {**shared_state["one"], "state": "ACKED"}
+    assert shared_state["one"] == {"pid": 1, "state": "ACKED"}
+    del shared_state["one"]
+    assert "one" not in shared_state
+    assert shared_state.pop("one", None) is None
+    assert dict(shared_state) == {"two": {"pid": 2}}
+    with pytest.raises(KeyError):
+        shared_state["one"]
+
+
+def test_shared_state_mismatched_types(shared_state):
+    record = {
+        "state": "UNKNOWN",
+        "pid": "1234",
+        "server": 1,
+        "start_at": datetime(2020, 1, 1),
+    }
+    shared_state["foo"] = record
+    assert shared_state["foo"] == record
+
+
+def test_shared_state_capacity(shared_state):
+    for idx in range(4):
+        shared_state[f"proc-{idx}"] = {}
+    with pytest.raises(RuntimeError, match="more than 4 processes"):
+        shared_state["proc-4"] = {}
+    del shared_state["proc-2"]
+    shared_state["proc-4"] = {}
+    assert len(shared_state) == 4
+
+
+def test_shared_state_too_large(shared_state):
+    with pytest.raises(ValueError, match="too large"):
+        shared_state["foo"] = {"data": "x" * 2048}
+
+
+def _write_state(state):
+    state["foo"] = {**state["foo"], "serving": True}
+    state["bar"] = {}
+    state.close()
+
+
+def test_shared_state_other_process():
+    ctx = get_context("spawn")
+    state = SharedWorkerState(ctx.Lock(), slots=4, extra_size=1024)
+    state["foo"] = {"state": "STARTING"}
+    process = ctx.Process(target=_write_state, args=(state,))
+    process.start()
+    process.join(10)
+    try:
+        assert process.exitcode == 0
+        assert state["foo"] == {"state": "STARTING", "serving": True}
+        assert "bar" in state
+    finally:
+        state.close()
+
+
+def test_shared_state_worker_view(shared_state):
+    shared_state["foo"] = {"state": "ACKED"}
+    state = WorkerState(shared_state, "foo")
+    state["additional"] = 123
+    assert state["additional"] == 123
+    assert state.full() == {"foo": {"state": "ACKED", "additional": 123}}
+
+
+def test_shared_state_removed_while_read(shared_state, monkeypatch):
+    shared_state["one"] = {"pid": 1}
+    shared_state["two"] = {"pid": 2}
+    read = shared_state._read
+    removed = shared_state._find("two")
+
+    def remove_and_read(slot):
+        if slot == removed and "two" in shared_state._index:
+            del shared_state["two"]
+        return read(slot)
+
+    monkeypatch.setattr(shared_state, "_read", remove_and_read)
+
+    assert dict(shared_state.items()) == {"one": {"pid": 1}}
+    assert WorkerState(shared_state, "one").full() == {"one": {"pid": 1}}
+
+
+def _die_while_writing(state, name):
+    """Leave a record as a writer that died while writing it would."""
+    state._lock.acquire()
+    offset = state._find(name) * state._record_size
+    (seq,) = state.SEQ.unpack_from(state._shm.buf, offset)
+    state.SEQ.pack_into(state._shm.buf, offset, seq + 1)
+    state._shm.buf[offset + state.HEADER.size] = 0xFF
+
+
+def test_shared_state_read_gives_up(shared_state):
+    shared_state.READ_RETRIES = 10
+    shared_state["foo"] = {"pid": 1, "custom": "value"}
+    assert shared_state["foo"] == {"pid": 1, "custom": "value"}
+    other = SharedWorkerState.__new__(SharedWorkerState)
+    other.__setstate__(shared_state.__getstate__())
+    other.READ_RETRIES = 10
+    _die_while_writing(shared_state, "foo")
+
+    assert shared_state["foo"] == {"pid": 1, "custom": "value"}
+    with pytest.raises(RuntimeError, match="being written"):
+        other["foo"]
+    shared_state._lock.release()
+    other.close()
+
+
+def test_shared_state_lock_timeout(shared_state):
+    shared_state.LOCK_TIMEOUT = 0.01
+    shared_state["foo"] = {"pid": 1}
+    _die_while_writing(shared_state, "foo")
+
+    with pytest.raises(RuntimeError, match="Timed out"):
+        shared_state["foo"] = {"pid": 2}
+    with pytest.raises(RuntimeError, match="Timed out"):
+        del shared_state["foo"]
+    shared_state._lock.release()
+
+
+def test_shared_state_reset(shared_state):
+    shared_state.READ_RETRIES = 10
+    shared_state["foo"] = {"pid": 1, "custom": "value"}
+    shared_state["bar"] = {"pid": 2}
+    assert shared_state["foo"]
+    shared_state.reset("foo")
+    shared_state.reset("unknown")
+
+    _die_while_writing(shared_state, "foo")
+    shared_state.reset("foo")
+    assert shared_state["foo"] == {"pid": 1, "custom": "value"}
+    shared_state["foo"] = {"pid": 3}
+    assert shared_state["foo"] == {"pid": 3}
+
+    # Without a copy that was read before, the record is removed
+    _die_while_writing(shared_state, "bar")
+    shared_state.reset("bar")
+    assert "bar" not in shared_state
+    shared_state["bar"] = {"pid": 4}
+    assert dict(shared_state) == {"foo": {"pid": 3}, "bar": {"pid": 4}}
@@ -1,3 +1,5 @@
+import asyncio
+import gc
 import logging
 
 from os import environ
@@ -9,7 +11,7 @@ from sanic.app import Sanic
 from sanic.worker.loader import AppLoader
 from sanic.worker.multiplexer import WorkerMultiplexer
 from sanic.worker.process import Worker, WorkerProcess
-from sanic.worker.serve import worker_serve
+from sanic.worker.serve import _memory_usage, _report_metrics, worker_serve
 
 
 @pytest.fixture
@@ -18,6 +20,7 @@ def mock_app():
     server_info = Mock()
     server_info.settings = {"app": app}
     app.state.workers = 1
+    app.config.PRELOAD_APP = False
     app.listeners = {"main_process_ready": []}
     app.get_motd_data.return_value = ({"packages": ""}, {})
     app.state.server_info = [server_info]
@@ -82,6 +85,27 @@ def test_serve_app_implicit(wm: Mock, app):
     wm.call_args[0] == app.state.workers
 
 
+@patch("sanic.mixins.startup.WorkerManager")
+def test_serve_with_preload(wm: Mock, app: Sanic):
+    app.config.PRELOAD_APP = True
+    app.get("/")(lambda _: ...)
+    before_run = {}
+
+    def run():
+        before_run["finalized"] = app.router.finalized
+        before_run["preloaded"] = app.state.preloaded
+        before_run["frozen"] = gc.get_freeze_count() > 0
+
+    wm.return_value.run.side_effect = run
+    app.prepare()
+    Sanic.serve()
+
+    assert before_run == {"finalized": True, "preloaded": True, "frozen": True}
+    assert wm.call_args[0][3].get_start_method() == "fork"
+    assert not app.state.preloaded
+    assert gc.get_freeze_count() == 0
+
+
 @patch("sanic.mixins.startup.WorkerManager")
 def test_serve_app_explicit(wm: Mock, mock_app):
     Sanic.serve(mock_app)
@@ -123,3 +147,32 @@ def test_serve_with_inspector(
     else:
         Inspector.assert_not_called()
         WorkerManager.manage.assert_not_called()
+
+
+def test_memory_usage():
+    usage = _memory_usage()
+    assert usage
+    assert all(isinstance(value, int) for value in usage.values())
+
+
+def test_report_metrics_too_large(app: Sanic, caplog):
+    app.config.INSPECTOR_METRICS_INTERVAL = 0
+    multiplexer = Mock()
+    multiplexer.report.side_effect = [
+        ValueError("too large"),
+        None,
+        ValueError("too large"),
+        None,
+        asyncio.CancelledError,
+    ]
+    app.multiplexer = multiplexer
+
+    loop = asyncio.new_event_loop()
+    with caplog.at_level(logging.WARNING):
+        with pytest.raises(asyncio.CancelledError):
+            loop.run_until_complete(_report_metrics(app, [app]))
+    loop.close()
+
+    assert multiplexer.report.call_count == 5
+    assert multiplexer.report.call_args_list[1].args[0] == {}
+    assert caplog.text.count("Cannot report worker metrics") == 1